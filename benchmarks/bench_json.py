@@ -0,0 +1,101 @@
+"""
+Benchmark JSON decoding of Vybe API payloads.
+
+Decodes every payload with the standard library and, if installed, with orjson, and
+reports the time per decode and the time saved. Payloads are read from a directory of
+recorded responses (set `RECORD_PAYLOADS_DIR` in `globals/preferences.py` and use the
+bot for a while); without one, synthetic payloads shaped like the largest Vybe answers
+are generated.
+
+Usage:
+    python -m benchmarks.bench_json [payload_dir] [--repeat N]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def synthetic_payloads() -> dict:
+    rng = random.Random(42)
+    mint = lambda: "".join(rng.choice("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz") for _ in range(44))
+    balances = {
+        "ownerAddress": mint(),
+        "totalTokenValueUsd": "123456.78",
+        "data": [{
+            "mintAddress": mint(), "symbol": "TKN", "name": f"Token {i}", "category": "Meme",
+            "verified": rng.random() < 0.5, "amount": str(rng.random() * 1e6),
+            "priceUsd": str(rng.random()), "priceUsd1dChange": str(rng.random() - 0.5),
+            "valueUsd": str(rng.random() * 1e4), "valueUsd1dChange": str(rng.random() - 0.5),
+            "logoUrl": f"https://example.com/logo/{i}.png",
+        } for i in range(2000)],
+    }
+    holders = {"data": [{
+        "rank": i + 1, "ownerAddress": mint(), "ownerName": None, "balance": str(rng.random() * 1e9),
+        "valueUsd": str(rng.random() * 1e6), "percentageOfSupplyHeld": rng.random(),
+    } for i in range(1000)]}
+    ohlcv = {"data": [{
+        "time": 1700000000 + 60 * i, "open": str(rng.random()), "high": str(rng.random()),
+        "low": str(rng.random()), "close": str(rng.random()), "volume": str(rng.random() * 1e6),
+        "volumeUsd": str(rng.random() * 1e6), "count": rng.randint(1, 500),
+    } for i in range(20000)]}
+    owners = {"data": [{"owner": mint(), "amount": rng.randint(1, 100)} for _ in range(10000)]}
+    return {name: json.dumps(payload).encode() for name, payload in
+            [("token-balance", balances), ("top-holders", holders), ("ohlcv", ohlcv), ("collection-owners", owners)]}
+
+
+def recorded_payloads(directory: str) -> dict:
+    payloads = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "rb") as file:
+                payloads[name] = file.read()
+    return payloads
+
+
+def best_of(decode, data: bytes, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(data)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("payload_dir", nargs="?", help="directory of recorded *.json payloads")
+    parser.add_argument("--repeat", type=int, default=20, help="decodes per payload, best time is kept")
+    args = parser.parse_args()
+
+    payloads = recorded_payloads(args.payload_dir) if args.payload_dir else synthetic_payloads()
+    if not payloads:
+        sys.exit(f"No *.json payloads found in {args.payload_dir}")
+    if orjson is None:
+        print("orjson is not installed (pip install orjson); timing the stdlib decoder only.\n")
+
+    print(f"{'payload':<40}{'size':>10}{'json ms':>10}{'orjson ms':>11}{'saved':>8}")
+    total_json = total_orjson = 0.0
+    for name, data in payloads.items():
+        stdlib = best_of(json.loads, data, args.repeat)
+        total_json += stdlib
+        line = f"{name[:39]:<40}{len(data) / 1024:>8.0f}KB{stdlib * 1000:>10.2f}"
+        if orjson is not None:
+            fast = best_of(orjson.loads, data, args.repeat)
+            total_orjson += fast
+            line += f"{fast * 1000:>11.2f}{(1 - fast / stdlib) * 100:>7.0f}%"
+        print(line)
+    if orjson is not None:
+        print(f"\nTotal: {total_json * 1000:.2f} ms with json, {total_orjson * 1000:.2f} ms with orjson "
+              f"({(1 - total_orjson / total_json) * 100:.0f}% saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -46,6 +46,14 @@ sort_criteria_buttons = ReplyKeyboardMarkup(
     resize_keyboard=True
 )
 
+ohlcv_next_buttons = ReplyKeyboardMarkup(
+    [
+        [KeyboardButton("⏭ Next 10")],
+        [KeyboardButton("🔙 Back"), KeyboardButton("🏠 Main menu")]
+    ],
+    resize_keyboard=True
+)
+
 sort_order_buttons = ReplyKeyboardMarkup(
     [
         [KeyboardButton("asc"), KeyboardButton("desc")],
@@ -45,7 +45,7 @@ Use these to navigate between menus.
 💡 *Need Help?* Just press ❓ Help anytime.
 Happy analyzing with VybeBot! 🚀📊"""
 
-ENTER_COLLECTION_ADDRESS= "📥 Please enter the *collection address* (alphanumeric only):"
+ENTER_COLLECTION_ADDRESS= "📥 Please enter the *collection address*:"
 ENTER_PROGRAM_ADDRESS="📥 Send the *program address* :"
 ENTER_WALLET_ADDRESS="📥 Send the *wallet address* :"
 ENTER_MINT_ADDRESS="🔑 Send the *mint address* :"
@@ -66,6 +66,7 @@ WALLET_NOT_FOUND="❌ Wallet not found or has no trading data."
 WALLET_NOT_FOUND_FOR_PORTFOLIO="❌ Wallet not found or has no portfolio activity."
 TOKEN_NOT_FOUND="❌ Token not found! Please check the mint address."
 NO_OHLCV_FOUND="⚠️ No OHLCV data found in the selected range."
+NO_MORE_OHLCV="✅ No more OHLCV data in the selected range."
 NO_VOLUME_DATA_FOUND="⚠️ No transfer volume data found for this range."
 NO_TOKEN_BALANCE_FOUND="⚠️ No token balance data found for this wallet."
 NO_TVL_DATA="⚠️ No TVL data found for this program."
@@ -81,6 +82,8 @@ WARN_NO_TOKEN_BALANCES = "⚠️ This wallet has no token balances."
 GENERATE_ERROR=("⚠️ Error while generating or sending chart:"
 "{e}")
 UNRECOGNIZED_INPUT="❌ I didn't understand that. Please use the menu below to navigate."
+STATS_HEADER="📈 *VybeBot Stats*"
+DOCUMENT_CAPTION="📎 Full result attached ({} lines)."
 STATUS_CODE_403="🚫 Forbidden (403): This collection is not accessible."
 STATUS_CODE_404="🔍 Not Found (404): No such collection found."
 NETWORK_ERROR = """❌ Network error occurred: 
@@ -146,6 +149,8 @@ PORTFOLIO_SUMMARY_MESSAGE ="""
 💼 *Token Value:* ${:,.2f}
 🎨 *NFT Value:* ${:,.2f}
 🧾 *Total Portfolio:* 💵 ${:,.2f}"""
+PORTFOLIO_PARTIAL_NOTE = """
+⚠️ _{} value is unavailable right now and is not included in the total._"""
 
 WALLET_TOKEN_SUMMARY =""" 
 🧾 *Wallet Token Summary*
@@ -218,6 +223,7 @@ TRANSACTIONS_HEADER = """
 ──────────────────────────────"""
 
 TIMEOUT_ERROR="⏱️ Timeout: Server took too long to respond."
+SERVICE_UNAVAILABLE="🚧 The Vybe API is busy or recovering right now. Please try again in a minute."
 DAILY_HOLDERS_HEADER = """
 📊 *Daily Holders Count*
 🔑 *Mint:* `{}`
@@ -250,14 +256,14 @@ TOKEN_BALANCE_HISTORY_ENTRY = """
 🧊 Stake (SOL): {:.2f}
 ────────────────────────────"""
 
-INVALID_COLLECTION_ADDRESS= """❌ Invalid collection address! It must be alphanumeric and 42–46 characters long. Please try again:"""
-INVALID_ADDRESS="❌ Invalid address! It must be alphanumeric and 42–46 characters long. Please try again:"
+INVALID_COLLECTION_ADDRESS= """❌ Invalid collection address! It must be a valid base58 Solana address. Please try again:"""
+INVALID_ADDRESS="❌ Invalid address! It must be a valid base58 Solana address. Please try again:"
 INVALID_PROGRAM_ADDRESS="🚫 Program not found or invalid. Please try again."
 INVALID_TIMESPAN_1D_30D="❌ Please enter a number between 1 and 30."
-INVALID_FORMAT="❌ Invalid format! Only alphanumeric characters are allowed."
-INVALID_WALLET_ADDRESS="❌ Invalid wallet address! It must be alphanumeric and 42-46 characters long. Please try again:"
+INVALID_FORMAT="❌ Invalid format! It must be a valid base58 Solana address."
+INVALID_WALLET_ADDRESS="❌ Invalid wallet address! It must be a valid base58 Solana address. Please try again:"
 INVALID_TIMESPAN_1D_7D_30D="❌ Invalid input. Please enter 1, 7, or 30 only."
-INVALID_MINT_ADDRESS="❌ Invalid mint address! Only letters and digits allowed. Please try again:"
+INVALID_MINT_ADDRESS="❌ Invalid mint address! It must be a valid base58 Solana address. Please try again:"
 INVALID_RESOLUTION="❌ Invalid resolution. Try again (e.g. `1d`, `1mo`):"
 INVALID_START_DATE="❌ Invalid start date format. Use YYYY-MM-DD like (2025-01-01):"
 INVALID_END_DATE="❌ Invalid end date. It must be after the start date and in correct format (YYYY-MM-DD):"
@@ -0,0 +1,116 @@
+"""
+Per-endpoint circuit breakers for the Vybe API.
+
+Each URL template in `globals/urls.py` gets its own breaker. When too many recent calls
+to an endpoint fail or run slowly, its breaker opens and further calls fail immediately
+instead of piling up behind a degraded upstream. After a cool-down one probe request is
+let through; its outcome decides whether the breaker closes again or stays open.
+"""
+import time
+from collections import deque
+from typing import Deque
+import httpx
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+    def __init__(self, endpoint: str):
+        super().__init__(f"{endpoint} is temporarily unavailable")
+        self.endpoint = endpoint
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker over a rolling window of call outcomes.
+
+    A call counts as bad if it raised, returned a 5xx status, or took longer than
+    `slow_call_seconds`. Once the window holds at least `min_calls` outcomes and the
+    share of bad ones reaches `failure_ratio`, the breaker opens for `reset_timeout`
+    seconds. It then half-opens and admits a single probe: a good probe closes the
+    breaker, a bad one opens it again. A probe that never reports back is replaced
+    after another `reset_timeout`.
+
+    `allow()` hands out a trial token naming the breaker state it admitted the call in,
+    and `record()` ignores outcomes whose token is no longer current, so a retry, a
+    losing hedge or a request that finishes late can never decide a state it was not
+    admitted under.
+    """
+
+    def __init__(self, name: str, window: int, min_calls: int, failure_ratio: float,
+                 slow_call_seconds: float, reset_timeout: float):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_started_at = None
+        self._generation = 1
+        self.trips = 0
+        self.rejected = 0
+
+    def allow(self) -> int:
+        """
+        Return a trial token if a call may go upstream now, admitting a probe when
+        half-open, or 0 if it may not.
+        """
+        now = time.monotonic()
+        if self.state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self._probe_started_at = None
+        if self.state == HALF_OPEN:
+            if self._probe_started_at is None or now - self._probe_started_at >= self.reset_timeout:
+                self._probe_started_at = now
+                self._generation += 1
+                return self._generation
+        if self.state == CLOSED:
+            return self._generation
+        self.rejected += 1
+        return 0
+
+    def record(self, trial: int, ok: bool, seconds: float = 0.0) -> None:
+        """
+        Record the outcome of a call admitted by `allow()`.
+
+        Args:
+            trial (int): The token `allow()` returned for the call.
+            ok (bool): False if the call raised or the endpoint returned a server error.
+            seconds (float, optional): How long the call took.
+        """
+        if trial != self._generation:
+            return
+        bad = not ok or seconds > self.slow_call_seconds
+        if self.state == HALF_OPEN:
+            if bad:
+                self._open()
+            else:
+                self.state = CLOSED
+                self._generation += 1
+                self._outcomes.clear()
+            return
+        self._outcomes.append(bad)
+        if self.state == CLOSED and len(self._outcomes) >= self.min_calls \
+                and sum(self._outcomes) >= self.failure_ratio * len(self._outcomes):
+            self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._probe_started_at = None
+        self._generation += 1
+        self._outcomes.clear()
+        self.trips += 1
+
+    def stats(self) -> dict:
+        return {
+            f"breaker.{self.name}.state": self.state,
+            f"breaker.{self.name}.trips": self.trips,
+            f"breaker.{self.name}.rejected": self.rejected,
+        }
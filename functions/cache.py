@@ -0,0 +1,192 @@
+"""
+Response reuse for the Vybe API client.
+
+Holds the building blocks the client puts in front of the network so identical
+requests are answered once instead of once per user.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import functions.deadline as deadline
+
+
+def normalize_url(url: str) -> str:
+    """
+    Build a stable cache key for a request URL.
+
+    Lowercases the scheme and host, drops a trailing slash and sorts query parameters,
+    so URLs that differ only in formatting map to the same key. The path is left as is
+    because Solana addresses are case-sensitive.
+
+    Args:
+        url (str): Absolute request URL.
+
+    Returns:
+        str: The normalized URL.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    expires_at: float
+    stale_until: float
+    size: int
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single upstream call.
+
+    The first caller for a key starts the call as a task; every caller that arrives
+    while it is still running awaits the same task and receives the same result or
+    exception. The task is shielded, so a caller being cancelled does not cancel the
+    shared request for the others, but once every caller has gone the task is cancelled.
+
+    The task runs under a `deadline.SharedDeadline`: the latest budget among the callers
+    still waiting, so it is neither cut short by the caller that happened to start it
+    nor kept running for callers that already gave up.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, Tuple[asyncio.Task, deadline.SharedDeadline]] = {}
+        self.shared = 0
+        self.abandoned = 0
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `factory()` once per key among concurrent callers.
+
+        Args:
+            key (str): Identity of the call, e.g. the request URL.
+            factory (Callable): Zero-argument function returning the awaitable to run.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            budget = deadline.SharedDeadline()
+            waiter = budget.join(deadline.current())
+            with deadline.shared(budget):
+                task = asyncio.ensure_future(factory())
+            self._calls[key] = (task, budget)
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            task, budget = call
+            waiter = budget.join(deadline.current())
+            self.shared += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            budget.leave(waiter)
+            if not budget and not task.done():
+                self.abandoned += 1
+                task.cancel()
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        call = self._calls.get(key)
+        if call is not None and call[0] is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "coalesce.in_flight": len(self._calls),
+            "coalesce.shared": self.shared,
+            "coalesce.abandoned": self.abandoned,
+        }
+
+
+class ResponseCache:
+    """
+    In-memory TTL cache with least-recently-used eviction.
+
+    Entries expire after their own TTL but may be kept for an extra stale window, during
+    which `get_stale()` still returns them. The cache is bounded both by entry count
+    and by the total size reported for the stored values. Hits, misses and evictions
+    are counted for monitoring.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, name: str = "cache"):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for `key`, or None if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        now = time.time()
+        if entry.expires_at <= now:
+            if entry.stale_until <= now:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """
+        Return the value for `key` if it is expired but still inside its stale window.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.stale_until <= time.time():
+            return None
+        self._entries.move_to_end(key)
+        self.stale_hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: float, size: int = 0, stale_ttl: float = 0) -> None:
+        """
+        Store `value` under `key` for `ttl` seconds, evicting old entries if needed.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to store.
+            ttl (float): Seconds the value is fresh.
+            size (int, optional): Size in bytes counted against `max_bytes`. Defaults to 0.
+            stale_ttl (float, optional): Extra seconds the value may be served stale. Defaults to 0.
+        """
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+        expires_at = time.time() + ttl
+        self._entries[key] = CacheEntry(value, expires_at, expires_at + stale_ttl, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> dict:
+        return {
+            f"{self.name}.entries": len(self._entries),
+            f"{self.name}.bytes": self._bytes,
+            f"{self.name}.hits": self.hits,
+            f"{self.name}.stale_hits": self.stale_hits,
+            f"{self.name}.misses": self.misses,
+            f"{self.name}.evictions": self.evictions,
+        }
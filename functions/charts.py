@@ -1,75 +1,82 @@
 from typing import Optional
-import os
-import requests
+import json
+import io
+import httpx
 from telegram import Update, InputFile
 from telegram.ext import ContextTypes
-import globals.urls as urls
-import globals.preferences as preferences
+import functions.breaker as breaker
+import functions.client as client
+import functions.dispatch as dispatch
+import functions.jsonlib as jsonlib
 import functions.functions as functions
+import functions.ratelimit as ratelimit
+import functions.sender as sender
 import functions.evaluates as evaluates
 import constants.messages as messages
 from functions.datetime import *
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import re
 
 def draw_chart(x, y, title, xlabel, ylabel, filename,
                chart_type="line", color="steelblue", rotation=45,
-               marker=None, fill=False):
-    plt.figure(figsize=(10, 5))
+               marker=None, fill=False) -> InputFile:
+    # Uses a standalone Figure instead of pyplot's global state so charts can be
+    # rendered concurrently on the dispatcher's worker threads. The PNG is rendered in
+    # memory; `filename` only names the upload, so concurrent renders never collide.
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
     if chart_type == "bar":
-        plt.bar(x, y, color=color)
+        ax.bar(x, y, color=color)
     else:
-        plt.plot(x, y, color=color, marker=marker)
+        ax.plot(x, y, color=color, marker=marker)
         if fill:
-            plt.fill_between(x, y, color=color, alpha=0.3)
+            ax.fill_between(x, y, color=color, alpha=0.3)
 
-    plt.title(title)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.xticks(rotation=rotation)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis="x", labelrotation=rotation)
 
     if chart_type == "bar":
-        plt.grid(visible=True, axis='y')
+        ax.grid(visible=True, axis='y')
     else:
-        plt.grid(visible=True)
+        ax.grid(visible=True)
 
-    plt.tight_layout()
-    plt.savefig(filename)
-    plt.close()
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return InputFile(buffer.getvalue(), filename=filename)
 
 async def generate_chart_and_send(update: Update, context: ContextTypes.DEFAULT_TYPE,
                                   x: list, y: list, title: str, xlabel: str, ylabel: str,
                                   filename: str, chart_type: str = "line", color: str = "steelblue",
                                   rotation: int = 45, marker: Optional[str] = None, fill: bool = False,
                                   caption: Optional[str] = None):
-    draw_chart(x, y, title, xlabel, ylabel, filename, chart_type, color, rotation, marker, fill)
-    with open(filename, "rb") as photo:
-        await update.message.reply_photo(photo=InputFile(photo), caption=caption or title, parse_mode="Markdown")
-    os.remove(filename)
+    photo = await dispatch.dispatcher.run(update.effective_user.id, draw_chart,
+                                          x, y, title, xlabel, ylabel, filename, chart_type, color, rotation, marker, fill)
+    await sender.reply_photo(update.message, photo=photo, caption=caption or title, parse_mode="Markdown")
 
 async def send_program_dau_chart(update: Update, context: ContextTypes.DEFAULT_TYPE, program_address: str, time_range: str):
     if not evaluates.is_valid_address(program_address):
-        await update.message.reply_text(messages.INVALID_PROGRAM_ADDRESS)
+        await sender.reply_text(update.message, messages.INVALID_PROGRAM_ADDRESS)
         return
 
     if not evaluates.is_valid_range(time_range):
-        await update.message.reply_text(messages.INVALID_TIME_RANGE)
+        await sender.reply_text(update.message, messages.INVALID_TIME_RANGE)
         return
 
-    program_name = functions.retrieve_program_name(program_address)
+    program_name = await functions.retrieve_program_name(program_address)
     if not program_name:
-        await update.message.reply_text(messages.PROGRAM_NOT_FOUND)
+        await sender.reply_text(update.message, messages.PROGRAM_NOT_FOUND)
         return
 
-    url = urls.PROGRAM_ACTIVE_USERS_URL.format(program_address, time_range)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=350)
+        response = await client.vybe.program_active_users(program_address, time_range)
         response.raise_for_status()
-        data = response.json().get("data", [])
+        data = jsonlib.loads(response.content).get("data", [])
 
         if not data:
-            await update.message.reply_text("⚠️ No data available.")
+            await sender.reply_text(update.message, "⚠️ No data available.")
             return
 
         time_labels = [
@@ -84,7 +91,9 @@ async def send_program_dau_chart(update: Update, context: ContextTypes.DEFAULT_T
         lines.append("──────────────────────────────")
         lines.append(f"✅ *Total Active Users:* {total_active_users:,}")
 
-        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+        await sender.reply_table(update.message, "\n".join(lines), "\n".join([lines[0], lines[-1]]),
+                                 ("time", "active_users"), zip(time_labels, user_counts),
+                                 f"{program_name.replace(' ', '_')}_DAU_{time_range}.csv", parse_mode="Markdown")
 
         match = re.match(r"(\d+)([hd])", time_range)
         if match:
@@ -107,36 +116,36 @@ async def send_program_dau_chart(update: Update, context: ContextTypes.DEFAULT_T
             caption=f"📊 Active Users Chart | {program_name}"
         )
 
-    except requests.exceptions.ReadTimeout:
-        await update.message.reply_text(messages.TIMEOUT_ERROR)
-    except requests.exceptions.RequestException as e:
-        await update.message.reply_text(messages.NETWORK_ERROR.format(e))
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        await sender.reply_text(update.message, messages.SERVICE_UNAVAILABLE)
+    except httpx.TimeoutException:
+        await sender.reply_text(update.message, messages.TIMEOUT_ERROR)
+    except httpx.HTTPError as e:
+        await sender.reply_text(update.message, messages.NETWORK_ERROR.format(e))
     except Exception as e:
-        await update.message.reply_text(messages.UNEXPECTED_ERROR.format(e))
+        await sender.reply_text(update.message, messages.UNEXPECTED_ERROR.format(e))
 
 async def send_program_tx_chart(update: Update, context: ContextTypes.DEFAULT_TYPE, program_address: str, range_value: str):
     if not evaluates.is_valid_address(program_address):
-        await update.message.reply_text(messages.INVALID_FORMAT)
+        await sender.reply_text(update.message, messages.INVALID_FORMAT)
         return
 
     if not evaluates.is_valid_range(range_value):
-        await update.message.reply_text(messages.INVALID_TIME_RANGE)
+        await sender.reply_text(update.message, messages.INVALID_TIME_RANGE)
         return
 
-    program_name = functions.retrieve_program_name(program_address)
+    program_name = await functions.retrieve_program_name(program_address)
     if not program_name:
-        await update.message.reply_text(messages.PROGRAM_NOT_FOUND)
+        await sender.reply_text(update.message, messages.PROGRAM_NOT_FOUND)
         return
 
-    url = urls.PROGRAM_TXS_URL.format(program_address, range_value)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=350)
+        response = await client.vybe.program_transactions(program_address, range_value)
         response.raise_for_status()
-        data = response.json().get("data", [])
+        data = jsonlib.loads(response.content).get("data", [])
 
         if not data:
-            await update.message.reply_text("⚠️ No transaction data found for this range.")
+            await sender.reply_text(update.message, "⚠️ No transaction data found for this range.")
             return
 
         timestamps, tx_counts = [], []
@@ -152,7 +161,9 @@ async def send_program_tx_chart(update: Update, context: ContextTypes.DEFAULT_TY
 
         summary.append("──────────────────────────────")
         summary.append(f"✅ *Total Transactions:* {sum(tx_counts):,}")
-        await update.message.reply_text("\n".join(summary), parse_mode="Markdown")
+        await sender.reply_table(update.message, "\n".join(summary), "\n".join([summary[0], summary[-1]]),
+                                 ("time", "transactions"), zip(timestamps, tx_counts),
+                                 f"{program_name.replace(' ', '_')}_TX_{range_value}.csv", parse_mode="Markdown")
 
         match = re.match(r"(\d+)([hd])", range_value)
         if match:
@@ -175,30 +186,45 @@ async def send_program_tx_chart(update: Update, context: ContextTypes.DEFAULT_TY
             caption=f"📈 Transaction Chart | {program_name} ({range_value})"
         )
 
-    except requests.exceptions.ReadTimeout:
-        await update.message.reply_text(messages.TIMEOUT_ERROR)
-    except requests.exceptions.RequestException as e:
-        await update.message.reply_text(messages.NETWORK_ERROR.format(e))
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        await sender.reply_text(update.message, messages.SERVICE_UNAVAILABLE)
+    except httpx.TimeoutException:
+        await sender.reply_text(update.message, messages.TIMEOUT_ERROR)
+    except httpx.HTTPError as e:
+        await sender.reply_text(update.message, messages.NETWORK_ERROR.format(e))
     except Exception as e:
-        await update.message.reply_text(messages.UNEXPECTED_ERROR.format(e))
+        await sender.reply_text(update.message, messages.UNEXPECTED_ERROR.format(e))
 
 async def send_tvl_chart(update: Update, context: ContextTypes.DEFAULT_TYPE, program_address: str, resolution: str):
     if not evaluates.is_valid_address(program_address):
-        await update.message.reply_text(messages.INVALID_PROGRAM_ADDRESS)
+        await sender.reply_text(update.message, messages.INVALID_PROGRAM_ADDRESS)
         return
 
     if not evaluates.is_valid_resolution(resolution):
-        await update.message.reply_text(messages.INVALID_RESOLUTION)
+        await sender.reply_text(update.message, messages.INVALID_RESOLUTION)
         return
 
-    program_name = functions.retrieve_program_info(program_address)
+    program_name = await functions.retrieve_program_name(program_address)
     if not program_name:
-        await update.message.reply_text(messages.PROGRAM_NOT_FOUND)
+        await sender.reply_text(update.message, messages.PROGRAM_NOT_FOUND)
         return
 
-    data = functions.fetch_tvl_data(program_address, resolution)
+    try:
+        data = await functions.fetch_tvl_data(program_address, resolution)
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        await sender.reply_text(update.message, messages.SERVICE_UNAVAILABLE)
+        return
+    except httpx.TimeoutException:
+        await sender.reply_text(update.message, messages.TIMEOUT_ERROR)
+        return
+    except httpx.HTTPError as e:
+        await sender.reply_text(update.message, messages.NETWORK_ERROR.format(e))
+        return
+    except json.JSONDecodeError:
+        await sender.reply_text(update.message, messages.JSON_ERROR)
+        return
     if not data:
-        await update.message.reply_text(messages.NO_TVL_DATA)
+        await sender.reply_text(update.message, messages.NO_TVL_DATA)
         return
 
     time_labels, tvl_values, summary_lines = [], [], []
@@ -213,7 +239,9 @@ async def send_tvl_chart(update: Update, context: ContextTypes.DEFAULT_TYPE, pro
         tvl_values.append(tvl)
         summary_lines.append(f"🕒 {readable} → 💰 ${tvl:,.2f}")
 
-    await update.message.reply_text("\n".join(summary_lines), parse_mode="Markdown")
+    await sender.reply_table(update.message, "\n".join(summary_lines), "\n".join(summary_lines[:2] + summary_lines[-1:]),
+                             ("time", "tvl_usd"), zip(time_labels, tvl_values),
+                             f"{program_name.replace(' ', '_')}_TVL_{resolution}.csv", parse_mode="Markdown")
 
     filename = f"{program_name.replace(' ', '_')}_TVL_{resolution}.png"
     await generate_chart_and_send(update, context,
@@ -231,18 +259,16 @@ async def send_tvl_chart(update: Update, context: ContextTypes.DEFAULT_TYPE, pro
 
 async def send_token_balance_chart(update: Update, context: ContextTypes.DEFAULT_TYPE, wallet_address: str, days: int):
     if not evaluates.is_valid_address(wallet_address):
-        await update.message.reply_text(messages.INVALID_WALLET_FORMAT)
+        await sender.reply_text(update.message, messages.INVALID_WALLET_FORMAT)
         return
 
-    url = urls.TOKEN_BALANCE_CHART_URL.format(wallet_address, days)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=350)
+        response = await client.vybe.token_balance_history(wallet_address, days)
         response.raise_for_status()
-        data = response.json().get("data", [])
+        data = jsonlib.loads(response.content).get("data", [])
 
         if not data:
-            await update.message.reply_text(messages.NO_TOKEN_BALANCE_FOUND)
+            await sender.reply_text(update.message, messages.NO_TOKEN_BALANCE_FOUND)
             return
 
         dates, values, lines = [], [], [messages.TOKEN_BALANCE_HEADER_TEMPLATE.format(days, wallet_address)]
@@ -257,7 +283,7 @@ async def send_token_balance_chart(update: Update, context: ContextTypes.DEFAULT
             dates.append(readable)
             values.append(token_val)
 
-        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+        await sender.reply_text(update.message, "\n".join(lines), parse_mode="Markdown")
 
         filename = f"{wallet_address[:6]}_token_chart.png"
         await generate_chart_and_send(update, context,
@@ -272,14 +298,20 @@ async def send_token_balance_chart(update: Update, context: ContextTypes.DEFAULT
             caption="📈 Token Balance Chart"
         )
 
-    except requests.exceptions.RequestException as e:
-        await update.message.reply_text(messages.NETWORK_ERROR.format(e))
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        await sender.reply_text(update.message, messages.SERVICE_UNAVAILABLE)
+    except httpx.TimeoutException:
+        await sender.reply_text(update.message, messages.TIMEOUT_ERROR)
+    except httpx.HTTPError as e:
+        await sender.reply_text(update.message, messages.NETWORK_ERROR.format(e))
     except Exception as e:
-        await update.message.reply_text(messages.UNEXPECTED_ERROR.format(e))
-def retrieve_daily_top_holders_chart(mint_address: str, start_date: str, end_date: str) -> tuple[str, Optional[str]]:
+        await sender.reply_text(update.message, messages.UNEXPECTED_ERROR.format(e))
+async def retrieve_daily_top_holders_chart(mint_address: str, start_date: str, end_date: str,
+                                           user_id: Optional[int] = None) -> tuple[str, Optional[InputFile]]:
     """
     Fetch and format the daily holder count for a token over a date range.
-    Returns text summary and filename of generated chart (if applicable).
+    Returns text summary and the generated chart (if applicable).
+    The chart is rendered on the dispatcher's worker pool on behalf of `user_id`.
     """
     if not evaluates.is_valid_mint(mint_address):
         return messages.INVALID_MINT_ADDRESS, None
@@ -290,12 +322,10 @@ def retrieve_daily_top_holders_chart(mint_address: str, start_date: str, end_dat
     if start_unix is None or end_unix is None or end_unix <= start_unix:
         return messages.INVALID_DATE_RANGE, None
 
-    url = urls.DAILY_TOP_TOKEN_HOLDERS_URL.format(mint_address, start_unix, end_unix)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=350)
+        response = await client.vybe.daily_top_token_holders(mint_address, start_unix, end_unix)
         response.raise_for_status()
-        data = response.json().get("data", [])
+        data = jsonlib.loads(response.content).get("data", [])
 
         if not data:
             return messages.NO_DATA_FOUND, None
@@ -320,7 +350,8 @@ def retrieve_daily_top_holders_chart(mint_address: str, start_date: str, end_dat
             return "\n".join(lines), None
 
         filename = f"{mint_address}_holders_{start_date}_to_{end_date}.png"
-        draw_chart(
+        chart = await dispatch.dispatcher.run(
+            user_id, draw_chart,
             x=labels,
             y=counts,
             title=f"Holders Count | {mint_address} ({start_date} → {end_date})",
@@ -331,16 +362,22 @@ def retrieve_daily_top_holders_chart(mint_address: str, start_date: str, end_dat
             color="lightgreen"
         )
 
-        return "\n".join(lines), filename
+        return "\n".join(lines), chart
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE, None
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR, None
+    except httpx.HTTPError as e:
         return messages.NETWORK_ERROR.format(e), None
     except Exception as e:
         return messages.UNEXPECTED_ERROR.format(e), None
-def retrieve_transfer_volume_chart(mint_address: str, start_date: str, end_date: str, interval: str) -> tuple[str, Optional[str]]:
+async def retrieve_transfer_volume_chart(mint_address: str, start_date: str, end_date: str, interval: str,
+                                         user_id: Optional[int] = None) -> tuple[str, Optional[InputFile]]:
     """
     Fetch transfer volume for a token over a range and optionally generate a volume chart.
-    Returns text summary + filename of chart (if applicable).
+    Returns text summary + chart (if applicable).
+    The chart is rendered on the dispatcher's worker pool on behalf of `user_id`.
     """
     if not evaluates.is_valid_mint(mint_address):
         return messages.INVALID_MINT_ADDRESS, None
@@ -354,12 +391,10 @@ def retrieve_transfer_volume_chart(mint_address: str, start_date: str, end_date:
     if interval.lower() not in ['hour', 'day']:
         return messages.INVALID_INTERVAL, None
 
-    url = urls.TOKEN_VOLUME_URL.format(mint_address, start_ts, end_ts, interval)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=350)
+        response = await client.vybe.token_volume(mint_address, start_ts, end_ts, interval)
         response.raise_for_status()
-        data = response.json().get("data", [])
+        data = jsonlib.loads(response.content).get("data", [])
 
         if not data:
             return messages.NO_VOLUME_DATA_FOUND, None
@@ -375,7 +410,8 @@ def retrieve_transfer_volume_chart(mint_address: str, start_date: str, end_date:
         lines.append("────────────────────────────")
 
         filename = f"{mint_address}_volume_{start_date}_to_{end_date}_{interval}.png"
-        draw_chart(
+        chart = await dispatch.dispatcher.run(
+            user_id, draw_chart,
             x=dates,
             y=volumes,
             title=f"Transfer Volume | {mint_address} ({start_date} → {end_date})",
@@ -387,9 +423,13 @@ def retrieve_transfer_volume_chart(mint_address: str, start_date: str, end_date:
             fill=True
         )
 
-        return "\n".join(lines), filename
+        return "\n".join(lines), chart
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE, None
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR, None
+    except httpx.HTTPError as e:
         return messages.NETWORK_ERROR.format(e), None
     except Exception as e:
         return messages.UNEXPECTED_ERROR.format(e), None
@@ -0,0 +1,198 @@
+"""
+Splitting long replies into Telegram-sized messages.
+
+Text is cut at line breaks and packed greedily into chunks of at most
+`preferences.MESSAGE_CHUNK_LENGTH` characters in a single pass. A line that is longer
+than a chunk on its own is cut at its last space that fits. For Markdown text the
+parser tracks which entity (`*bold*`, `_italic_`, `` `code` `` or a link) is open at
+each cut: bold, italic and code spans are closed at the end of one chunk and reopened
+at the start of the next, and a line is never cut inside a link (a link longer than a
+whole chunk is sent as plain text), so every chunk parses on its own.
+"""
+import re
+from typing import List, Optional, Tuple
+import globals.preferences as preferences
+
+# Single-character Markdown entities that can be closed and reopened around a cut.
+_MARKERS = "*_`"
+# States inside a `[text](url)` link, which can only be kept whole.
+_LINK_STATES = ("[", "]", "(")
+
+
+def _walk(text: str, state: Optional[str]) -> Tuple[Optional[str], int]:
+    """
+    Return the Markdown entity still open after `text`, given the one open before it,
+    and the index of the "[" that opened it if it is a link started inside `text` (else -1).
+
+    The state is one of `_MARKERS`, "[" (inside link text), "]" (right after the link
+    text) or "(" (inside the link URL), and None outside any entity.
+    """
+    escaped = False
+    link_start = -1
+    for index, ch in enumerate(text):
+        if escaped:
+            escaped = False
+            continue
+        if state == "]":
+            if ch == "(":
+                state = "("
+                continue
+            state = None
+        if state is None:
+            if ch == "\\":
+                escaped = True
+            elif ch in _MARKERS or ch == "[":
+                state = ch
+                link_start = index if ch == "[" else -1
+        elif state == "[":
+            if ch == "]":
+                state = "]"
+        elif state == "(":
+            if ch == ")":
+                state = None
+        elif ch == state:
+            state = None
+    return state, (link_start if state in _LINK_STATES else -1)
+
+
+def _scan(text: str, state: Optional[str]) -> Optional[str]:
+    """
+    Return the Markdown entity still open after `text`, given the one open before it.
+    """
+    return _walk(text, state)[0]
+
+
+def _flatten_link(line: str) -> str:
+    """
+    Replace the link `line` starts with by its escaped plain text, "text (url)".
+    """
+    state = None
+    end = len(line)
+    for index, ch in enumerate(line):
+        if state == "]" and ch != "(":
+            end = index
+            break
+        state = _scan(ch, state)
+        if state is None:
+            end = index + 1
+            break
+    return re.sub(r"([_*`\[])", r"\\\1", plain(line[:end])) + line[end:]
+
+
+def _marker(state: Optional[str]) -> str:
+    """
+    Return the text that closes, and equally reopens, the entity `state` around a cut.
+    """
+    return state if state is not None and state in _MARKERS else ""
+
+
+def _wrap(line: str, limit: int, markdown: bool) -> List[str]:
+    """
+    Cut a line that is too long for one chunk into pieces of at most `limit` characters.
+
+    Every piece but the last is closed with the marker of the entity open at its end,
+    and the following piece starts by reopening it.
+    """
+    pieces = []
+    while len(line) > limit - 1:
+        cut = line.rfind(" ", 0, limit - 1) + 1
+        if cut <= limit // 2:
+            cut = limit - 1
+            if line[cut - 1] == "\\":
+                cut -= 1
+        piece = line[:cut]
+        state, link_start = _walk(piece, None) if markdown else (None, -1)
+        if link_start > 0:
+            # Never cut through a link: end the piece just before it instead.
+            cut = link_start
+            piece = line[:cut]
+            state = _scan(piece, None)
+        elif link_start == 0:
+            # A link longer than a whole chunk cannot be kept; send it as plain text.
+            line = _flatten_link(line)
+            continue
+        marker = _marker(state)
+        pieces.append(piece + marker)
+        line = marker + line[cut:]
+    pieces.append(line)
+    return pieces
+
+
+def split(text: str, limit: Optional[int] = None, markdown: bool = True) -> List[str]:
+    """
+    Split `text` into chunks that each fit in one Telegram message.
+
+    Runs in time linear in the length of `text`.
+
+    Args:
+        text (str): The text to split.
+        limit (int, optional): Maximum chunk length. Defaults to `preferences.MESSAGE_CHUNK_LENGTH`.
+        markdown (bool, optional): Whether `text` uses Telegram Markdown, so entities are
+            kept intact across cuts. Defaults to True.
+
+    Returns:
+        List[str]: The chunks in order; a single chunk when `text` already fits.
+    """
+    limit = limit or preferences.MESSAGE_CHUNK_LENGTH
+    if len(text) <= limit:
+        return [text]
+
+    chunks: List[str] = []
+    lines: List[str] = []
+    size = 0
+    state = None
+    for line in text.split("\n"):
+        start = state
+        state = _scan(line, start) if markdown else None
+        if lines and size + 1 + len(line) + len(_marker(state)) > limit:
+            chunks.append("\n".join(lines) + _marker(start))
+            lines, size = [], 0
+        if not lines:
+            line = _marker(start) + line
+            if len(line) + len(_marker(state)) > limit:
+                pieces = _wrap(line, limit, markdown)
+                chunks.extend(pieces[:-1])
+                line = pieces[-1]
+        size += len(line) + (1 if lines else 0)
+        lines.append(line)
+    chunks.append("\n".join(lines))
+    return chunks
+
+
+def plain(text: str) -> str:
+    """
+    Remove Telegram Markdown markup from `text`, e.g. for a text document.
+
+    Entity markers and escapes are dropped and links become "text (url)".
+    """
+    out: List[str] = []
+    state = None
+    escaped = False
+    for ch in text:
+        if escaped:
+            escaped = False
+            out.append(ch)
+            continue
+        if state == "]":
+            if ch == "(":
+                state = "("
+                out.append(" (")
+                continue
+            state = None
+        if state is None:
+            if ch == "\\":
+                escaped = True
+            elif ch in _MARKERS or ch == "[":
+                state = ch
+            else:
+                out.append(ch)
+        elif state == "[" and ch == "]":
+            state = "]"
+        elif state == "(" and ch == ")":
+            state = None
+            out.append(")")
+        elif ch == state:
+            state = None
+        else:
+            out.append(ch)
+    return "".join(out)
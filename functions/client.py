@@ -0,0 +1,480 @@
+"""
+Asynchronous client for the Vybe Network API.
+
+Every Vybe endpoint in `globals/urls.py` has an awaitable method here, so the
+bot's coroutines never block the event loop while a request is in flight.
+A single process-wide instance (`vybe`) is shared by all handlers and charts.
+"""
+from typing import Dict, Optional, Tuple
+import asyncio
+import hashlib
+import importlib.util
+import os
+import random
+import time
+import httpx
+import functions.breaker as breaker
+import functions.cache as cache
+import functions.deadline as deadline
+import functions.keys as keys
+import functions.ratelimit as ratelimit
+import functions.stream as stream
+import functions.store as store
+import globals.preferences as preferences
+import globals.urls as urls
+
+ENDPOINT_NAMES = {template: name for name, template in vars(urls).items() if name.isupper()}
+# Headers describing the wire body, dropped when a streamed body is replaced by its reduction.
+_BODY_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+
+def _record_payload(template: str, key: str, content: bytes) -> None:
+    """
+    Save a response body under `preferences.RECORD_PAYLOADS_DIR`, e.g. for benchmarks.
+    """
+    name = f"{ENDPOINT_NAMES.get(template, 'UNKNOWN')}-{hashlib.sha1(key.encode()).hexdigest()[:12]}.json"
+    os.makedirs(preferences.RECORD_PAYLOADS_DIR, exist_ok=True)
+    with open(os.path.join(preferences.RECORD_PAYLOADS_DIR, name), "wb") as file:
+        file.write(content)
+
+
+class VybeClient:
+    """
+    Thin asyncio wrapper around `httpx.AsyncClient` for the Vybe Network API.
+
+    All requests share one keep-alive connection pool sized by the `POOL_*` settings
+    in `globals/preferences.py`, so TCP and TLS handshakes are paid once per connection
+    rather than once per request. The underlying HTTP client is created lazily on first
+    use so that it is bound to the running event loop, and must be closed with `close()`
+    on shutdown.
+
+    Successful responses are cached in memory for the per-endpoint TTLs in
+    `preferences.CACHE_TTLS`, and concurrent requests for the same URL are
+    coalesced into one upstream call. Endpoints listed in
+    `preferences.STALE_WHILE_REVALIDATE` answer from an expired entry immediately
+    and refresh it in the background. When `preferences.CACHE_DB_PATH` is set, cached
+    responses are also written to disk and reloaded by `open_store()` on startup.
+    Not-found answers are remembered per endpoint and address for
+    `preferences.NEGATIVE_CACHE_TTL` seconds and replayed without a network call.
+
+    Request timeouts adapt to each endpoint's observed latency, never exceed the
+    endpoint's ceiling in `preferences.TIMEOUT_CEILINGS`, and are further capped by the
+    caller's remaining deadline budget (see `functions/deadline.py`).
+
+    Each endpoint sits behind its own circuit breaker (see `functions/breaker.py`). While
+    an endpoint's breaker is open, requests to it are answered from the cache, stale
+    entries included, or fail immediately with `breaker.CircuitOpenError`.
+
+    Every upstream call first takes a token from a shared rate limiter (see
+    `functions/ratelimit.py`). Requests answered with 429 slow the limiter down as asked
+    by `Retry-After` and are retried up to `preferences.RATE_LIMIT_RETRIES` times.
+
+    Requests are spread over the API keys in `preferences.API_KEYS` (or the single key in
+    the default headers). A key answered with 429 sits out for the requested delay while
+    the other keys carry on; the limiter only pauses once every key is exhausted.
+
+    Transport errors and 502/503/504 answers are retried with exponential backoff and
+    full jitter, within the caller's deadline. Interactive requests still running after
+    the endpoint's p95 latency are hedged with a second request, limited to
+    `preferences.HEDGE_BUDGET` of all requests; the first good answer wins.
+
+    Large list endpoints can be read with a streaming reducer (see `functions/stream.py`)
+    so that only the part the bot displays is ever held in memory or cached.
+    """
+
+    def __init__(self, headers: Optional[dict] = None):
+        self._headers = headers if headers is not None else preferences.headers
+        self._http: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[httpx.AsyncHTTPTransport] = None
+        self._http2 = preferences.HTTP2 and importlib.util.find_spec("h2") is not None
+        self._requests = 0
+        self._in_flight = 0
+        self._errors = 0
+        self._retries = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._connections_opened = 0
+        self._single_flight = cache.SingleFlight()
+        self._cache = cache.ResponseCache(preferences.CACHE_MAX_ENTRIES, preferences.CACHE_MAX_BYTES)
+        self._not_found = cache.ResponseCache(preferences.NEGATIVE_CACHE_MAX_ENTRIES, 0, name="not_found")
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._store: Optional[store.ResponseStore] = None
+        self._latency = deadline.LatencyTracker(preferences.LATENCY_WINDOW)
+        self._breakers: Dict[str, breaker.CircuitBreaker] = {}
+        self._keys = keys.KeyPool(preferences.API_KEYS or [self._headers["X-API-KEY"]])
+        self._limiter = ratelimit.TokenBucket(preferences.RATE_LIMIT_PER_SECOND * len(self._keys.keys),
+                                              preferences.RATE_LIMIT_BURST * len(self._keys.keys),
+                                              preferences.RATE_LIMIT_MAX_WAIT)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            limits = httpx.Limits(
+                max_connections=preferences.POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=preferences.POOL_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=preferences.POOL_KEEPALIVE_EXPIRY,
+            )
+            self._transport = httpx.AsyncHTTPTransport(limits=limits, http2=self._http2)
+            self._http = httpx.AsyncClient(headers=self._headers, transport=self._transport)
+        return self._http
+
+    async def close(self) -> None:
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._transport = None
+        if self._store is not None:
+            await asyncio.to_thread(self._store.close)
+            self._store = None
+
+    async def open_store(self) -> None:
+        """
+        Open the on-disk response store, if configured, and warm the cache from it.
+        """
+        if not preferences.CACHE_DB_PATH or self._store is not None:
+            return
+        self._store = await asyncio.to_thread(store.ResponseStore, preferences.CACHE_DB_PATH,
+                                             preferences.CACHE_MAX_ENTRIES)
+        now = time.time()
+        for stored in await asyncio.to_thread(self._store.load):
+            response = httpx.Response(stored.status_code, content=stored.content,
+                                      headers={"content-type": "application/json"},
+                                      request=httpx.Request("GET", stored.url))
+            self._cache.set(stored.key, response, stored.expires_at - now, len(stored.content),
+                            stored.stale_until - stored.expires_at)
+
+    async def _trace(self, event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+
+    def stats(self) -> dict:
+        """
+        Return a flat snapshot of client metrics for monitoring.
+
+        Returns:
+            dict: Request counters and connection pool usage, keyed as `pool.<metric>`.
+        """
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        return {
+            **self._cache.stats(),
+            **self._not_found.stats(),
+            **self._single_flight.stats(),
+            "cache.refreshing": len(self._refreshing),
+            **(self._store.stats() if self._store is not None else {}),
+            "pool.requests": self._requests,
+            "pool.in_flight": self._in_flight,
+            "pool.errors": self._errors,
+            "pool.retries": self._retries,
+            "pool.hedges": self._hedges,
+            "pool.hedge_wins": self._hedge_wins,
+            "pool.connections_opened": self._connections_opened,
+            "pool.connections": len(connections),
+            "pool.idle_connections": sum(1 for connection in connections if connection.is_idle()),
+            "pool.max_connections": preferences.POOL_MAX_CONNECTIONS,
+            "pool.http2": self._http2,
+            **self._latency.stats(ENDPOINT_NAMES),
+            **self._limiter.stats(),
+            **self._keys.stats(),
+            **{key: value for circuit in self._breakers.values() for key, value in circuit.stats().items()},
+        }
+
+    async def get(self, template: str, *args, timeout: Optional[float] = None,
+                  reducer: Optional[stream.TopK] = None) -> httpx.Response:
+        """
+        Format a URL template from `globals/urls.py` and issue a GET request.
+
+        Cached responses are returned without a network call, and callers requesting a URL
+        that is already in flight share that request's response.
+
+        Args:
+            template (str): One of the URL templates in `globals.urls`.
+            *args: Positional values substituted into the template.
+            timeout (float, optional): Timeout ceiling in seconds. Defaults to the endpoint's
+                ceiling in `preferences.TIMEOUT_CEILINGS`.
+            reducer (stream.TopK, optional): Streams a successful body through this reducer
+                instead of reading it whole; the response then carries the reduced payload,
+                which is also what gets cached.
+
+        Returns:
+            httpx.Response: The fully read response. Status codes are not checked.
+
+        Raises:
+            httpx.HTTPError: If a network-related error occurs.
+            deadline.DeadlineExceeded: If the caller's deadline budget runs out first.
+            breaker.CircuitOpenError: If the endpoint's circuit breaker is open and nothing
+                usable is cached.
+            ratelimit.RateLimited: If the request could not get past the rate limit and
+                nothing usable is cached.
+        """
+        if timeout is None:
+            timeout = preferences.TIMEOUT_CEILINGS.get(template, preferences.DEFAULT_TIMEOUT_CEILING)
+        url = str.format(template, *args)
+        key = cache.normalize_url(url)
+        if reducer is not None:
+            key += f"#{reducer.key}"
+        # Only the address can make an address-only endpoint fail, so its misses cover every
+        # later lookup of that address; anything with more parameters is keyed on the full URL.
+        not_found_key = f"{template}|{args[0]}" if len(args) == 1 else key
+        not_found = self._not_found.get(not_found_key)
+        if not_found is not None:
+            return not_found
+        if template in preferences.CACHE_TTLS:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            stale = self._cache.get_stale(key)
+            if stale is not None:
+                self._revalidate(template, url, key, timeout, reducer)
+                return stale
+        try:
+            response = await deadline.wait(self._single_flight.do(key, lambda: self._load(template, url, key, timeout, reducer)))
+        except (breaker.CircuitOpenError, ratelimit.RateLimited):
+            stale = self._cache.get_stale(key)
+            if stale is None:
+                raise
+            return stale
+        if response.status_code in preferences.NEGATIVE_CACHE_STATUSES:
+            self._not_found.set(not_found_key, response, preferences.NEGATIVE_CACHE_TTL)
+        return response
+
+    async def _load(self, template: str, url: str, key: str, timeout: float,
+                    reducer: Optional[stream.TopK]) -> httpx.Response:
+        # Runs under the single-flight's shared deadline: the latest budget among the callers
+        # still waiting for this URL, which bounds retries and per-attempt timeouts.
+        response = await self._fetch(template, url, timeout, reducer)
+        if preferences.RECORD_PAYLOADS_DIR and response.is_success:
+            asyncio.get_running_loop().run_in_executor(None, _record_payload, template, key, response.content)
+        ttl = preferences.CACHE_TTLS.get(template)
+        if ttl and response.is_success:
+            stale_ttl = preferences.STALE_WHILE_REVALIDATE.get(template, 0)
+            self._cache.set(key, response, ttl, len(response.content), stale_ttl)
+            if self._store is not None:
+                expires_at = time.time() + ttl
+                stored = store.StoredResponse(key, url, response.status_code, response.content,
+                                              expires_at, expires_at + stale_ttl)
+                asyncio.get_running_loop().run_in_executor(None, self._store.put, stored)
+        return response
+
+    def _revalidate(self, template: str, url: str, key: str, timeout: float,
+                    reducer: Optional[stream.TopK]) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.ensure_future(self._refresh(template, url, key, timeout, reducer))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda done: self._refreshed(key, done))
+
+    async def _refresh(self, template: str, url: str, key: str, timeout: float,
+                       reducer: Optional[stream.TopK]) -> httpx.Response:
+        with deadline.unbounded(), ratelimit.background():
+            return await self._single_flight.do(key, lambda: self._load(template, url, key, timeout, reducer))
+
+    def _refreshed(self, key: str, task: asyncio.Task) -> None:
+        self._refreshing.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    def _breaker(self, template: str) -> breaker.CircuitBreaker:
+        circuit = self._breakers.get(template)
+        if circuit is None:
+            circuit = breaker.CircuitBreaker(
+                ENDPOINT_NAMES.get(template, template),
+                window=preferences.CIRCUIT_WINDOW,
+                min_calls=preferences.CIRCUIT_MIN_CALLS,
+                failure_ratio=preferences.CIRCUIT_FAILURE_RATIO,
+                slow_call_seconds=preferences.CIRCUIT_SLOW_CALL_SECONDS,
+                reset_timeout=preferences.CIRCUIT_RESET_TIMEOUT,
+            )
+            self._breakers[template] = circuit
+        return circuit
+
+    async def _fetch(self, template: str, url: str, ceiling: float,
+                     reducer: Optional[stream.TopK]) -> httpx.Response:
+        circuit = self._breaker(template)
+        trial = circuit.allow()
+        if not trial:
+            raise breaker.CircuitOpenError(circuit.name)
+        attempt = 0
+        while True:
+            try:
+                response = await self._throttled(template, url, ceiling, reducer, circuit, trial)
+                if response.status_code not in preferences.RETRY_STATUSES:
+                    return response
+                failure = None
+            except httpx.TransportError as e:
+                if isinstance(e, deadline.DeadlineExceeded):
+                    raise
+                failure = e
+            delay = random.uniform(0, min(preferences.RETRY_MAX_DELAY, preferences.RETRY_BASE_DELAY * 2 ** attempt))
+            left = deadline.remaining()
+            if attempt >= preferences.RETRY_ATTEMPTS or circuit.state != breaker.CLOSED \
+                    or (left is not None and left <= delay):
+                if failure is not None:
+                    raise failure
+                return response
+            attempt += 1
+            self._retries += 1
+            await asyncio.sleep(delay)
+
+    async def _throttled(self, template: str, url: str, ceiling: float, reducer: Optional[stream.TopK],
+                         circuit: breaker.CircuitBreaker, trial: int) -> httpx.Response:
+        for _ in range(preferences.RATE_LIMIT_RETRIES + 1):
+            await deadline.wait(self._limiter.acquire())
+            response, api_key = await self._hedged(template, url, ceiling, reducer, circuit, trial,
+                                                   self._keys.acquire())
+            self._keys.observe(api_key, response.headers.get("x-ratelimit-remaining"))
+            if response.status_code != 429:
+                self._limiter.succeeded()
+                return response
+            delay = ratelimit.retry_after(response)
+            self._keys.limited(api_key, preferences.RATE_LIMIT_DEFAULT_BACKOFF if delay is None else delay)
+            if self._keys.next_available_in() > 0:
+                self._limiter.penalize(self._keys.next_available_in())
+        raise ratelimit.RateLimited()
+
+    async def _hedged(self, template: str, url: str, ceiling: float, reducer: Optional[stream.TopK],
+                      circuit: breaker.CircuitBreaker, trial: int,
+                      api_key: keys.ApiKey) -> Tuple[httpx.Response, keys.ApiKey]:
+        """
+        Send the request, and a hedge on another API key if it is slow; return the first
+        successful response together with the key that answered it.
+        """
+        hedge_after = None
+        if ratelimit.current_priority() == ratelimit.INTERACTIVE \
+                and self._latency.samples(template) >= preferences.HEDGE_MIN_SAMPLES:
+            hedge_after = self._latency.percentile(template, 0.95)
+        if hedge_after is None:
+            return await self._send(template, url, ceiling, reducer, circuit, trial, api_key), api_key
+
+        primary = asyncio.ensure_future(self._send(template, url, ceiling, reducer, circuit, trial, api_key))
+        tasks = {primary}
+        sent_with = {primary: api_key}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done and self._hedges < preferences.HEDGE_BUDGET * self._requests:
+                # Hedge only on a different key, so both requests don't share one quota.
+                other = self._keys.acquire(exclude=api_key)
+                if other is not None and self._limiter.try_acquire():
+                    self._hedges += 1
+                    hedge = asyncio.ensure_future(self._send(template, url, ceiling, reducer, circuit, trial, other))
+                    tasks.add(hedge)
+                    sent_with[hedge] = other
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                tasks -= done
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    if winner is not primary:
+                        self._hedge_wins += 1
+                    return winner.result(), sent_with[winner]
+                if not tasks:
+                    return done.pop().result(), api_key
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send(self, template: str, url: str, ceiling: float, reducer: Optional[stream.TopK],
+                    circuit: breaker.CircuitBreaker, trial: int, api_key: keys.ApiKey) -> httpx.Response:
+        endpoint_timeout = self._latency.timeout(template, ceiling)
+        timeout = deadline.timeout_for(endpoint_timeout)
+        self._requests += 1
+        self._in_flight += 1
+        started = time.monotonic()
+        try:
+            if reducer is None:
+                response = await self.http.get(url, headers={"X-API-KEY": api_key.value}, timeout=timeout,
+                                               extensions={"trace": self._trace})
+            else:
+                response = await self._stream(url, timeout, reducer, api_key)
+            elapsed = time.monotonic() - started
+            self._latency.observe(template, elapsed)
+            circuit.record(trial, response.status_code < 500, elapsed)
+            return response
+        except httpx.TimeoutException:
+            self._errors += 1
+            # A timeout forced by the caller's short budget says nothing about the endpoint.
+            if timeout >= endpoint_timeout:
+                self._latency.observe(template, time.monotonic() - started)
+                circuit.record(trial, False)
+            raise
+        except httpx.HTTPError:
+            self._errors += 1
+            circuit.record(trial, False)
+            raise
+        finally:
+            self._in_flight -= 1
+
+    async def _stream(self, url: str, timeout: float, reducer: stream.TopK, api_key: keys.ApiKey) -> httpx.Response:
+        request = self.http.build_request("GET", url, headers={"X-API-KEY": api_key.value}, timeout=timeout,
+                                          extensions={"trace": self._trace})
+        response = await self.http.send(request, stream=True)
+        try:
+            if not response.is_success:
+                await response.aread()
+                return response
+            content = await reducer.reduce(response.aiter_bytes())
+        finally:
+            await response.aclose()
+        headers = {name: value for name, value in response.headers.items() if name not in _BODY_HEADERS}
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    async def collection_owners(self, collection_address: str, timeout: Optional[float] = None,
+                                top: Optional[int] = None) -> httpx.Response:
+        reducer = stream.TopK("data", "amount", top) if top else None
+        return await self.get(urls.COLLECTION_URL, collection_address, timeout=timeout, reducer=reducer)
+
+    async def program_details(self, program_address: str, timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.PROGRAM_DETAILS_URL, program_address, timeout=timeout)
+
+    async def top_active_wallets(self, program_address: str, days: int, limit: int,
+                                 timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.TOP_ACTIVE_WALLETS_URL, program_address, days, limit, timeout=timeout)
+
+    async def nft_portfolio(self, wallet_address: str, timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.NFT_PORTFOLIO_URL, wallet_address, timeout=timeout)
+
+    async def wallet_pnl(self, wallet_address: str, days: int, timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.WALLET_PNL_URL, wallet_address, days, timeout=timeout)
+
+    async def wallet_token_balance(self, wallet_address: str, timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.WALLET_TOKEN_BALANCE_URL, wallet_address, timeout=timeout)
+
+    async def token_info(self, mint_address: str, timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.TOKEN_INFO_URL, mint_address, timeout=timeout)
+
+    async def token_ohlcv(self, mint_address: str, resolution: str, time_start: int, time_end: int,
+                          timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.TOKEN_OHLCV_URL, mint_address, resolution, time_start, time_end,
+                              timeout=timeout)
+
+    async def top_token_holders(self, mint_address: str, limit: int, sort_by: str, sort_direction: str,
+                                timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.TOP_TOKEN_HOLDERS_URL, mint_address, limit, sort_by, sort_direction,
+                              timeout=timeout)
+
+    async def program_active_users(self, program_address: str, time_range: str,
+                                   timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.PROGRAM_ACTIVE_USERS_URL, program_address, time_range, timeout=timeout)
+
+    async def program_transactions(self, program_address: str, time_range: str,
+                                   timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.PROGRAM_TXS_URL, program_address, time_range, timeout=timeout)
+
+    async def daily_top_token_holders(self, mint_address: str, start_time: int, end_time: int,
+                                      timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.DAILY_TOP_TOKEN_HOLDERS_URL, mint_address, start_time, end_time,
+                              timeout=timeout)
+
+    async def token_volume(self, mint_address: str, start_time: int, end_time: int, interval: str,
+                           timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.TOKEN_VOLUME_URL, mint_address, start_time, end_time, interval,
+                              timeout=timeout)
+
+    async def token_balance_history(self, wallet_address: str, days: int, timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.TOKEN_BALANCE_CHART_URL, wallet_address, days, timeout=timeout)
+
+    async def program_tvl(self, program_address: str, resolution: str, timeout: Optional[float] = None) -> httpx.Response:
+        return await self.get(urls.PROGRAM_TVL, program_address, resolution, timeout=timeout)
+
+
+vybe = VybeClient()
@@ -1,3 +1,10 @@
+from typing import Union
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_VALUES = [-1] * 128
+for _index, _char in enumerate(BASE58_ALPHABET):
+    _BASE58_VALUES[ord(_char)] = _index
+
 def to_float_safe(val, default: float = 0.0) -> float:
     """
     Safely convert a value to a float.
@@ -27,3 +34,36 @@ def to_float_safe(val, default: float = 0.0) -> float:
         return float(val)
     except (ValueError, TypeError):
         return default
+
+
+def base58_decode(value: str) -> Union[bytes, None]:
+    """
+    Decode a base58 (Bitcoin alphabet) string as used for Solana addresses.
+
+    Characters are mapped through a precomputed 128-entry lookup table, so strings
+    containing characters outside the alphabet (such as 0, O, I and l) are rejected
+    on the first bad character.
+
+    Args:
+        value (str): The base58 string to decode.
+
+    Returns:
+        bytes | None: The decoded bytes, or None if the string is empty or not valid base58.
+
+    Example:
+        >>> len(base58_decode("So11111111111111111111111111111111111111112"))
+        32
+        >>> base58_decode("0OIl") is None
+        True
+    """
+    if not value:
+        return None
+    number = 0
+    for char in value:
+        code = ord(char)
+        digit = _BASE58_VALUES[code] if code < 128 else -1
+        if digit < 0:
+            return None
+        number = number * 58 + digit
+    leading_zeros = len(value) - len(value.lstrip("1"))
+    return b"\x00" * leading_zeros + number.to_bytes((number.bit_length() + 7) // 8, "big")
@@ -0,0 +1,190 @@
+"""
+Deadline budgets and adaptive timeouts.
+
+A handler opens a time budget with `budget()`; the remaining time travels with the
+task through a context variable, so the API client and chart rendering below it cap
+their own waits by it without the budget being passed around explicitly. Per-endpoint
+timeouts adapt to the latency observed for that endpoint.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Deque, Dict, Optional, TypeVar, Union
+import httpx
+import globals.preferences as preferences
+
+T = TypeVar("T")
+
+
+class SharedDeadline:
+    """
+    Deadline of work shared by several callers, e.g. a coalesced API request.
+
+    It is the latest of the callers' deadlines, or none while any caller has no budget,
+    and it moves as callers join and leave.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[int, Optional[float]] = {}
+        self._next = 0
+
+    def join(self, at: Optional[float]) -> int:
+        """
+        Add a caller whose own deadline is `at` and return a token for `leave()`.
+        """
+        self._next += 1
+        self._waiters[self._next] = at
+        return self._next
+
+    def leave(self, token: int) -> None:
+        self._waiters.pop(token, None)
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def at(self) -> Optional[float]:
+        if not self._waiters or None in self._waiters.values():
+            return None
+        return max(self._waiters.values())
+
+
+_deadline: ContextVar[Optional[Union[float, SharedDeadline]]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Raised when the current update's time budget has run out."""
+
+    def __init__(self, message: str = "Deadline exceeded"):
+        super().__init__(message)
+
+
+@contextmanager
+def budget(seconds: float):
+    """
+    Limit everything awaited inside the block to `seconds` from now.
+
+    Nested budgets can only shorten the deadline, never extend it.
+    """
+    deadline = time.monotonic() + seconds
+    at = current()
+    token = _deadline.set(deadline if at is None else min(at, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def unbounded():
+    """
+    Detach the block from the current budget, e.g. for background refreshes.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def shared(deadline: SharedDeadline):
+    """
+    Make everything awaited inside the block follow `deadline` as its callers change.
+    """
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current() -> Optional[float]:
+    """
+    Return the current deadline on the `time.monotonic()` clock, or None if there is no budget.
+    """
+    deadline = _deadline.get()
+    return deadline.at if isinstance(deadline, SharedDeadline) else deadline
+
+
+def remaining() -> Optional[float]:
+    """
+    Return the seconds left in the current budget, or None if there is no budget.
+    """
+    deadline = current()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def timeout_for(ceiling: float) -> float:
+    """
+    Cap a timeout by the current budget.
+
+    Raises:
+        DeadlineExceeded: If the budget is already spent.
+    """
+    left = remaining()
+    if left is None:
+        return ceiling
+    if left <= 0:
+        raise DeadlineExceeded()
+    return min(ceiling, left)
+
+
+async def wait(awaitable: Awaitable[T]) -> T:
+    """
+    Await `awaitable`, cancelling it if the current budget runs out first.
+
+    Raises:
+        DeadlineExceeded: If the budget runs out before `awaitable` completes.
+    """
+    left = remaining()
+    if left is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(left, 0))
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded() from None
+
+
+class LatencyTracker:
+    """
+    Rolling window of request latencies per endpoint.
+
+    Once an endpoint has enough samples, its timeout becomes a multiple of the observed
+    p99 latency, clamped between `preferences.ADAPTIVE_TIMEOUT_FLOOR` and the endpoint's
+    ceiling.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        self._samples.setdefault(endpoint, deque(maxlen=self.window)).append(seconds)
+
+    def samples(self, endpoint: str) -> int:
+        return len(self._samples.get(endpoint, ()))
+
+    def percentile(self, endpoint: str, q: float) -> Optional[float]:
+        samples = self._samples.get(endpoint)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def timeout(self, endpoint: str, ceiling: float) -> float:
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < preferences.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return ceiling
+        adaptive = self.percentile(endpoint, 0.99) * preferences.ADAPTIVE_TIMEOUT_MULTIPLIER
+        return min(ceiling, max(preferences.ADAPTIVE_TIMEOUT_FLOOR, adaptive))
+
+    def stats(self, names: Dict[str, str]) -> dict:
+        metrics = {}
+        for endpoint in self._samples:
+            name = names.get(endpoint, endpoint)
+            metrics[f"latency.{name}.p50"] = round(self.percentile(endpoint, 0.50), 3)
+            metrics[f"latency.{name}.p95"] = round(self.percentile(endpoint, 0.95), 3)
+        return metrics
@@ -0,0 +1,103 @@
+"""
+Bounded worker pool for blocking work.
+
+CPU-bound or blocking calls, such as rendering charts with Matplotlib, run on a fixed
+number of threads so the event loop stays responsive. Pending jobs are queued per user
+and started round-robin, so one user asking for many charts cannot starve the others.
+"""
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, Optional
+import functions.deadline as deadline
+import globals.preferences as preferences
+
+
+class Dispatcher:
+    """
+    Run blocking callables on a bounded thread pool with per-user fairness.
+
+    At most `max_workers` jobs run at once. Jobs beyond that wait in a queue owned by
+    their user, and whenever a worker frees up the next job is taken from the next user
+    in rotation rather than from the head of one global queue.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vybe-worker")
+        self._queues: Dict[Hashable, Deque] = {}
+        self._rotation: Deque[Hashable] = deque()
+        self._running = 0
+        self._queued = 0
+        self.max_queued = 0
+        self.completed = 0
+
+    async def run(self, user_id: Optional[Hashable], func: Callable, *args, **kwargs) -> Any:
+        """
+        Queue `func(*args, **kwargs)` for `user_id` and wait for its result.
+
+        Args:
+            user_id (Hashable | None): Fairness key, normally the Telegram user ID.
+            func (Callable): Blocking function to run in a worker thread.
+
+        Returns:
+            Any: The function's return value. Exceptions raised by it are re-raised here.
+
+        Raises:
+            deadline.DeadlineExceeded: If the caller's deadline budget runs out first. A job
+                that has not started yet is dropped from the queue.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(user_id, deque()).append((functools.partial(func, *args, **kwargs), future))
+        if user_id not in self._rotation:
+            self._rotation.append(user_id)
+        self._queued += 1
+        self.max_queued = max(self.max_queued, self._queued)
+        self._pump()
+        return await deadline.wait(future)
+
+    def _pump(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._running < self.max_workers and self._rotation:
+            user_id = self._rotation.popleft()
+            queue = self._queues[user_id]
+            job, future = queue.popleft()
+            if queue:
+                self._rotation.append(user_id)
+            else:
+                del self._queues[user_id]
+            self._queued -= 1
+            if future.cancelled():
+                continue
+            self._running += 1
+            running = loop.run_in_executor(self._executor, job)
+            running.add_done_callback(functools.partial(self._finished, future))
+
+    def _finished(self, future: asyncio.Future, running: asyncio.Future) -> None:
+        self._running -= 1
+        self.completed += 1
+        if running.cancelled():
+            future.cancel()
+        elif not future.cancelled():
+            if running.exception() is not None:
+                future.set_exception(running.exception())
+            else:
+                future.set_result(running.result())
+        self._pump()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "dispatch.workers": self.max_workers,
+            "dispatch.running": self._running,
+            "dispatch.queued": self._queued,
+            "dispatch.max_queued": self.max_queued,
+            "dispatch.waiting_users": len(self._queues),
+            "dispatch.completed": self.completed,
+        }
+
+
+dispatcher = Dispatcher(preferences.WORKER_THREADS)
@@ -1,4 +1,7 @@
 import re
+import functions.converts as converts
+
+SOLANA_PUBKEY_BYTES = 32
 def is_valid_range(r: str) -> bool:
     """
     Check if the given range string is valid (e.g., '1h', '7d').
@@ -13,15 +16,18 @@ def is_valid_range(r: str) -> bool:
 
 def is_valid_address(address: str) -> bool:
     """
-    Validate if the provided address is alphanumeric and 42 to 46 characters long.
+    Validate that the address is a base58-encoded 32-byte Solana public key.
 
     Args:
-        address (str): Wallet or program address.
+        address (str): Wallet, program or collection address.
 
     Returns:
         bool: True if valid, False otherwise.
     """
-    return bool(re.fullmatch(r"[a-zA-Z0-9]{42,46}", address))
+    if not 32 <= len(address) <= 44:
+        return False
+    decoded = converts.base58_decode(address)
+    return decoded is not None and len(decoded) == SOLANA_PUBKEY_BYTES
 
 def is_valid_limit(value: str) -> bool:
     """
@@ -49,7 +55,7 @@ def is_valid_days(value: str) -> bool:
 
 def is_valid_mint(address: str) -> bool:
     """
-    Validate if the given mint address is alphanumeric and between 42-46 characters.
+    Validate that the mint address is a base58-encoded 32-byte Solana public key.
 
     Args:
         address (str): Mint address to validate.
@@ -57,7 +63,7 @@ def is_valid_mint(address: str) -> bool:
     Returns:
         bool: True if valid, False otherwise.
     """
-    return bool(re.fullmatch(r"[a-zA-Z0-9]{42,46}", address))
+    return is_valid_address(address)
 
 def is_valid_resolution(res: str) -> bool:
     """
@@ -1,20 +1,33 @@
-import requests
+import asyncio
 import json
-from typing import Union, Tuple
-import re
+import httpx
+from typing import Optional, Union, Tuple
 import constants.messages as messages
-import globals.preferences as preferences
+import functions.breaker as breaker
+import functions.chunker as chunker
+import functions.client as client
 import functions.evaluates as evaluates
+import functions.ratelimit as ratelimit
 import functions.converts as converts
 import functions.datetime as datetime
-import globals.urls as urls
+import functions.deadline as deadline
+import functions.jsonlib as jsonlib
+import functions.registry as registry
+import globals.preferences as preferences
+
+# Candles shown per OHLCV page, and the length of each supported resolution in seconds.
+OHLCV_PAGE_SIZE = 10
+OHLCV_RESOLUTION_SECONDS = {
+    '1s': 1, '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600, '2h': 7200, '3h': 10800,
+    '4h': 14400, '1d': 86400, '1w': 604800, '1mo': 31 * 86400, '1y': 366 * 86400,
+}
 
 emoji_numbers = {
             1: "1️⃣", 2: "2️⃣", 3: "3️⃣", 4: "4️⃣", 5: "5️⃣",
             6: "6️⃣", 7: "7️⃣", 8: "8️⃣", 9: "9️⃣", 10: "🔟"
         }
 
-def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
+async def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
     """
     Fetch the top NFT owners of a given NFT collection from Vybe Network API.
 
@@ -24,7 +37,7 @@ def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
 
     Args:
         collection_address (str):
-            The address of the NFT collection (must be alphanumeric).
+            The address of the NFT collection (must be a valid base58 Solana address).
 
     Returns:
         Union[str, list]:
@@ -33,7 +46,7 @@ def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
             - A string containing an error message if validation or API request fails.
 
     Raises:
-        requests.exceptions.RequestException:
+        httpx.HTTPError:
             If there is a network-related error during the API call.
         ValueError:
             If the API response cannot be parsed as JSON.
@@ -48,12 +61,10 @@ def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
         🎁 *NFTs:* 12
         ...
     """
-    if not re.fullmatch(r"[a-zA-Z0-9]+", collection_address):
+    if not evaluates.is_valid_address(collection_address):
         return messages.INVALID_COLLECTION_ADDRESS
-    url = str.format(urls.COLLECTION_URL, collection_address)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=250)
+        response = await client.vybe.collection_owners(collection_address, top=10)
 
         if response.status_code == 403:
             return messages.STATUS_CODE_403
@@ -61,7 +72,7 @@ def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
             return messages.STATUS_CODE_404
 
         response.raise_for_status()
-        data = response.json()
+        data = jsonlib.loads(response.content)
 
         owners = data.get("data", [])
         if not owners:
@@ -69,8 +80,6 @@ def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
 
         top_owners = owners[:10]
 
-
-
         short_address = f"{collection_address[:6]}...{collection_address[-4:]}"
         result = [f"📦 *Top Owners of:* {short_address}\n"]
 
@@ -81,28 +90,21 @@ def retrieve_nft_collection_owners(collection_address: str) -> Union[str, list]:
             owner_short = f"{owner[:6]}...{owner[-4:]}"
             result.append(f"{emoji}\n👤 *Owner:* {owner_short}\n🎁 *NFTs:* {amount}\n")
 
-        # Split if message is too long
-        chunks = []
-        chunk = ""
-        for line in result:
-            if len(chunk) + len(line) < 4000:
-                chunk += line + "\n"
-            else:
-                chunks.append(chunk)
-                chunk = line + "\n"
-        if chunk:
-            chunks.append(chunk)
-
+        chunks = chunker.split("\n".join(result))
         return chunks if len(chunks) > 1 else chunks[0]
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return (str.format(messages.NETWORK_ERROR,e))
     except ValueError:
         return messages.VALUE_ERROR
     except Exception as e:
         return (str.format(messages.NETWORK_ERROR,e))
 
-def retrieve_program_details(program_address: str) -> Tuple[str, str]:
+async def retrieve_program_details(program_address: str) -> Tuple[str, str]:
     """
     Fetch and format the details of a specific program from Vybe Network API.
 
@@ -111,7 +113,7 @@ def retrieve_program_details(program_address: str) -> Tuple[str, str]:
 
     Args:
         program_address (str):
-            The program's public address (must be a valid alphanumeric 42–46 characters long).
+            The program's public address (base58-encoded Solana address).
 
     Returns:
         Tuple[str, str]:
@@ -129,29 +131,20 @@ def retrieve_program_details(program_address: str) -> Tuple[str, str]:
     if not evaluates.is_valid_address(program_address):
         return messages.INVALID_ADDRESS
 
-    url = str.format(urls.PROGRAM_DETAILS_URL, program_address)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=250)
-
-        if response.status_code == 400:
-            return messages.INACCESSIBLE_PROGRAM_ADDRESS
-        elif response.status_code == 403:
-            return messages.INACCESSIBLE_PROGRAM_ADDRESS
-        elif response.status_code == 404:
+        program = await registry.programs.get(program_address)
+        if program is None:
             return messages.INACCESSIBLE_PROGRAM_ADDRESS
 
-        response.raise_for_status()
-
-        data = response.json()
+        data = program.details
 
-        entity_name = data.get("entityName", "N/A")
+        entity_name = program.entity_name
         friendly_name = data.get("friendlyName", "N/A")
         dau = data.get("dau", "N/A")
         new_users = data.get("newUsersChange1d", "N/A")
         txns = data.get("transactions1d", "N/A")
-        labels = data.get("labels", [])
-        logo_url = data.get("logoUrl", "N/A")
+        labels = program.labels
+        logo_url = program.logo_url
         description = data.get("programDescription", "N/A")
 
         labels_text = ", ".join(labels) if labels else "None"
@@ -172,64 +165,50 @@ def retrieve_program_details(program_address: str) -> Tuple[str, str]:
 
         return formatted_message, logo_url
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return messages.SOMETHING_WENT_WRONG
     except json.JSONDecodeError as e:
         return messages.JSON_ERROR
     except Exception as e:
         return messages.SOMETHING_WENT_WRONG
-def retrieve_program_name(program_address: str) -> Union[str, None]:
+async def retrieve_program_name(program_address: str) -> Union[str, None]:
     """
-    Retrieve the display name of a program from Vybe Network API.
+    Retrieve the display name of a program from the shared program registry.
 
     Attempts to fetch a friendly name, fallback name, or entity name
     associated with a given program address. Returns the address itself
-    if no name is found but the program is accessible.
+    if no name is found but the program is accessible. Metadata is fetched
+    at most once per program and reused by every Program flow.
 
     Args:
         program_address (str):
-            The public address of the program to query (typically 32–44 characters).
+            The public address of the program to query (base58-encoded Solana address).
 
     Returns:
         Union[str, None]:
             - The program's friendly name, name, entity name, or the address itself.
             - None if the program is invalid, inaccessible (status 400, 403, 404), or if an error occurs.
 
-    Raises:
-        requests.exceptions.RequestException:
-            If there is a network error during the API call.
-        json.JSONDecodeError:
-            If the response is not valid JSON.
-        Exception:
-            For any unexpected errors during fetching or parsing.
-
     Example:
         >>> retrieve_program_name('9AefkXv83z...')
         'Orca'
     """
-
-    url = str.format(urls.PROGRAM_DETAILS_URL, program_address)
+    if not evaluates.is_valid_address(program_address):
+        return None
 
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=250)
-        if response.status_code in [400, 403, 404]:
-            return None
-        response.raise_for_status()
-        info = response.json()
-
-        name = (
-            info.get("friendlyName")
-            or info.get("name")
-            or info.get("entityName")
-        )
-
-        return name if name else program_address
+        program = await registry.programs.get(program_address)
+        return program.name if program else None
 
     except Exception:
         return None
 
 
-def retrieve_top_active_wallets(program_address: str, days: int = 1, limit: int = 10) -> str:
+async def retrieve_top_active_wallets(program_address: str, days: int = 1, limit: int = 10) -> str:
     """
     Retrieve and format a list of the top active wallets for a given program over a specified time period.
 
@@ -238,7 +217,7 @@ def retrieve_top_active_wallets(program_address: str, days: int = 1, limit: int
 
     Args:
         program_address (str):
-            The public address of the program (must be 42–46 alphanumeric characters).
+            The public address of the program (base58-encoded Solana address).
         days (int, optional):
             Number of past days to analyze (between 1 and 30). Defaults to 1.
         limit (int, optional):
@@ -250,7 +229,7 @@ def retrieve_top_active_wallets(program_address: str, days: int = 1, limit: int
             or the API call encounters an error.
 
     Raises:
-        requests.exceptions.RequestException:
+        httpx.HTTPError:
             If a network-related error occurs during the API call.
         Exception:
             For any unexpected error during data processing or response formatting.
@@ -274,16 +253,14 @@ def retrieve_top_active_wallets(program_address: str, days: int = 1, limit: int
     if not evaluates.is_valid_limit(str(limit)):
         return messages.INVALID_LIMIT
 
-    program_name = retrieve_program_name(program_address)
+    program_name = await retrieve_program_name(program_address)
     if not program_name:
         return messages.PROGRAM_NOT_FOUND
 
-    url = str.format( urls.TOP_ACTIVE_WALLETS_URL, program_address,days,limit)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=250)
+        response = await client.vybe.top_active_wallets(program_address, days, limit)
         response.raise_for_status()
-        data = response.json().get("data", [])
+        data = jsonlib.loads(response.content).get("data", [])
 
         if not data:
             return messages.NO_DATA_FOUND
@@ -300,13 +277,17 @@ def retrieve_top_active_wallets(program_address: str, days: int = 1, limit: int
         return "\n".join(output_lines)
 
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return (str.format(messages.NETWORK_ERROR,e))
     except Exception as e:
         return (str.format(messages.UNEXPECTED_ERROR,e))
 
 
-def retrieve_nft_portfolio(wallet_address: str) -> str:
+async def retrieve_nft_portfolio(wallet_address: str) -> str:
     """
     Fetch and format the NFT portfolio of a given wallet from Vybe Network API.
 
@@ -321,23 +302,21 @@ def retrieve_nft_portfolio(wallet_address: str) -> str:
         str: A formatted string summarizing the wallet's NFT portfolio.
 
     Raises:
-        requests.exceptions.RequestException: If a network error occurs.
+        httpx.HTTPError: If a network error occurs.
         json.JSONDecodeError: If the API response is not valid JSON.
         Exception: For any unexpected error during data processing.
     """
     if not evaluates.is_valid_address(wallet_address):
-        return "❌ Invalid wallet address! Only alphanumeric characters allowed."
-
-    url = str.format(urls.NFT_PORTFOLIO_URL, wallet_address)
+        return messages.INVALID_WALLET_ADDRESS
 
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=20)
+        response = await client.vybe.nft_portfolio(wallet_address)
 
         if response.status_code == 404:
             return "🚫 Wallet not found or has no NFT data."
 
         response.raise_for_status()
-        data = response.json()
+        data = jsonlib.loads(response.content)
 
         output_lines = [str.format(messages.NFT_PORTFOLIO_TEMPLATE,
             data.get('ownerAddress', 'N/A'),
@@ -374,14 +353,18 @@ def retrieve_nft_portfolio(wallet_address: str) -> str:
 
         return "\n".join(output_lines)
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return str.format(messages.NETWORK_ERROR,e)
     except json.JSONDecodeError:
         return messages.JSON_ERROR
     except Exception as e:
         return str.format(messages.UNEXPECTED_ERROR,e)
 
-def retrieve_wallet_pnl_summary(wallet_address: str, days: int) -> list[str] | str:
+async def retrieve_wallet_pnl_summary(wallet_address: str, days: int) -> list[str] | str:
     """
     Fetch and format the profit and loss (PnL) summary for a given wallet over a specified time period.
 
@@ -390,7 +373,7 @@ def retrieve_wallet_pnl_summary(wallet_address: str, days: int) -> list[str] | s
 
     Args:
         wallet_address (str):
-            The wallet's public address (42–46 alphanumeric characters).
+            The wallet's public address (base58-encoded Solana address).
         days (int):
             Number of past days to calculate the PnL summary (e.g., 1, 7, or 30).
 
@@ -401,7 +384,7 @@ def retrieve_wallet_pnl_summary(wallet_address: str, days: int) -> list[str] | s
             - An error message string if validation or data retrieval fails.
 
     Raises:
-        requests.exceptions.RequestException:
+        httpx.HTTPError:
             If there is a network-related error during the API call.
         json.JSONDecodeError:
             If the API response is not valid JSON.
@@ -423,15 +406,13 @@ def retrieve_wallet_pnl_summary(wallet_address: str, days: int) -> list[str] | s
     if not evaluates.is_valid_address(wallet_address):
         return messages.INVALID_WALLET_FORMAT
 
-    url = str.format(urls.WALLET_PNL_URL, wallet_address,days)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=1250)
+        response = await client.vybe.wallet_pnl(wallet_address, days)
         if response.status_code == 404:
             return messages.WALLET_NOT_FOUND
 
         response.raise_for_status()
-        data = response.json()
+        data = jsonlib.loads(response.content)
 
         summary = data.get("summary", {})
         output = [
@@ -469,57 +450,91 @@ def retrieve_wallet_pnl_summary(wallet_address: str, days: int) -> list[str] | s
                     )
                 )
 
-        result = "\n".join(output)
-
-        chunks = []
-        while len(result) > 4000:
-            split_index = result.rfind("\n", 0, 4000)
-            if split_index == -1:
-                split_index = 4000
-            chunks.append(result[:split_index])
-            result = result[split_index:].lstrip()
-        chunks.append(result)
+        return chunker.split("\n".join(output))
 
-        return chunks
-
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return (str.format(messages.NETWORK_ERROR,e))
     except Exception as e:
         return (str.format(messages.UNEXPECTED_ERROR,e))
 
 
-def retrieve_wallet_portfolio_summary(wallet_address: str) -> str:
+async def retrieve_wallet_portfolio_summary(wallet_address: str) -> str:
+    """
+    Fetch and format the total token and NFT value held by a wallet.
+
+    The wallet check (1d PnL), token balance and NFT balance are requested concurrently
+    and awaited for at most `preferences.PORTFOLIO_DEADLINE` seconds overall. If one of
+    the value legs fails or is still pending at the deadline, the summary is returned
+    without it and notes which value is missing. A 404 counts as "no value", not a failure.
+
+    Args:
+        wallet_address (str):
+            The public address of the wallet (base58-encoded Solana address).
+
+    Returns:
+        str:
+            A formatted portfolio summary, or an error message if the wallet is invalid,
+            not found, the wallet check failed, or no value could be fetched.
+    """
     if not evaluates.is_valid_address(wallet_address):
         return messages.INVALID_WALLET_ADDRESS
 
-    def fetch_json(url: str) -> dict | None:
-        try:
-            response = requests.get(url, headers=preferences.headers, timeout=20)
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            return response.json()
-        except (requests.exceptions.RequestException, json.JSONDecodeError):
+    async def fetch_json(request) -> dict | None:
+        response = await request
+        if response.status_code == 404:
             return None
+        response.raise_for_status()
+        return jsonlib.loads(response.content)
+
+    def failure_message(task) -> str:
+        error = task.exception() if task.done() and not task.cancelled() else None
+        if isinstance(error, (breaker.CircuitOpenError, ratelimit.RateLimited)):
+            return messages.SERVICE_UNAVAILABLE
+        if error is None or isinstance(error, httpx.TimeoutException):
+            return messages.TIMEOUT_ERROR
+        if isinstance(error, httpx.HTTPError):
+            return str.format(messages.NETWORK_ERROR, error)
+        return messages.JSON_ERROR
 
-    check_url = str.format(urls.WALLET_PNL_URL, wallet_address, 1)
-    token_url = str.format(urls.WALLET_TOKEN_BALANCE_URL, wallet_address)
-    nft_url   = str.format(urls.NFT_PORTFOLIO_URL, wallet_address)
-
-    check_data = fetch_json(check_url)
+    with deadline.budget(preferences.PORTFOLIO_DEADLINE):
+        check_task = asyncio.ensure_future(fetch_json(client.vybe.wallet_pnl(wallet_address, 1)))
+        token_task = asyncio.ensure_future(fetch_json(client.vybe.wallet_token_balance(wallet_address)))
+        nft_task   = asyncio.ensure_future(fetch_json(client.vybe.nft_portfolio(wallet_address)))
+
+    tasks = [check_task, token_task, nft_task]
+    done, pending = await asyncio.wait(tasks, timeout=preferences.PORTFOLIO_DEADLINE + preferences.DEADLINE_GRACE)
+    for task in pending:
+        task.cancel()
+    # A leg that raised (timeout, open circuit, 5xx...) counts as unavailable, like a pending one.
+    ok = {task for task in done if task.exception() is None}
+
+    if check_task not in ok:
+        return failure_message(check_task)
+    check_data = check_task.result()
     if not check_data or (not check_data.get("summary") and not check_data.get("tokenMetrics")):
         return messages.WALLET_NOT_FOUND_FOR_PORTFOLIO
+    if token_task not in ok and nft_task not in ok:
+        return failure_message(token_task)
 
-    token_data = fetch_json(token_url)
-    nft_data   = fetch_json(nft_url)
+    token_data = token_task.result() if token_task in ok else None
+    nft_data   = nft_task.result() if nft_task in ok else None
 
     token_usd = float(token_data.get("totalTokenValueUsd", 0)) if isinstance(token_data, dict) else 0.0
     nft_usd= float(nft_data.get("totalUsd", 0)) if isinstance(nft_data, dict) else 0.0
     total= token_usd + nft_usd
 
-    return str.format(messages.PORTFOLIO_SUMMARY_MESSAGE, wallet_address, token_usd, nft_usd, total)
+    result = str.format(messages.PORTFOLIO_SUMMARY_MESSAGE, wallet_address, token_usd, nft_usd, total)
+    if token_task not in ok:
+        result += str.format(messages.PORTFOLIO_PARTIAL_NOTE, "Token")
+    if nft_task not in ok:
+        result += str.format(messages.PORTFOLIO_PARTIAL_NOTE, "NFT")
+    return result
 
-def retrieve_wallet_token_summary(wallet_address: str) -> str | list[str]:
+async def retrieve_wallet_token_summary(wallet_address: str) -> str | list[str]:
     """
     Fetch and format the token balance summary for a given wallet.
 
@@ -529,7 +544,7 @@ def retrieve_wallet_token_summary(wallet_address: str) -> str | list[str]:
 
     Args:
         wallet_address (str):
-            The public address of the wallet (42–46 alphanumeric characters).
+            The public address of the wallet (base58-encoded Solana address).
 
     Returns:
         Union[str, list[str]]:
@@ -538,7 +553,7 @@ def retrieve_wallet_token_summary(wallet_address: str) -> str | list[str]:
             - An error message string if the wallet is invalid, not found, or if a network error occurs.
 
     Raises:
-        requests.exceptions.RequestException:
+        httpx.HTTPError:
             If there is a network error during the API call.
         json.JSONDecodeError:
             If the API response is not a valid JSON.
@@ -568,15 +583,18 @@ def retrieve_wallet_token_summary(wallet_address: str) -> str | list[str]:
 
     if not evaluates.is_valid_address(wallet_address):
         return messages.INVALID_WALLET_ADDRESS
-    url = str.format(urls.WALLET_TOKEN_BALANCE_URL, wallet_address)
 
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=250)
+        response = await client.vybe.wallet_token_balance(wallet_address)
         if response.status_code == 404:
             return messages.ERROR_NO_WALLET_TOKEN_DATA
         response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException as e:
+        data = jsonlib.loads(response.content)
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return (str.format(messages.NETWORK_ERROR,e))
     except json.JSONDecodeError:
         return messages.JSON_ERROR
@@ -619,23 +637,9 @@ def retrieve_wallet_token_summary(wallet_address: str) -> str | list[str]:
             )
         )
 
-    result = "\n".join(output)
-
-    # Telegram messages have a length limit (approx 4096 chars)
-    if len(result) <= 4000:
-        return result
-
-    # Split into chunks if too long
-    chunks = []
-    while len(result) > 4000:
-        split_at = result.rfind("\n", 0, 4000)
-        if split_at == -1:
-            split_at = 4000
-        chunks.append(result[:split_at])
-        result = result[split_at:].lstrip()
-    chunks.append(result)
-    return chunks
-def retrieve_token_info(mint_address: str) -> tuple[str, str] | str:
+    chunks = chunker.split("\n".join(output))
+    return chunks if len(chunks) > 1 else chunks[0]
+async def retrieve_token_info(mint_address: str) -> tuple[str, str] | str:
     """
     Fetch and format detailed information about a token given its mint address.
 
@@ -657,16 +661,14 @@ def retrieve_token_info(mint_address: str) -> tuple[str, str] | str:
     if not evaluates.is_valid_mint(mint_address):
         return messages.INVALID_MINT_ADDRESS
 
-    url = str.format(urls.TOKEN_INFO_URL, mint_address)
-
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=20)
+        response = await client.vybe.token_info(mint_address)
 
         if response.status_code == 404:
             return messages.TOKEN_NOT_FOUND
 
         response.raise_for_status()
-        data = response.json()
+        data = jsonlib.loads(response.content)
 
         update_time = data.get("updatetime")
         update_str = datetime.datetime.utcfromtimestamp(update_time).strftime('%Y-%m-%d %H:%M:%S') if update_time else "N/A"
@@ -691,36 +693,47 @@ def retrieve_token_info(mint_address: str) -> tuple[str, str] | str:
 
         return final_message, data.get("logoUrl")
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return (str.format(messages.NETWORK_ERROR,e))
     except Exception as e:
         return (str.format(messages.UNEXPECTED_ERROR,e))
 
 
-def retrieve_token_ohlcv_data(mint_address: str, resolution: str, start_date: str, end_date: str) -> str:
+async def retrieve_token_ohlcv_data(mint_address: str, resolution: str, start_date: str, end_date: str,
+                                   cursor: Optional[int] = None) -> Tuple[str, Optional[int]]:
     """
-    Fetch and format OHLCV (Open, High, Low, Close, Volume) candlestick data for a given token over a date range.
+    Fetch and format one page of OHLCV (Open, High, Low, Close, Volume) candles for a given token.
 
-    Queries Vybe Network API for OHLCV data at the specified resolution (e.g., 1m, 1h, 1d)
-    between the provided start and end dates. Returns a formatted summary of the first 10 data points.
+    Rather than downloading every candle between the start and end dates, only a window
+    of about `OHLCV_PAGE_SIZE` candles at the requested resolution is requested, starting
+    at `cursor` (or at the start date for the first page). Windows that come back short,
+    e.g. because the token did not trade, are followed by doubling windows, at most
+    `preferences.OHLCV_MAX_WINDOWS` of them per page; the last one reaches the end date.
 
     Args:
         mint_address (str):
-            The public mint address of the token (42–46 alphanumeric characters).
+            The public mint address of the token (base58-encoded Solana address).
         resolution (str):
             The desired candle resolution (must be one of: '1m', '5m', '1h', '1d', etc.).
         start_date (str):
             Start date in 'YYYY-MM-DD' format.
         end_date (str):
             End date in 'YYYY-MM-DD' format (must be after start_date).
+        cursor (int, optional):
+            Unix timestamp to continue from, as returned for the previous page.
 
     Returns:
-        str:
-            - A formatted string summarizing OHLCV data.
-            - An error message if validation fails, data is unavailable, or a request error occurs.
+        Tuple[str, Optional[int]]:
+            - The formatted page of OHLCV data, or an error message if validation fails,
+              data is unavailable, or a request error occurs.
+            - The cursor for the next page, or None if this was the last one.
 
     Raises:
-        requests.exceptions.RequestException:
+        httpx.HTTPError:
             If a network-related error occurs during the API call.
         json.JSONDecodeError:
             If the API response is not valid JSON.
@@ -728,54 +741,52 @@ def retrieve_token_ohlcv_data(mint_address: str, resolution: str, start_date: st
             For any unexpected error during data processing.
 
     Example:
-        >>> retrieve_token_ohlcv_data('So11111111111111111111111111111111111111112', '1d', '2025-01-01', '2025-01-10')
-        📈 *Token OHLCV Data* (1d candles)
-        🗓️ *Range:* 2025-01-01 → 2025-01-10
-        🕒 *Time:* 2025-01-01 00:00:00
-        🔓 Open: 95.23
-        📈 High: 96.50
-        📉 Low: 94.80
-        🔒 Close: 95.90
-        📦 Volume: 1234
-        💵 Volume (USD): 117000
-        🧾 Count: 430
-        ────────────────────────────
-
-    Notes:
-        - Only the first 10 OHLCV entries are shown to avoid overly large messages.
-        - If start or end date formats are invalid, meaningful error messages are returned.
+        >>> retrieve_token_ohlcv_data('So11111111111111111111111111111111111111112', '1d', '2025-01-01', '2025-01-31')
+        ('📈 *Token OHLCV Data* (1d candles)\n🗓️ *Range:* 2025-01-01 → 2025-01-31 ...', 1736467201)
     """
-
-    valid_resolutions = ['1s', '1m', '3m', '5m', '15m', '30m', '1h', '2h', '3h', '4h', '1d', '1w', '1mo', '1y']
-
     if not evaluates.is_valid_mint(mint_address):
-        return messages.INVALID_MINT_ADDRESS
-    if resolution not in valid_resolutions:
-        return "❌ Invalid resolution! Choose from: " + ", ".join(valid_resolutions)
+        return messages.INVALID_MINT_ADDRESS, None
+    if resolution not in OHLCV_RESOLUTION_SECONDS:
+        return "❌ Invalid resolution! Choose from: " + ", ".join(OHLCV_RESOLUTION_SECONDS), None
 
     start_ts = datetime.full_datetime_to_unix(start_date)
     end_ts = datetime.full_datetime_to_unix(end_date)
 
     if not start_ts:
-        return messages.INVALID_START_DATE
+        return messages.INVALID_START_DATE, None
     if not end_ts or end_ts <= start_ts:
-        return messages.INVALID_END_DATE
-
-    url = str.format(urls.TOKEN_OHLCV_URL, mint_address,resolution,start_ts,end_ts)
+        return messages.INVALID_END_DATE, None
 
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=250)
-        response.raise_for_status()
-        data = response.json().get("data", [])
-
-        if not data:
-            return messages.NO_OHLCV_FOUND
+        window_start = cursor or start_ts
+        window = OHLCV_PAGE_SIZE * OHLCV_RESOLUTION_SECONDS[resolution]
+        candles = []
+        for attempt in range(preferences.OHLCV_MAX_WINDOWS):
+            # The last window runs to the end date so a long gap is never mistaken for no data.
+            last = attempt == preferences.OHLCV_MAX_WINDOWS - 1
+            window_end = end_ts if last else min(end_ts, window_start + window)
+            response = await client.vybe.token_ohlcv(mint_address, resolution, window_start, window_end)
+            response.raise_for_status()
+            data = jsonlib.loads(response.content).get("data", [])
+            candles += sorted((item for item in data if window_start <= item["time"] <= window_end),
+                              key=lambda item: item["time"])
+            if len(candles) >= OHLCV_PAGE_SIZE or window_end >= end_ts:
+                break
+            window_start = window_end + 1
+            window *= 2
+
+        page = candles[:OHLCV_PAGE_SIZE]
+        if not page:
+            return (messages.NO_MORE_OHLCV if cursor else messages.NO_OHLCV_FOUND), None
+        next_cursor = page[-1]["time"] + 1
+        if next_cursor > end_ts or (window_end >= end_ts and len(candles) <= OHLCV_PAGE_SIZE):
+            next_cursor = None
 
         output = [
             str.format(messages.TOKEN_OHLCV_HEADER,resolution, start_date, end_date)
         ]
 
-        for item in data[:10]:
+        for item in page:
             time_str = datetime.datetime.utcfromtimestamp(item["time"]).strftime('%Y-%m-%d %H:%M:%S')
             output.append(
                 str.format(messages.TOKEN_OHLCV_ITEM,
@@ -790,14 +801,18 @@ def retrieve_token_ohlcv_data(mint_address: str, resolution: str, start_date: st
                 )
             )
 
-        return "\n".join(output)
+        return "\n".join(output), next_cursor
 
-    except requests.exceptions.RequestException as e:
-        return (str.format(messages.NETWORK_ERROR,e))
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE, None
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR, None
+    except httpx.HTTPError as e:
+        return (str.format(messages.NETWORK_ERROR,e)), None
     except Exception as e:
-        return (str.format(messages.UNEXPECTED_ERROR,e))
+        return (str.format(messages.UNEXPECTED_ERROR,e)), None
 
-def retrieve_top_token_holders(mint_address: str, sort_criteria: str, sort_order: str, limit: int) -> str:
+async def retrieve_top_token_holders(mint_address: str, sort_criteria: str, sort_order: str, limit: int) -> str:
     """
     Fetch and format a ranked list of the top token holders for a given mint address.
 
@@ -806,7 +821,7 @@ def retrieve_top_token_holders(mint_address: str, sort_criteria: str, sort_order
 
     Args:
         mint_address (str):
-            The public mint address of the token (42–46 alphanumeric characters).
+            The public mint address of the token (base58-encoded Solana address).
         sort_criteria (str):
             Field to sort by ('rank', 'ownerName', 'ownerAddress', 'valueUsd', 'balance', or 'percentageOfSupplyHeld').
         sort_order (str):
@@ -820,7 +835,7 @@ def retrieve_top_token_holders(mint_address: str, sort_criteria: str, sort_order
             no data is found, or a network error occurs.
 
     Raises:
-        requests.exceptions.RequestException:
+        httpx.HTTPError:
             If a network-related error occurs during the API call.
         json.JSONDecodeError:
             If the API response cannot be parsed as valid JSON.
@@ -858,12 +873,11 @@ def retrieve_top_token_holders(mint_address: str, sort_criteria: str, sort_order
 
     if limit <= 0:
         return messages.INVALID_LIMIT
-    url = str.format(urls.TOP_TOKEN_HOLDERS_URL, mint_address,limit,sort_criteria,sort_order.capitalize())
 
     try:
-        response = requests.get(url, headers=preferences.headers, timeout=250)
+        response = await client.vybe.top_token_holders(mint_address, limit, sort_criteria, sort_order.capitalize())
         response.raise_for_status()
-        data = response.json().get("data", [])
+        data = jsonlib.loads(response.content).get("data", [])
 
         if not data:
             return "⚠️ No holders data found for this token."
@@ -884,84 +898,43 @@ def retrieve_top_token_holders(mint_address: str, sort_criteria: str, sort_order
 
         return "\n".join(output)
 
-    except requests.exceptions.RequestException as e:
+    except (breaker.CircuitOpenError, ratelimit.RateLimited):
+        return messages.SERVICE_UNAVAILABLE
+    except httpx.TimeoutException:
+        return messages.TIMEOUT_ERROR
+    except httpx.HTTPError as e:
         return (str.format(messages.NETWORK_ERROR,e))
     except json.JSONDecodeError:
         return messages.JSON_ERROR
     except Exception as e:
         return (str.format(messages.UNEXPECTED_ERROR,e))
 
-def retrieve_program_info(address: str) -> str | None:
-    """
-    Retrieve the friendly or entity name of a program given its address.
-
-    Queries the Vybe Network API to fetch program metadata.
-    Returns the program's friendly name if available, otherwise falls back
-    to the entity name or returns the address itself. Returns None if an error occurs.
-
-    Args:
-        address (str):
-            The public program address (42–46 alphanumeric characters).
-
-    Returns:
-        Union[str, None]:
-            - The friendly name, entity name, or the address itself if available.
-            - None if the request fails or if an unexpected error occurs.
-
-    Raises:
-        requests.exceptions.RequestException:
-            If a network-related error occurs during the API call.
-        Exception:
-            For any unexpected errors during API communication.
-
-    Example:
-        >>> retrieve_program_info('9xjT3kghPz...')
-        'Orca'
-
-    Notes:
-        - If the program metadata contains a 'friendlyName', it will be prioritized.
-        - If not, 'entityName' is used.
-        - If neither exists, the address itself is returned as fallback.
-        - Safe to call even if the program does not exist (returns None on error).
-    """
-    url = str.format(urls.PROGRAM_DETAILS_URL,address)
-    try:
-        res = requests.get(
-            url,
-            headers=preferences.headers,
-            timeout=250
-        )
-        if res.ok:
-            data = res.json()
-            return data.get("friendlyName") or data.get("entityName") or address
-    except Exception:
-        return None
-def fetch_tvl_data(address: str, resolution: str) -> list:
+async def fetch_tvl_data(address: str, resolution: str) -> list:
     """
     Fetch Total Value Locked (TVL) time-series data for a given program address.
 
     Queries the Vybe Network API to retrieve historical TVL measurements
     based on the specified resolution (e.g., hourly, daily).
-    Returns a list of TVL data points, or an empty list if the request fails.
+    Returns a list of TVL data points, or an empty list if the program has no TVL data.
 
     Args:
         address (str):
-            The public address of the program (42–46 alphanumeric characters).
+            The public address of the program (base58-encoded Solana address).
         resolution (str):
             Time resolution for the data points (e.g., '1h', '1d', '7d').
 
     Returns:
         list:
             A list of TVL data points (each item typically contains timestamp and TVL values),
-            or an empty list if an error occurs during the request.
+            or an empty list if the API reports the program or resolution as invalid.
 
     Raises:
-        requests.exceptions.RequestException:
-            If a network-related error occurs during the API call.
+        breaker.CircuitOpenError, ratelimit.RateLimited:
+            If the endpoint is unavailable or rate limited right now.
+        httpx.HTTPError:
+            If a network-related error or timeout occurs during the API call.
         json.JSONDecodeError:
             If the API response is not valid JSON.
-        Exception:
-            For any unexpected errors during data parsing.
 
     Example:
         >>> fetch_tvl_data('9xjT3kghPz...', '1d')
@@ -971,15 +944,11 @@ def fetch_tvl_data(address: str, resolution: str) -> list:
         - If the program is invalid or there is no available data, the function returns an empty list.
         - Resolution must match supported intervals by Vybe Network ('1h', '1d', etc.).
     """
-    url = str.format(urls.PROGRAM_TVL, address, resolution)
-
-    try:
-        res = requests.get(
-            url,
-            headers=preferences.headers,
-            timeout=250
-        )
-        res.raise_for_status()
-        return res.json().get("data", [])
-    except Exception:
-        return []
\ No newline at end of file
+    if not evaluates.is_valid_address(address):
+        return []
+
+    res = await client.vybe.program_tvl(address, resolution)
+    if res.status_code in (400, 403, 404):
+        return []
+    res.raise_for_status()
+    return jsonlib.loads(res.content).get("data", [])
\ No newline at end of file
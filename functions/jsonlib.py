@@ -0,0 +1,39 @@
+"""
+JSON decoding for Vybe API payloads.
+
+Uses `orjson` when it is installed (pip install orjson), which decodes large payloads
+such as token balances, top holders and time series several times faster than the
+standard library, and falls back to `json` otherwise. `preferences.JSON_DECODER` can
+force either backend.
+"""
+import json
+import globals.preferences as preferences
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if preferences.JSON_DECODER == "orjson" and orjson is None:
+    raise ImportError('JSON_DECODER is "orjson" but orjson is not installed')
+
+BACKEND = "orjson" if orjson is not None and preferences.JSON_DECODER != "json" else "json"
+
+
+def loads(data):
+    """
+    Decode a JSON document.
+
+    Args:
+        data (bytes | str): The raw JSON, e.g. `response.content`.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If `data` is not valid JSON, with either backend
+            (orjson.JSONDecodeError is a subclass).
+    """
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,101 @@
+"""
+Pool of Vybe API keys.
+
+Requests are spread over all configured keys with smooth weighted round-robin, so the
+bot's throughput is the sum of the keys' quotas rather than a single key's. A key that
+gets rate-limited sits out for the delay the API asked for, and usage and 429 counts
+are kept per key for monitoring.
+"""
+import time
+from typing import List, Optional, Sequence, Tuple, Union
+
+
+class ApiKey:
+    """
+    One API key with its weight and usage counters.
+    """
+
+    def __init__(self, value: str, weight: int = 1):
+        self.value = value
+        self.weight = weight
+        self.label = f"…{value[-4:]}"
+        self.uses = 0
+        self.throttled = 0
+        self.remaining: Optional[int] = None
+        self.cooldown_until = 0.0
+        self.last_limited = 0.0
+        self._current = 0
+
+    def cooling(self, now: float) -> bool:
+        return self.cooldown_until > now
+
+
+class KeyPool:
+    """
+    Weighted round-robin over API keys that skips keys cooling down after a 429.
+
+    Keys are given either as plain strings or as `(key, weight)` pairs; a key with weight
+    2 is picked twice as often as one with weight 1. When every key is cooling down,
+    the least recently limited one is used anyway so requests still go out.
+    """
+
+    def __init__(self, keys: Sequence[Union[str, Tuple[str, int]]]):
+        self.keys: List[ApiKey] = [ApiKey(*key) if isinstance(key, tuple) else ApiKey(key) for key in keys]
+        if not self.keys:
+            raise ValueError("At least one API key is required")
+
+    def acquire(self, exclude: Optional[ApiKey] = None) -> Optional[ApiKey]:
+        """
+        Pick the key for the next request.
+
+        With `exclude`, only a usable key other than `exclude` is picked, e.g. for a
+        hedged request that must not spend the primary key's quota; None is returned
+        when there is no such key.
+        """
+        now = time.monotonic()
+        available = [key for key in self.keys if not key.cooling(now) and key is not exclude]
+        if not available:
+            if exclude is not None:
+                return None
+            chosen = min(self.keys, key=lambda key: key.last_limited)
+        else:
+            for key in available:
+                key._current += key.weight
+            chosen = max(available, key=lambda key: (key._current, -key.last_limited))
+            chosen._current -= sum(key.weight for key in available)
+        chosen.uses += 1
+        return chosen
+
+    def limited(self, key: ApiKey, seconds: float) -> None:
+        """
+        Take `key` out of rotation for `seconds` after the API rate-limited it.
+        """
+        now = time.monotonic()
+        key.throttled += 1
+        key.last_limited = now
+        key.cooldown_until = max(key.cooldown_until, now + seconds)
+
+    def observe(self, key: ApiKey, remaining: Optional[str]) -> None:
+        """
+        Record the quota left on `key`, as reported by the API, if any.
+        """
+        if remaining is not None and remaining.isdigit():
+            key.remaining = int(remaining)
+
+    def next_available_in(self) -> float:
+        """
+        Return the seconds until some key is usable again, 0 if one is usable now.
+        """
+        now = time.monotonic()
+        return max(0.0, min(key.cooldown_until for key in self.keys) - now)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        metrics = {}
+        for key in self.keys:
+            metrics[f"keys.{key.label}.uses"] = key.uses
+            metrics[f"keys.{key.label}.throttled"] = key.throttled
+            metrics[f"keys.{key.label}.cooling"] = round(max(0.0, key.cooldown_until - now), 1)
+            if key.remaining is not None:
+                metrics[f"keys.{key.label}.remaining"] = key.remaining
+        return metrics
@@ -0,0 +1,74 @@
+"""
+Speculative cache warming for multi-step flows.
+
+As soon as a flow knows which wallet or program the user is asking about, the data its
+final answer will need is requested in the background, while the user is still
+answering the remaining prompts. The results land in the API client's cache (and the
+program registry), so the final answer is often served without waiting on the network.
+Only requests the final answer actually makes are warmed; token flows (OHLCV, holders,
+volume) depend on parameters that are only known at the last prompt, so they are not.
+
+Prefetches only use rate-limit tokens that are free right away (see
+`ratelimit.opportunistic()`), so they never hold up interactive requests, run outside
+the update's deadline budget, and are deduplicated: warming the same thing twice while the first attempt is still
+running is a no-op. Failures are ignored; the real request will simply go upstream.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict
+import functions.client as client
+import functions.deadline as deadline
+import functions.ratelimit as ratelimit
+import functions.registry as registry
+import globals.preferences as preferences
+
+
+class Prefetcher:
+    """
+    Bounded set of deduplicated background warm-up tasks.
+    """
+
+    def __init__(self, max_tasks: int):
+        self.max_tasks = max_tasks
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.started = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def warm(self, name: str, factory: Callable[[], Awaitable]) -> None:
+        """
+        Run `factory()` in the background unless `name` is already being warmed.
+        """
+        if not preferences.PREFETCH_ENABLED or name in self._tasks:
+            return
+        if len(self._tasks) >= self.max_tasks:
+            self.skipped += 1
+            return
+        task = asyncio.ensure_future(self._run(factory))
+        self._tasks[name] = task
+        self.started += 1
+        task.add_done_callback(lambda done: self._tasks.pop(name, None))
+
+    async def _run(self, factory: Callable[[], Awaitable]) -> None:
+        with deadline.unbounded(), ratelimit.opportunistic():
+            try:
+                await factory()
+            except Exception:
+                self.failed += 1
+
+    def program(self, program_address: str) -> None:
+        self.warm(f"program:{program_address}", lambda: registry.programs.get(program_address))
+
+    def wallet_pnl(self, wallet_address: str) -> None:
+        days = preferences.PREFETCH_PNL_DAYS
+        self.warm(f"pnl:{wallet_address}:{days}", lambda: client.vybe.wallet_pnl(wallet_address, days))
+
+    def stats(self) -> dict:
+        return {
+            "prefetch.in_flight": len(self._tasks),
+            "prefetch.started": self.started,
+            "prefetch.skipped": self.skipped,
+            "prefetch.failed": self.failed,
+        }
+
+
+prefetcher = Prefetcher(preferences.PREFETCH_MAX_TASKS)
@@ -0,0 +1,211 @@
+"""
+Client-side rate limiting for the Vybe API.
+
+All upstream calls take a token from a shared token bucket before going out, so bursts
+are smoothed locally instead of being rejected by the API with 429s. Callers that find
+the bucket empty queue for a short while, and queued interactive requests are always
+served before background work, while opportunistic work such as prefetching never
+queues at all. `Retry-After` answers from the API pause the bucket and lower its rate,
+which then recovers gradually as requests succeed again.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, Optional
+import httpx
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+_priority: ContextVar[str] = ContextVar("priority", default=INTERACTIVE)
+_queue: ContextVar[bool] = ContextVar("queue", default=True)
+
+
+class RateLimited(httpx.HTTPError):
+    """Raised when a request could not get through the rate limit in time."""
+
+    def __init__(self, message: str = "Rate limit exceeded"):
+        super().__init__(message)
+
+
+@contextmanager
+def background():
+    """
+    Run the block's upstream calls at background priority.
+    """
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@contextmanager
+def opportunistic():
+    """
+    Run the block's upstream calls at background priority, taking only tokens that are
+    free right now: instead of queueing for a token, a call fails with `RateLimited`.
+    """
+    priority, queue = _priority.set(BACKGROUND), _queue.set(False)
+    try:
+        yield
+    finally:
+        _queue.reset(queue)
+        _priority.reset(priority)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Return the delay requested by a response's `Retry-After` header, in seconds.
+
+    Both the delta-seconds and the HTTP-date forms are understood. Returns None if the
+    header is missing or malformed.
+    """
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket with prioritized waiting and adaptive rate.
+
+    Tokens refill at `rate` per second up to `capacity`. A caller that finds no token,
+    or finds other callers of the same or higher priority already waiting, joins the
+    queue for its priority class. Queues are drained strictly in `PRIORITIES` order.
+
+    `penalize()` pauses the bucket for the delay the API asked for and halves the rate.
+    Every successful request afterwards gives back `recovery` tokens per second of rate,
+    up to the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: float, max_wait: Dict[str, float],
+                 min_rate: float = 0.5, recovery: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {priority: deque() for priority in PRIORITIES}
+        self._drainer: Optional[asyncio.Task] = None
+        self.waited = 0
+        self.rejected = 0
+        self.throttled = 0
+
+    async def acquire(self, priority: Optional[str] = None) -> None:
+        """
+        Take one token, waiting in line for it if necessary.
+
+        Args:
+            priority (str, optional): One of `PRIORITIES`. Defaults to the priority of the
+                current context, see `background()`.
+
+        Raises:
+            RateLimited: If no token became available within the priority's maximum wait,
+                or none was free right away inside `opportunistic()`.
+        """
+        if not _queue.get():
+            if self.try_acquire():
+                return
+            self.rejected += 1
+            raise RateLimited()
+        priority = priority or current_priority()
+        self._refill()
+        ahead = any(self._waiters[level] for level in PRIORITIES[:PRIORITIES.index(priority) + 1])
+        if not ahead and self._tokens >= 1 and time.monotonic() >= self._paused_until:
+            self._tokens -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        self.waited += 1
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.ensure_future(self._drain())
+        try:
+            await asyncio.wait_for(future, self.max_wait.get(priority))
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise RateLimited() from None
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token only if one is free right now and nobody is waiting for it.
+        """
+        self._refill()
+        if any(self._waiters.values()) or self._tokens < 1 or time.monotonic() < self._paused_until:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _drain(self) -> None:
+        while True:
+            for priority in PRIORITIES:
+                queue = self._waiters[priority]
+                while queue and queue[0].done():
+                    queue.popleft()
+            waiting = next((self._waiters[priority] for priority in PRIORITIES if self._waiters[priority]), None)
+            if waiting is None:
+                return
+            self._refill()
+            now = time.monotonic()
+            delay = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            self._tokens -= 1
+            waiting.popleft().set_result(None)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Back off after the API answered 429, pausing for `seconds` and halving the rate.
+        """
+        self.throttled += 1
+        self._refill()
+        self._tokens = 0
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.rate = max(self.min_rate, self.rate / 2)
+
+    def succeeded(self) -> None:
+        """
+        Let the rate creep back up after a successful request.
+        """
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.recovery)
+
+    def stats(self) -> dict:
+        self._refill()
+        return {
+            "ratelimit.rate": round(self.rate, 2),
+            "ratelimit.tokens": round(self._tokens, 2),
+            "ratelimit.paused": round(max(0.0, self._paused_until - time.monotonic()), 1),
+            **{f"ratelimit.queued.{priority}": len(self._waiters[priority]) for priority in PRIORITIES},
+            "ratelimit.waited": self.waited,
+            "ratelimit.rejected": self.rejected,
+            "ratelimit.throttled": self.throttled,
+        }
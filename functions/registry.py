@@ -0,0 +1,77 @@
+"""
+Program metadata registry.
+
+Every Program flow (Details, Top Wallets, Active Users, Transactions and TVL) needs the
+same program document from the Vybe API. The registry parses it once per response and
+shares the metadata between all handlers and charts. Fetching, coalescing, caching and
+negative caching are left to the API client, so its PROGRAM_DETAILS cache is the only
+one deciding how long a program document is reused.
+"""
+import math
+from typing import List, NamedTuple, Optional
+import functions.cache as cache
+import functions.client as client
+import functions.jsonlib as jsonlib
+import globals.preferences as preferences
+
+
+class ProgramMetadata(NamedTuple):
+    address: str
+    name: str
+    entity_name: str
+    labels: List[str]
+    logo_url: str
+    details: dict
+
+
+class ProgramRegistry:
+    """
+    Parsed program metadata, keyed by program address.
+
+    Each entry remembers the client response it was parsed from and is reused for as
+    long as the client keeps returning that same cached response. Programs the API
+    reports as invalid or inaccessible (400, 403, 404) resolve to None.
+    """
+
+    def __init__(self, max_entries: int):
+        self._programs = cache.ResponseCache(max_entries, 0, name="programs")
+
+    async def get(self, program_address: str) -> Optional[ProgramMetadata]:
+        """
+        Return the metadata of a program, fetching it from the Vybe API if needed.
+
+        Args:
+            program_address (str): The program's public address.
+
+        Returns:
+            ProgramMetadata | None: The program metadata, or None if the program is not accessible.
+
+        Raises:
+            httpx.HTTPError: If a network-related error occurs.
+            json.JSONDecodeError: If the API response is not valid JSON.
+        """
+        response = await client.vybe.program_details(program_address)
+        parsed = self._programs.get(program_address)
+        if parsed is not None and parsed[0] is response:
+            return parsed[1]
+        if response.status_code in [400, 403, 404]:
+            return None
+        response.raise_for_status()
+        data = jsonlib.loads(response.content)
+
+        metadata = ProgramMetadata(
+            address=program_address,
+            name=data.get("friendlyName") or data.get("name") or data.get("entityName") or program_address,
+            entity_name=data.get("entityName", "N/A"),
+            labels=data.get("labels") or [],
+            logo_url=data.get("logoUrl", "N/A"),
+            details=data,
+        )
+        self._programs.set(program_address, (response, metadata), math.inf)
+        return metadata
+
+    def stats(self) -> dict:
+        return self._programs.stats()
+
+
+programs = ProgramRegistry(preferences.PROGRAM_REGISTRY_MAX_ENTRIES)
@@ -0,0 +1,79 @@
+"""
+Concurrent update processing with per-chat ordering.
+
+Updates from different chats are handled in parallel, up to a global cap, while
+updates from the same chat still run strictly one after another in arrival order.
+The multi-step `awaiting_*` flows in `handlers.py` rely on that ordering: a user's next
+answer must not be processed before the previous one has updated their state.
+"""
+import asyncio
+from typing import Any, Awaitable, Dict, List
+from telegram.ext import BaseUpdateProcessor
+import globals.preferences as preferences
+
+
+# Size of the base class semaphore. `BaseUpdateProcessor.process_update` is final and
+# holds a slot of it around `do_process_update`, where updates may wait on their chat's
+# lock, so it must never be what limits concurrency.
+_BASE_SLOTS = 2 ** 16
+
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """
+    Update processor that serializes updates per chat and caps overall concurrency.
+
+    Each update first queues on its chat's lock and only then takes one of the
+    `max_workers` slots, so updates waiting behind a slow update from the same chat
+    never hold a slot another chat could use. Chat locks are dropped as soon as no
+    update for that chat is queued or running.
+    """
+
+    def __init__(self, max_workers: int):
+        super().__init__(_BASE_SLOTS)
+        self.max_workers = max_workers
+        self._slots = asyncio.BoundedSemaphore(max_workers)
+        self._chats: Dict[int, List] = {}
+        self._running = 0
+        self.processed = 0
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        chat = getattr(update, "effective_chat", None)
+        if chat is None:
+            await self._run(coroutine)
+            return
+        entry = self._chats.setdefault(chat.id, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                await self._run(coroutine)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._chats[chat.id]
+
+    async def _run(self, coroutine: Awaitable[Any]) -> None:
+        async with self._slots:
+            self._running += 1
+            try:
+                await coroutine
+            finally:
+                self._running -= 1
+                self.processed += 1
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "updates.max_concurrent": self.max_workers,
+            "updates.running": self._running,
+            "updates.active_chats": len(self._chats),
+            "updates.queued": max(0, sum(users for _, users in self._chats.values()) - self._running),
+            "updates.processed": self.processed,
+        }
+
+
+processor = ChatOrderedUpdateProcessor(preferences.UPDATE_WORKERS)
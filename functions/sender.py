@@ -0,0 +1,207 @@
+"""
+Outbound queue for Telegram replies.
+
+Every reply goes through token buckets before it is sent: one per chat and one shared
+by the whole bot, sized below Telegram's flood limits. Replies that would exceed them
+wait their turn instead of failing. When Telegram still answers with `RetryAfter`,
+that chat's bucket pauses for the requested time, and so does the global one when the
+wait is longer than the chat's own send interval, before the reply is sent again.
+Long texts are split by `chunker.split`, and consecutive chunks are merged into as
+few messages as fit. Results past `preferences.SEND_DOCUMENT_THRESHOLD` characters
+go out as a single document upload with a short summary message instead.
+"""
+import csv
+import io
+from typing import Any, Awaitable, Callable, Hashable, Iterable, List, Optional, Sequence, Union
+from telegram import Message
+from telegram.error import RetryAfter
+import constants.messages as messages
+import functions.cache as cache
+import functions.chunker as chunker
+import functions.ratelimit as ratelimit
+import globals.preferences as preferences
+
+MAX_MESSAGE_LENGTH = 4096
+
+
+class SendQueue:
+    """
+    Per-chat and global rate limiting for outgoing messages with `RetryAfter` handling.
+
+    Per-chat buckets are created on demand and forgotten after sitting idle for
+    `preferences.SEND_CHAT_IDLE_TTL` seconds, by which time they would be full again.
+    """
+
+    def __init__(self):
+        self._global = ratelimit.TokenBucket(preferences.SEND_GLOBAL_PER_SECOND, preferences.SEND_GLOBAL_BURST, {})
+        self._chats = cache.ResponseCache(preferences.SEND_MAX_CHATS, 0, name="sender.chats")
+        self.sent = 0
+        self.retried = 0
+        self.merged = 0
+        self.documents = 0
+
+    def _chat_bucket(self, chat_id: Hashable) -> ratelimit.TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = ratelimit.TokenBucket(preferences.SEND_CHAT_PER_SECOND, preferences.SEND_CHAT_BURST, {})
+        self._chats.set(chat_id, bucket, preferences.SEND_CHAT_IDLE_TTL)
+        return bucket
+
+    async def send(self, chat_id: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Wait for a send slot in `chat_id`, then run `call()`.
+
+        Args:
+            chat_id (Hashable): The chat the message goes to.
+            call (Callable): Zero-argument function performing the Bot API call.
+
+        Returns:
+            Any: What `call()` returned, normally the sent `Message`.
+
+        Raises:
+            RetryAfter: If Telegram still refuses after `preferences.SEND_RETRIES` retries.
+        """
+        bucket = self._chat_bucket(chat_id)
+        for attempt in range(preferences.SEND_RETRIES + 1):
+            await bucket.acquire()
+            await self._global.acquire()
+            try:
+                result = await call()
+            except RetryAfter as e:
+                if attempt == preferences.SEND_RETRIES:
+                    raise
+                self.retried += 1
+                delay = e.retry_after
+                seconds = delay.total_seconds() if hasattr(delay, "total_seconds") else float(delay)
+                bucket.penalize(seconds)
+                if seconds > 1 / preferences.SEND_CHAT_PER_SECOND:
+                    # Longer than this chat's own pacing explains: the bot as a whole is
+                    # flooding, so every chat has to wait.
+                    self._global.penalize(seconds)
+                continue
+            bucket.succeeded()
+            self.sent += 1
+            return result
+
+    def stats(self) -> dict:
+        return {
+            "sender.sent": self.sent,
+            "sender.retried": self.retried,
+            "sender.merged": self.merged,
+            "sender.documents": self.documents,
+            "sender.chats": self._chats.stats()["sender.chats.entries"],
+            "sender.global_tokens": self._global.stats()["ratelimit.tokens"],
+        }
+
+
+queue = SendQueue()
+
+
+def merge_chunks(chunks: List[str]) -> List[str]:
+    """
+    Join consecutive text chunks into as few messages as fit in one Telegram message.
+    """
+    merged: List[str] = []
+    for chunk in chunks:
+        if merged and len(merged[-1]) + 1 + len(chunk) <= MAX_MESSAGE_LENGTH:
+            merged[-1] = merged[-1] + "\n" + chunk
+        else:
+            merged.append(chunk)
+    return merged
+
+
+async def _send_text(message: Message, text: str, **kwargs) -> Message:
+    return await queue.send(message.chat_id, lambda: message.reply_text(text, **kwargs))
+
+
+def _oversized(length: int) -> bool:
+    return bool(preferences.SEND_DOCUMENT_THRESHOLD) and length > preferences.SEND_DOCUMENT_THRESHOLD
+
+
+async def _reply_with_document(message: Message, summary: str, document: bytes, filename: str,
+                               lines: int, **kwargs) -> Message:
+    """
+    Send `summary` as a normal message followed by `document`, which gets any `reply_markup`.
+    """
+    reply_markup = kwargs.pop("reply_markup", None)
+    await _send_text(message, summary, **kwargs)
+    queue.documents += 1
+    return await reply_document(message, document, filename,
+                                caption=messages.DOCUMENT_CAPTION.format(lines),
+                                **({"reply_markup": reply_markup} if reply_markup else {}))
+
+
+async def reply_text(message: Message, text: str, filename: str = "result.txt", **kwargs) -> Message:
+    """
+    Send `text`, split into several messages by `chunker.split` when it is too long, or
+    as a document named `filename` once it exceeds `preferences.SEND_DOCUMENT_THRESHOLD`.
+    """
+    if len(text) > preferences.MESSAGE_CHUNK_LENGTH:
+        return await reply_chunks(message, text, filename=filename, **kwargs)
+    return await _send_text(message, text, **kwargs)
+
+
+async def reply_photo(message: Message, **kwargs) -> Message:
+    return await queue.send(message.chat_id, lambda: message.reply_photo(**kwargs))
+
+
+async def reply_document(message: Message, document: bytes, filename: str, **kwargs) -> Message:
+    return await queue.send(message.chat_id,
+                            lambda: message.reply_document(document=document, filename=filename, **kwargs))
+
+
+async def reply_chunks(message: Message, chunks: Union[str, List[str]], filename: str = "result.txt",
+                       **kwargs) -> Optional[Message]:
+    """
+    Send a text or a list of text chunks, splitting chunks that are too long and
+    merging consecutive ones that fit together.
+
+    Above `preferences.SEND_DOCUMENT_THRESHOLD` characters the text is instead sent as
+    one plain-text document named `filename`, preceded by a short summary message.
+    A `reply_markup` keyword is only attached to the last message.
+    """
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    markdown = kwargs.get("parse_mode") == "Markdown"
+    if _oversized(sum(len(chunk) for chunk in chunks)):
+        text = "\n".join(chunks)
+        summary = chunker.split(text, preferences.SEND_DOCUMENT_SUMMARY_LENGTH, markdown)[0]
+        document = (chunker.plain(text) if markdown else text).encode()
+        return await _reply_with_document(message, summary, document, filename, text.count("\n") + 1, **kwargs)
+    parts = [part for chunk in chunks for part in chunker.split(chunk, markdown=markdown)]
+    chunks = merge_chunks(parts)
+    queue.merged += len(parts) - len(chunks)
+    reply_markup = kwargs.pop("reply_markup", None)
+    sent = None
+    for index, chunk in enumerate(chunks):
+        last = index == len(chunks) - 1
+        sent = await _send_text(message, chunk, **kwargs, **({"reply_markup": reply_markup} if last and reply_markup else {}))
+    return sent
+
+
+async def reply_table(message: Message, text: str, summary: str, header: Sequence[str],
+                      rows: Iterable[Sequence[Any]], filename: str, **kwargs) -> Message:
+    """
+    Send a tabular result as `text`, or as a CSV document when `text` is too large.
+
+    Args:
+        message (Message): The message to reply to.
+        text (str): The full result, sent as is when it is small enough.
+        summary (str): Short message sent instead of `text` alongside the CSV document.
+        header (Sequence[str]): CSV column names.
+        rows (Iterable[Sequence[Any]]): CSV rows, written one at a time.
+        filename (str): Name of the CSV document.
+
+    Returns:
+        Message: The last message sent.
+    """
+    if not _oversized(len(text)):
+        return await reply_text(message, text, **kwargs)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return await _reply_with_document(message, summary, buffer.getvalue().encode(), filename, count, **kwargs)
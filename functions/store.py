@@ -0,0 +1,114 @@
+"""
+Persistent storage for cached Vybe API responses.
+
+Keeps a copy of every cached response in a local SQLite database so that a restarted
+bot can warm its in-memory cache instead of re-fetching everything from the Vybe API.
+Payloads are stored zlib-compressed together with their expiry metadata.
+"""
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from typing import List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class StoredResponse(NamedTuple):
+    key: str
+    url: str
+    status_code: int
+    content: bytes
+    expires_at: float
+    stale_until: float
+
+
+class ResponseStore:
+    """
+    SQLite-backed response store.
+
+    The connection is shared between threads and guarded by a lock, so `put()` and
+    `load()` can run in a worker thread via `asyncio.to_thread` without blocking the
+    event loop. Every `prune_every` writes, rows past their stale window are deleted
+    and only the `max_rows` longest-lived ones are kept, so the file stays bounded in a
+    long-running process just like the in-memory cache.
+    """
+
+    def __init__(self, path: str, max_rows: int, prune_every: int = 256):
+        self.max_rows = max_rows
+        self.prune_every = prune_every
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT NOT NULL, status_code INTEGER NOT NULL, "
+            "content BLOB NOT NULL, expires_at REAL NOT NULL, stale_until REAL NOT NULL)"
+        )
+        self._db.commit()
+        self.writes = 0
+        self.loaded = 0
+        self.pruned = 0
+
+    def put(self, response: StoredResponse) -> None:
+        """
+        Insert or replace a response. Storage errors are logged and otherwise ignored.
+        """
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (response.key, response.url, response.status_code, zlib.compress(response.content),
+                     response.expires_at, response.stale_until),
+                )
+                self.writes += 1
+                if self.writes % self.prune_every == 0:
+                    self._prune()
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning("Could not persist %s: %s", response.url, e)
+
+    def load(self) -> List[StoredResponse]:
+        """
+        Delete responses past their stale window and return the remaining ones.
+
+        Returns:
+            List[StoredResponse]: Responses that are still fresh or servable stale.
+        """
+        with self._lock:
+            self._prune()
+            self._db.commit()
+            rows = self._db.execute(
+                "SELECT key, url, status_code, content, expires_at, stale_until FROM responses"
+            ).fetchall()
+        responses = [
+            StoredResponse(key, url, status_code, zlib.decompress(content), expires_at, stale_until)
+            for key, url, status_code, content, expires_at, stale_until in rows
+        ]
+        self.loaded = len(responses)
+        return responses
+
+    def _prune(self) -> None:
+        """
+        Delete expired rows and all but the `max_rows` longest-lived ones. Call with the lock held.
+        """
+        cursor = self._db.execute("DELETE FROM responses WHERE stale_until <= ?", (time.time(),))
+        self.pruned += cursor.rowcount
+        cursor = self._db.execute(
+            "DELETE FROM responses WHERE key NOT IN "
+            "(SELECT key FROM responses ORDER BY stale_until DESC LIMIT ?)",
+            (self.max_rows,),
+        )
+        self.pruned += cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict:
+        return {
+            "store.loaded": self.loaded,
+            "store.writes": self.writes,
+            "store.pruned": self.pruned,
+        }
@@ -0,0 +1,163 @@
+"""
+Streaming reduction of large JSON API payloads.
+
+Some Vybe answers, such as the owner list of a big NFT collection, run to megabytes
+while the bot only shows a handful of entries. The reducers here consume the response
+body chunk by chunk, decode the items of its top-level array one at a time and keep only
+what is needed, so memory and CPU stay flat regardless of the payload size.
+"""
+import codecs
+import heapq
+import json
+from typing import Any, AsyncIterator, Iterator, List, Tuple
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n,"
+
+
+class ArrayItems:
+    """
+    Incremental parser for the items of one array member of a top-level JSON object.
+
+    Feed it the document in chunks of text; each call yields the array items that became
+    complete. Text before the array is scanned only for nesting and string boundaries, so
+    the same key inside a nested object or inside a string is not mistaken for it, and
+    text after the array is ignored. The buffer never holds more than one unfinished item.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string: List[str] = []
+        # Progress towards `"key": [` at depth 1: None, "key" (the key was read) or ":".
+        self._match = None
+        self._buffer = ""
+        self._inside = False
+        self.done = False
+
+    def _seek(self, text: str) -> int:
+        """
+        Scan `text` for the start of the array; return the index just past its "[" or -1.
+        """
+        for index, ch in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and "".join(self._string) == self.key:
+                        self._match = "key"
+                    continue
+                if self._depth == 1 and len(self._string) <= len(self.key):
+                    self._string.append(ch)
+            elif ch in " \t\r\n":
+                continue
+            elif ch == ":" and self._match == "key":
+                self._match = ":"
+            elif ch == "[" and self._match == ":":
+                return index + 1
+            else:
+                self._match = None
+                if ch == '"':
+                    self._in_string = True
+                    self._string = []
+                elif ch in "{[":
+                    self._depth += 1
+                elif ch in "}]":
+                    self._depth -= 1
+        return -1
+
+    def feed(self, text: str) -> Iterator[Any]:
+        if self.done:
+            return
+        if not self._inside:
+            start = self._seek(text)
+            if start < 0:
+                return
+            self._inside = True
+            text = text[start:]
+        self._buffer += text
+        position = 0
+        buffer = self._buffer
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            if buffer[position] == "]":
+                self.done = True
+                break
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break
+            if end == len(buffer) or buffer[end] not in _WHITESPACE + "]":
+                # A number cut by the chunk boundary ("2" of "2.5") may still continue.
+                break
+            yield item
+            position = end
+        self._buffer = buffer[position:]
+
+    def close(self) -> None:
+        """
+        Check that the array, if the document had one, was complete.
+
+        Raises:
+            json.JSONDecodeError: If the document ended inside the array.
+        """
+        if self._inside and not self.done:
+            raise json.JSONDecodeError("Truncated JSON array", self._buffer, 0)
+
+
+class TopK:
+    """
+    Keep the `k` items of a payload's `array_key` array with the highest `field` value.
+
+    Ties keep the order in which the API listed the items. The reduced payload is the
+    JSON document `{array_key: [...top k, highest first...]}`.
+    """
+
+    def __init__(self, array_key: str, field: str, k: int):
+        self.array_key = array_key
+        self.field = field
+        self.k = k
+        self.key = f"top:{array_key}.{field}:{k}"
+
+    def _score(self, item: Any) -> float:
+        try:
+            return float(item.get(self.field, 0))
+        except (AttributeError, TypeError, ValueError):
+            return 0.0
+
+    async def reduce(self, chunks: AsyncIterator[bytes]) -> bytes:
+        """
+        Consume a response body and return the reduced JSON document.
+
+        Raises:
+            json.JSONDecodeError: If the body is not the expected JSON document.
+        """
+        parser = ArrayItems(self.array_key)
+        text = codecs.getincrementaldecoder("utf-8")()
+        heap: List[Tuple[float, int, Any]] = []
+        index = 0
+
+        def keep(items: Iterator[Any]) -> None:
+            nonlocal index
+            for item in items:
+                entry = (self._score(item), -index, item)
+                index += 1
+                if len(heap) < self.k:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+
+        async for chunk in chunks:
+            keep(parser.feed(text.decode(chunk)))
+        keep(parser.feed(text.decode(b"", final=True)))
+        parser.close()
+        top = [item for _, _, item in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+        return json.dumps({self.array_key: top}).encode()
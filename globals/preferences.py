@@ -1,4 +1,166 @@
+import globals.urls as urls
+
 headers = {
     "accept": "application/json",
     "X-API-KEY": "YOUR_API_KEY"
-}
\ No newline at end of file
+}
+
+# Shared HTTP connection pool used for every Vybe API call.
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE_CONNECTIONS = 20
+POOL_KEEPALIVE_EXPIRY = 60
+# HTTP/2 needs the optional `h2` package (pip install "httpx[http2]"); falls back to HTTP/1.1 without it.
+HTTP2 = False
+
+# Time budget in seconds for handling one update, shared by all its API calls and chart renders.
+UPDATE_DEADLINE = 120
+# Extra seconds a handler gets after its budget to deliver the timeout message.
+DEADLINE_GRACE = 5
+# Upper bound in seconds for a single request to each endpoint.
+DEFAULT_TIMEOUT_CEILING = 60
+TIMEOUT_CEILINGS = {
+    urls.TOKEN_INFO_URL: 20,
+    urls.NFT_PORTFOLIO_URL: 20,
+    urls.WALLET_PNL_URL: 120,
+    urls.PROGRAM_ACTIVE_USERS_URL: 90,
+    urls.PROGRAM_TXS_URL: 90,
+    urls.DAILY_TOP_TOKEN_HOLDERS_URL: 90,
+    urls.TOKEN_VOLUME_URL: 90,
+    urls.TOKEN_BALANCE_CHART_URL: 90,
+}
+# Once an endpoint has enough latency samples, its timeout becomes p99 times the multiplier,
+# never lower than the floor and never higher than the endpoint's ceiling.
+LATENCY_WINDOW = 200
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 20
+ADAPTIVE_TIMEOUT_MULTIPLIER = 3
+ADAPTIVE_TIMEOUT_FLOOR = 5
+
+# Per-endpoint circuit breaker: once at least CIRCUIT_MIN_CALLS of the last CIRCUIT_WINDOW calls
+# were recorded and CIRCUIT_FAILURE_RATIO of them failed, returned a 5xx or took longer than
+# CIRCUIT_SLOW_CALL_SECONDS, the endpoint fails fast for CIRCUIT_RESET_TIMEOUT seconds before
+# a single probe request is let through.
+CIRCUIT_WINDOW = 20
+CIRCUIT_MIN_CALLS = 10
+CIRCUIT_FAILURE_RATIO = 0.5
+CIRCUIT_SLOW_CALL_SECONDS = 30
+CIRCUIT_RESET_TIMEOUT = 30
+
+# Vybe API keys to spread requests over, as "key" or ("key", weight) entries.
+# When empty, the single X-API-KEY from `headers` is used.
+API_KEYS = []
+
+# Client-side rate limit per API key: sustained requests per second and burst size.
+RATE_LIMIT_PER_SECOND = 5
+RATE_LIMIT_BURST = 10
+# Seconds a request may queue for a token before giving up, per priority class.
+RATE_LIMIT_MAX_WAIT = {"interactive": 10, "background": 60}
+# Retries after a 429 answer, and the pause in seconds when it carries no Retry-After header.
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_DEFAULT_BACKOFF = 5
+
+# Retries for transport errors and these statuses, with full-jitter exponential backoff
+# capped at RETRY_MAX_DELAY seconds.
+RETRY_ATTEMPTS = 2
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8
+RETRY_STATUSES = {502, 503, 504}
+# Interactive requests slower than the endpoint's p95 latency get a second, hedged request,
+# once HEDGE_MIN_SAMPLES latencies are known. Hedges are capped at this share of all requests.
+HEDGE_BUDGET = 0.05
+HEDGE_MIN_SAMPLES = 20
+
+# JSON decoder for API payloads: "auto" uses orjson when installed, "orjson" requires it, "json" forces the stdlib.
+JSON_DECODER = "auto"
+# Directory to save successful API response bodies to, e.g. for benchmarks/bench_json.py. None disables it.
+RECORD_PAYLOADS_DIR = None
+
+# Most fetch windows tried per OHLCV page when the token has gaps without candles.
+OHLCV_MAX_WINDOWS = 6
+
+# Warm the cache in the background once a multi-step flow knows its wallet or program.
+PREFETCH_ENABLED = True
+PREFETCH_MAX_TASKS = 64
+# The one PnL period (days) warmed as soon as the PnL flow knows the wallet; warming
+# every period would spend three requests to save one.
+PREFETCH_PNL_DAYS = 7
+
+# Longest message chunk sent; Telegram's hard limit is 4096 characters.
+MESSAGE_CHUNK_LENGTH = 4000
+# Results longer than this (characters) are sent as one CSV/TXT document instead of many
+# messages, after a summary of at most SEND_DOCUMENT_SUMMARY_LENGTH characters. 0 disables it.
+SEND_DOCUMENT_THRESHOLD = 12000
+SEND_DOCUMENT_SUMMARY_LENGTH = 800
+
+# Outgoing Telegram messages: bot-wide and per-chat rates kept below Telegram's flood limits.
+SEND_GLOBAL_PER_SECOND = 25
+SEND_GLOBAL_BURST = 30
+SEND_CHAT_PER_SECOND = 1
+SEND_CHAT_BURST = 3
+# Seconds an idle chat keeps its send bucket, and how many chats are tracked at once.
+SEND_CHAT_IDLE_TTL = 60
+SEND_MAX_CHATS = 10000
+# Times a reply is resent after Telegram answers with RetryAfter.
+SEND_RETRIES = 3
+
+# Parsed program metadata shared by all Program flows; freshness follows CACHE_TTLS.
+PROGRAM_REGISTRY_MAX_ENTRIES = 1024
+
+# Overall seconds to wait for the concurrent legs of a wallet portfolio summary.
+PORTFOLIO_DEADLINE = 20
+
+# Threads available for blocking work such as chart rendering.
+WORKER_THREADS = 4
+
+# Updates handled at the same time across all chats. Updates from one chat always run in order.
+UPDATE_WORKERS = 16
+
+# Webhook mode: set WEBHOOK_URL to the bot's public base URL (e.g. "https://bot.example.com") to
+# receive updates on an embedded server instead of long polling. Telegram sends WEBHOOK_SECRET
+# with every update and requests without it are rejected; if it is None a random secret is
+# generated at each start. Needs python-telegram-bot[webhooks].
+WEBHOOK_URL = None
+WEBHOOK_LISTEN = "0.0.0.0"
+WEBHOOK_PORT = 8443
+WEBHOOK_PATH = "telegram"
+WEBHOOK_SECRET = None
+# Alternative Bot API server, e.g. "http://127.0.0.1:8081/bot" for tools/fake_telegram.py. None uses Telegram's.
+TELEGRAM_BASE_URL = None
+
+# Telegram user IDs allowed to use the /stats command.
+ADMIN_IDS = set()
+
+# Seconds a successful response stays in the in-memory cache, per endpoint.
+# Endpoints missing from this mapping are never cached.
+CACHE_TTLS = {
+    urls.PROGRAM_DETAILS_URL: 3600,
+    urls.COLLECTION_URL: 600,
+    urls.TOKEN_INFO_URL: 300,
+    urls.TOP_ACTIVE_WALLETS_URL: 300,
+    urls.DAILY_TOP_TOKEN_HOLDERS_URL: 900,
+    urls.PROGRAM_ACTIVE_USERS_URL: 300,
+    urls.PROGRAM_TXS_URL: 300,
+    urls.PROGRAM_TVL: 300,
+    urls.TOKEN_VOLUME_URL: 300,
+    urls.TOKEN_BALANCE_CHART_URL: 300,
+    urls.TOP_TOKEN_HOLDERS_URL: 120,
+    urls.NFT_PORTFOLIO_URL: 120,
+    urls.WALLET_TOKEN_BALANCE_URL: 60,
+    urls.WALLET_PNL_URL: 60,
+    urls.TOKEN_OHLCV_URL: 30,
+}
+# Endpoints answered from an expired cache entry while it is refreshed in the background,
+# mapped to the maximum staleness in seconds that may be served.
+STALE_WHILE_REVALIDATE = {
+    urls.TOKEN_INFO_URL: 3600,
+    urls.PROGRAM_DETAILS_URL: 86400,
+}
+# Least recently used responses are evicted once either bound is exceeded.
+CACHE_MAX_ENTRIES = 2048
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Not-found answers are remembered so repeated lookups of a bad address are rejected locally:
+# per endpoint and address for address-only endpoints, per full URL for the others.
+NEGATIVE_CACHE_STATUSES = {400, 404}
+NEGATIVE_CACHE_TTL = 300
+NEGATIVE_CACHE_MAX_ENTRIES = 4096
+# Optional SQLite file that keeps cached responses across restarts (e.g. "vybe_cache.sqlite3").
+CACHE_DB_PATH = None
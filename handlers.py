@@ -7,12 +7,13 @@ like token OHLCV, TVL, NFT portfolios, volume charts, and more.
 import functions.charts as charts
 import functions.functions as functions
 import functions.evaluates as evaluates
+import functions.prefetch as prefetch
+import functions.sender as sender
 import constants.menu as menu
 import constants.messages as messages
 import functions.datetime as datetime
-import os
 import re
-from telegram import InputFile, ReplyKeyboardMarkup, InlineKeyboardMarkup, InlineKeyboardButton
+from telegram import ReplyKeyboardMarkup, InlineKeyboardMarkup, InlineKeyboardButton
 
 
 
@@ -25,37 +26,34 @@ async def handle_back_button(context, update):
 
     if last_menu == "holders":
         context.user_data["last_menu"] = "token"
-        await update.message.reply_text("📊 *Token Analysis menu*", parse_mode="Markdown",
-                                        reply_markup=ReplyKeyboardMarkup(menu.token_menu, resize_keyboard=True))
+        await sender.reply_text(update.message, "📊 *Token Analysis menu*", parse_mode="Markdown",
+                                reply_markup=ReplyKeyboardMarkup(menu.token_menu, resize_keyboard=True))
     elif last_menu == "token":
         context.user_data["last_menu"] = "main"
-        await update.message.reply_text("🏠 *Main menu*", parse_mode="Markdown",
-                                        reply_markup=ReplyKeyboardMarkup(menu.main_menu_buttons, resize_keyboard=True))
+        await sender.reply_text(update.message, "🏠 *Main menu*", parse_mode="Markdown",
+                                reply_markup=ReplyKeyboardMarkup(menu.main_menu_buttons, resize_keyboard=True))
     else:
-        await update.message.reply_text("🏠 *Main menu*", parse_mode="Markdown",
-                                        reply_markup=ReplyKeyboardMarkup(menu.main_menu_buttons, resize_keyboard=True))
+        await sender.reply_text(update.message, "🏠 *Main menu*", parse_mode="Markdown",
+                                reply_markup=ReplyKeyboardMarkup(menu.main_menu_buttons, resize_keyboard=True))
 
 async def handle_collection_owners_awaiting(text, context, update):
     if context.user_data.get("awaiting_collection_address"):
         collection_address = text.strip()
 
         if not evaluates.is_valid_address(collection_address):
-            await update.message.reply_text(messages.INVALID_COLLECTION_ADDRESS)
+            await sender.reply_text(update.message, messages.INVALID_COLLECTION_ADDRESS)
             return True
 
-        response = functions.retrieve_nft_collection_owners(collection_address)
+        response = await functions.retrieve_nft_collection_owners(collection_address)
 
         if response == "🔍 Not Found (404): No such collection found.":
-            await update.message.reply_text(messages.COLLECTION_NOT_FOUND)
+            await sender.reply_text(update.message, messages.COLLECTION_NOT_FOUND)
             return True
 
         context.user_data["awaiting_collection_address"] = False
 
-        if isinstance(response, list):
-            for chunk in response:
-                await update.message.reply_text(chunk, parse_mode="Markdown", disable_web_page_preview=True)
-        else:
-            await update.message.reply_text(response, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_chunks(update.message, response, filename="collection_owners.txt", parse_mode="Markdown",
+                                 disable_web_page_preview=True)
 
         return True
 
@@ -65,7 +63,7 @@ async def handle_collection_owners_awaiting(text, context, update):
 async def handle_program_details_awaiting(text, context, update):
     if context.user_data.get("awaiting_program_address"):
         program_address = text.strip()
-        response = functions.retrieve_program_details(program_address)
+        response = await functions.retrieve_program_details(program_address)
 
         if isinstance(response, tuple):
             context.user_data["awaiting_program_address"] = False
@@ -73,9 +71,9 @@ async def handle_program_details_awaiting(text, context, update):
             keyboard = InlineKeyboardMarkup([
                 [InlineKeyboardButton("🖼️ View Logo", url=logo_url)]
             ])
-            await update.message.reply_text(message, parse_mode="Markdown", reply_markup=keyboard)
+            await sender.reply_text(update.message, message, parse_mode="Markdown", reply_markup=keyboard)
         else:
-            await update.message.reply_text(messages.INVALID_PROGRAM_ADDRESS, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_PROGRAM_ADDRESS, disable_web_page_preview=True)
         return True
 
     return False
@@ -85,13 +83,13 @@ async def handle_top_wallets_awaiting(text, context, update):
         program_address = text.strip()
 
         if not evaluates.is_valid_address(program_address):
-            await update.message.reply_text((messages.INVALID_ADDRESS), disable_web_page_preview=True)
+            await sender.reply_text(update.message, (messages.INVALID_ADDRESS), disable_web_page_preview=True)
             return True
 
-        program_name = functions.retrieve_program_name(program_address)
+        program_name = await functions.retrieve_program_name(program_address)
 
         if not program_name:
-            await update.message.reply_text((messages.INVALID_PROGRAM_ADDRESS),  disable_web_page_preview=True)
+            await sender.reply_text(update.message, (messages.INVALID_PROGRAM_ADDRESS),  disable_web_page_preview=True)
             return True
 
         context.user_data["program_address"] = program_address
@@ -99,21 +97,21 @@ async def handle_top_wallets_awaiting(text, context, update):
         context.user_data["awaiting_top_wallets_address"] = False
         context.user_data["awaiting_days"] = True
 
-        await update.message.reply_text((messages.TIMESPAN_1D_30D), parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, (messages.TIMESPAN_1D_30D), parse_mode="Markdown", disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_days"):
         days = text.strip()
         if not evaluates.is_valid_days(days):
-            await update.message.reply_text((messages.INVALID_TIMESPAN_1D_30D), disable_web_page_preview=True)
+            await sender.reply_text(update.message, (messages.INVALID_TIMESPAN_1D_30D), disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_days"] = False
         program_address = context.user_data.get("program_address")
         program_name = context.user_data.get("program_name")
 
-        response = functions.retrieve_top_active_wallets(program_address, days=int(days), limit=10)
-        await update.message.reply_text((response), parse_mode="Markdown")
+        response = await functions.retrieve_top_active_wallets(program_address, days=int(days), limit=10)
+        await sender.reply_text(update.message, (response), parse_mode="Markdown")
         return True
 
     return False
@@ -122,15 +120,15 @@ async def handle_wallet_nft_awaiting(text, context, update):
     if context.user_data.get("awaiting_wallet_nft") or context.user_data.get("awaiting_nft_wallet"):
         wallet = text.strip()
 
-        if not evaluates.is_valid_address(wallet) or not (42 <= len(wallet) <= 46):
-            await update.message.reply_text(messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
+        if not evaluates.is_valid_address(wallet):
+            await sender.reply_text(update.message, messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_wallet_nft"] = False
         context.user_data["awaiting_nft_wallet"] = False
 
-        response = functions.retrieve_nft_portfolio(wallet)
-        await update.message.reply_text(response, parse_mode="Markdown")
+        response = await functions.retrieve_nft_portfolio(wallet)
+        await sender.reply_text(update.message, response, parse_mode="Markdown")
         return True
 
     return False
@@ -138,33 +136,30 @@ async def handle_wallet_pnl_awaiting(text, context, update):
     if context.user_data.get("awaiting_wallet_pnl"):
         wallet = text.strip()
 
-        if not evaluates.is_valid_address(wallet) or not (42 <= len(wallet) <= 46):
-            await update.message.reply_text(messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
+        if not evaluates.is_valid_address(wallet):
+            await sender.reply_text(update.message, messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
             return True
 
         context.user_data["wallet_for_pnl"] = wallet
         context.user_data["awaiting_wallet_pnl"] = False
+        prefetch.prefetcher.wallet_pnl(wallet)
         context.user_data["awaiting_pnl_days"] = True
 
-        await update.message.reply_text(messages.TIMESPAN_1D_7D_30D, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.TIMESPAN_1D_7D_30D, parse_mode="Markdown", disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_pnl_days"):
         days = text.strip()
 
         if not days.isdigit() or int(days) not in [1, 7, 30]:
-            await update.message.reply_text(messages.INVALID_TIMESPAN_1D_7D_30D,disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_TIMESPAN_1D_7D_30D,disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_pnl_days"] = False
         wallet = context.user_data.get("wallet_for_pnl")
-        response = functions.retrieve_wallet_pnl_summary(wallet, int(days))
+        response = await functions.retrieve_wallet_pnl_summary(wallet, int(days))
 
-        if isinstance(response, list):
-            for chunk in response:
-                await update.message.reply_text(chunk, parse_mode="Markdown")
-        else:
-            await update.message.reply_text(response, parse_mode="Markdown")
+        await sender.reply_chunks(update.message, response, filename=f"{wallet[:6]}_pnl_{days}d.txt", parse_mode="Markdown")
 
         return True
 
@@ -174,18 +169,14 @@ async def handle_wallet_portfolio_awaiting(text, context, update):
     if context.user_data.get("awaiting_wallet_portfolio"):
         wallet = text.strip()
 
-        if not evaluates.is_valid_address(wallet) or not (42 <= len(wallet) <= 46):
-            await update.message.reply_text(messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
+        if not evaluates.is_valid_address(wallet):
+            await sender.reply_text(update.message, messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_wallet_portfolio"] = False
-        response = functions.retrieve_wallet_portfolio_summary(wallet)
+        response = await functions.retrieve_wallet_portfolio_summary(wallet)
 
-        if isinstance(response, list):
-            for chunk in response:
-                await update.message.reply_text(chunk, parse_mode="Markdown")
-        else:
-            await update.message.reply_text(response, parse_mode="Markdown")
+        await sender.reply_chunks(update.message, response, filename=f"{wallet[:6]}_portfolio.txt", parse_mode="Markdown")
 
         return True
 
@@ -195,18 +186,14 @@ async def handle_wallet_spl_awaiting(text, context, update):
     if context.user_data.get("awaiting_wallet_spl"):
         wallet = text.strip()
 
-        if not evaluates.is_valid_address(wallet) or not (42 <= len(wallet) <= 46):
-            await update.message.reply_text(messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
+        if not evaluates.is_valid_address(wallet):
+            await sender.reply_text(update.message, messages.INVALID_WALLET_ADDRESS, disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_wallet_spl"] = False
-        response = functions.retrieve_wallet_token_summary(wallet)
+        response = await functions.retrieve_wallet_token_summary(wallet)
 
-        if isinstance(response, list):
-            for chunk in response:
-                await update.message.reply_text(chunk, parse_mode="Markdown")
-        else:
-            await update.message.reply_text(response, parse_mode="Markdown")
+        await sender.reply_chunks(update.message, response, filename=f"{wallet[:6]}_tokens.txt", parse_mode="Markdown")
 
         return True
 
@@ -217,20 +204,20 @@ async def handle_token_info_awaiting(text, context, update):
         mint = text.strip()
 
         if not evaluates.is_valid_mint(mint):
-            await update.message.reply_text(messages.INVALID_MINT_ADDRESS, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_MINT_ADDRESS, disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_token_mint"] = False
-        response = functions.retrieve_token_info(mint)
+        response = await functions.retrieve_token_info(mint)
 
         if isinstance(response, tuple):
             message, logo_url = response
             keyboard = InlineKeyboardMarkup([
                 [InlineKeyboardButton("🖼️ View Logo", url=logo_url)]
             ])
-            await update.message.reply_text(message, parse_mode="Markdown", reply_markup=keyboard)
+            await sender.reply_text(update.message, message, parse_mode="Markdown", reply_markup=keyboard)
         else:
-            await update.message.reply_text(response, parse_mode="Markdown")
+            await sender.reply_text(update.message, response, parse_mode="Markdown")
 
         return True
 
@@ -241,35 +228,35 @@ valid_resolutions = ['1s', '1m', '3m', '5m', '15m', '30m', '1h', '2h', '3h', '4h
 async def handle_ohlcv_awaiting(text, context, update):
     if context.user_data.get("awaiting_ohlcv_mint"):
         mint = text.strip()
-        if not evaluates.is_valid_mint(mint) or not (42 <= len(mint) <= 46):
-            await update.message.reply_text(messages.INVALID_MINT_ADDRESS, disable_web_page_preview=True)
+        if not evaluates.is_valid_mint(mint):
+            await sender.reply_text(update.message, messages.INVALID_MINT_ADDRESS, disable_web_page_preview=True)
             return True
         context.user_data["ohlcv_mint"] = mint
         context.user_data["awaiting_ohlcv_mint"] = False
         context.user_data["awaiting_ohlcv_resolution"] = True
-        await update.message.reply_text(messages.ENTER_RESOLUTION, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_RESOLUTION, parse_mode="Markdown", disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_ohlcv_resolution"):
         resolution = text.strip()
         if resolution not in valid_resolutions:
-            await update.message.reply_text(messages.INVALID_RESOLUTION, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_RESOLUTION, disable_web_page_preview=True)
             return True
         context.user_data["ohlcv_resolution"] = resolution
         context.user_data["awaiting_ohlcv_resolution"] = False
         context.user_data["awaiting_ohlcv_start"] = True
-        await update.message.reply_text(messages.ENTER_START_DATE, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_START_DATE, parse_mode="Markdown", disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_ohlcv_start"):
         start = text.strip()
         if not datetime.full_datetime_to_unix(start):
-            await update.message.reply_text(messages.INVALID_START_DATE,  disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_START_DATE,  disable_web_page_preview=True)
             return True
         context.user_data["ohlcv_start"] = start
         context.user_data["awaiting_ohlcv_start"] = False
         context.user_data["awaiting_ohlcv_end"] = True
-        await update.message.reply_text(messages.ENTER_END_DATE, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_END_DATE, parse_mode="Markdown", disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_ohlcv_end"):
@@ -279,55 +266,65 @@ async def handle_ohlcv_awaiting(text, context, update):
         start = context.user_data.get("ohlcv_start")
 
         if not datetime.full_datetime_to_unix(end) or datetime.full_datetime_to_unix(end) <= datetime.full_datetime_to_unix(start):
-            await update.message.reply_text(messages.INVALID_END_DATE, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_END_DATE, disable_web_page_preview=True)
             return True
 
         for key in list(context.user_data.keys()):
             if key.startswith("awaiting_ohlcv") or key.startswith("ohlcv_"):
                 del context.user_data[key]
 
-        response = functions.retrieve_token_ohlcv_data(
-            mint_address=mint,
-            resolution=resolution,
-            start_date=start,
-            end_date=end
-        )
-
-        if isinstance(response, list):
-            for chunk in response:
-                await update.message.reply_text(chunk, parse_mode="Markdown")
-        else:
-            await update.message.reply_text(response, parse_mode="Markdown")
+        await send_ohlcv_page(context, update, mint, resolution, start, end)
+        return True
 
+    elif text == "⏭ Next 10" and context.user_data.get("ohlcv_cursor"):
+        mint, resolution, start, end, cursor = context.user_data["ohlcv_cursor"]
+        await send_ohlcv_page(context, update, mint, resolution, start, end, cursor)
         return True
 
     return False
 
+async def send_ohlcv_page(context, update, mint, resolution, start, end, cursor=None):
+    response, next_cursor = await functions.retrieve_token_ohlcv_data(
+        mint_address=mint,
+        resolution=resolution,
+        start_date=start,
+        end_date=end,
+        cursor=cursor
+    )
+
+    if next_cursor:
+        context.user_data["ohlcv_cursor"] = (mint, resolution, start, end, next_cursor)
+        await sender.reply_text(update.message, response, parse_mode="Markdown", reply_markup=menu.ohlcv_next_buttons)
+    else:
+        context.user_data.pop("ohlcv_cursor", None)
+        await sender.reply_text(update.message, response, parse_mode="Markdown",
+                                reply_markup=ReplyKeyboardMarkup(menu.token_menu, resize_keyboard=True))
+
 async def handle_active_users_awaiting(text, context, update):
     if context.user_data.get("awaiting_active_users_address"):
         program_address = text.strip()
 
         if not evaluates.is_valid_address(program_address):
-            await update.message.reply_text(messages.INVALID_ADDRESS, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_ADDRESS, disable_web_page_preview=True)
             return True
 
-        program_name = functions.retrieve_program_name(program_address)
+        program_name = await functions.retrieve_program_name(program_address)
         if not program_name:
-            await update.message.reply_text(messages.INVALID_PROGRAM_ADDRESS, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_PROGRAM_ADDRESS, disable_web_page_preview=True)
             return True
 
         context.user_data["chart_program_address"] = program_address
         context.user_data["awaiting_active_users_address"] = False
         context.user_data["awaiting_active_users_range"] = True
 
-        await update.message.reply_text(messages.ENTER_TIME_RANGE, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_TIME_RANGE, parse_mode="Markdown", disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_active_users_range"):
         time_range = text.strip()
 
         if not evaluates.is_valid_range(time_range):
-            await update.message.reply_text(messages.INVALID_TIME_RANGE, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_TIME_RANGE, disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_active_users_range"] = False
@@ -343,21 +340,22 @@ async def handle_transactions_awaiting(text, context, update):
         program_address = text.strip()
 
         if not evaluates.is_valid_address(program_address):
-            await update.message.reply_text(messages.INVALID_FORMAT, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_FORMAT, disable_web_page_preview=True)
             return True
 
         context.user_data["tx_program_address"] = program_address
         context.user_data["awaiting_tx_address"] = False
+        prefetch.prefetcher.program(program_address)
         context.user_data["awaiting_tx_range"] = True
 
-        await update.message.reply_text(messages.ENTER_TRANSACTION_RESOLUTION, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_TRANSACTION_RESOLUTION, parse_mode="Markdown", disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_tx_range"):
         time_range = text.strip()
 
         if not evaluates.is_valid_range(time_range):
-            await update.message.reply_text(messages.INVALID_TRANSACTION_RESOLUTION, disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_TRANSACTION_RESOLUTION, disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_tx_range"] = False
@@ -372,31 +370,31 @@ async def handle_daily_top_holders_awaiting(text, context, update):
     if context.user_data.get("awaiting_daily_holder_mint"):
         mint = text.strip()
         if not evaluates.is_valid_mint(mint):
-            await update.message.reply_text(messages.INVALID_MINT_ADDRESS,
-                                            disable_web_page_preview=True,)
+            await sender.reply_text(update.message, messages.INVALID_MINT_ADDRESS,
+                                    disable_web_page_preview=True,)
             return True
 
         context.user_data["daily_holder_mint"] = mint
         context.user_data["awaiting_daily_holder_mint"] = False
         context.user_data["awaiting_daily_holder_start"] = True
 
-        await update.message.reply_text(messages.ENTER_START_DATE, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_START_DATE, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_daily_holder_start"):
         start_date = text.strip()
         if not datetime.full_datetime_to_unix(start_date):
-            await update.message.reply_text(messages.INVALID_START_DATE,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_START_DATE,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["daily_holder_start"] = start_date
         context.user_data["awaiting_daily_holder_start"] = False
         context.user_data["awaiting_daily_holder_end"] = True
 
-        await update.message.reply_text(messages.ENTER_END_DATE, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_END_DATE, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_daily_holder_end"):
@@ -404,21 +402,20 @@ async def handle_daily_top_holders_awaiting(text, context, update):
         start = context.user_data.get("daily_holder_start")
 
         if not datetime.full_datetime_to_unix(end_date) or datetime.full_datetime_to_unix(end_date) <= datetime.full_datetime_to_unix(start):
-            await update.message.reply_text(messages.INVALID_END_DATE,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_END_DATE,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_daily_holder_end"] = False
         mint = context.user_data["daily_holder_mint"]
 
-        message, chart_path = charts.retrieve_daily_top_holders_chart(mint, start, end_date)
+        message, chart = await charts.retrieve_daily_top_holders_chart(mint, start, end_date,
+                                                                      update.effective_user.id)
 
-        await update.message.reply_text(message, parse_mode="Markdown")
+        await sender.reply_text(update.message, message, parse_mode="Markdown")
 
-        if chart_path and os.path.exists(chart_path):
-            with open(chart_path, "rb") as photo:
-                await update.message.reply_photo(photo=InputFile(photo), caption="🖼️ Holders Chart", parse_mode="Markdown")
-            os.remove(chart_path)
+        if chart:
+            await sender.reply_photo(update.message, photo=chart, caption="🖼️ Holders Chart", parse_mode="Markdown")
 
         return True
 
@@ -427,16 +424,16 @@ async def handle_daily_top_holders_awaiting(text, context, update):
 async def handle_top_token_holders_awaiting(text, context, update):
     if context.user_data.get("awaiting_holder_mint"):
         mint = text.strip()
-        if not evaluates.is_valid_mint(mint) or not (42 <= len(mint) <= 46):
-            await update.message.reply_text(messages.INVALID_MINT_ADDRESS,
-                                            disable_web_page_preview=True)
+        if not evaluates.is_valid_mint(mint):
+            await sender.reply_text(update.message, messages.INVALID_MINT_ADDRESS,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["holder_mint"] = mint
         context.user_data["awaiting_holder_mint"] = False
         context.user_data["awaiting_sort_criteria"] = True
 
-        await update.message.reply_text(messages.SORT_CRITERIA, parse_mode="Markdown", reply_markup=menu.sort_criteria_buttons)
+        await sender.reply_text(update.message, messages.SORT_CRITERIA, parse_mode="Markdown", reply_markup=menu.sort_criteria_buttons)
         return True
 
     elif context.user_data.get("awaiting_sort_criteria"):
@@ -444,36 +441,36 @@ async def handle_top_token_holders_awaiting(text, context, update):
         valid_criteria = ['rank', 'ownerName', 'ownerAddress', 'valueUsd', 'balance', 'percentageOfSupplyHeld']
 
         if sort not in valid_criteria:
-            await update.message.reply_text(messages.INVALID_SORT_CRITERIA,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_SORT_CRITERIA,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["sort_criteria"] = sort
         context.user_data["awaiting_sort_criteria"] = False
         context.user_data["awaiting_sort_order"] = True
 
-        await update.message.reply_text(messages.SORT_ORDER, parse_mode="Markdown", reply_markup=menu.sort_order_buttons)
+        await sender.reply_text(update.message, messages.SORT_ORDER, parse_mode="Markdown", reply_markup=menu.sort_order_buttons)
         return True
 
     elif context.user_data.get("awaiting_sort_order"):
         order = text.strip().lower()
         if order not in ['asc', 'desc']:
-            await update.message.reply_text(messages.INVALID_SORT_ORDER,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_SORT_ORDER,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["sort_order"] = order
         context.user_data["awaiting_sort_order"] = False
         context.user_data["awaiting_holder_limit"] = True
 
-        await update.message.reply_text(messages.TOP_HOLDERS_COUNT, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.TOP_HOLDERS_COUNT, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_holder_limit"):
         if not text.strip().isdigit() or int(text.strip()) <= 0:
-            await update.message.reply_text(messages.INVALID_HOLDERS_COUNT, parse_mode="Markdown",
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_HOLDERS_COUNT, parse_mode="Markdown",
+                                    disable_web_page_preview=True)
             return True
 
         limit = int(text.strip())
@@ -482,12 +479,13 @@ async def handle_top_token_holders_awaiting(text, context, update):
         order = context.user_data["sort_order"]
 
         context.user_data["awaiting_holder_limit"] = False
-        result = functions.retrieve_top_token_holders(mint, sort, order, limit)
+        result = await functions.retrieve_top_token_holders(mint, sort, order, limit)
 
-        await update.message.reply_text(result, parse_mode="Markdown")
+        await sender.reply_text(update.message, result, filename=f"{mint[:6]}_top_holders.txt", parse_mode="Markdown")
 
         context.user_data["last_menu"] = "token"
-        await update.message.reply_text(
+        await sender.reply_text(
+            update.message,
             "📊 *Token Analysis menu*",
             parse_mode="Markdown",
             reply_markup=ReplyKeyboardMarkup(menu.token_menu, resize_keyboard=True)
@@ -500,33 +498,33 @@ async def handle_volume_awaiting(text, context, update):
     if context.user_data.get("awaiting_volume_mint"):
         mint = text.strip()
 
-        if not evaluates.is_valid_mint(mint) or not (42 <= len(mint) <= 46):
-            await update.message.reply_text(messages.INVALID_MINT_ADDRESS,
-                                            disable_web_page_preview=True,)
+        if not evaluates.is_valid_mint(mint):
+            await sender.reply_text(update.message, messages.INVALID_MINT_ADDRESS,
+                                    disable_web_page_preview=True,)
             return True
 
         context.user_data["volume_mint"] = mint
         context.user_data["awaiting_volume_mint"] = False
         context.user_data["awaiting_volume_start"] = True
 
-        await update.message.reply_text(messages.ENTER_START_DATE, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_START_DATE, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_volume_start"):
         start_date = text.strip()
 
         if not datetime.full_datetime_to_unix(start_date):
-            await update.message.reply_text(messages.INVALID_START_DATE,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_START_DATE,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["volume_start"] = start_date
         context.user_data["awaiting_volume_start"] = False
         context.user_data["awaiting_volume_end"] = True
 
-        await update.message.reply_text(messages.ENTER_END_DATE, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_END_DATE, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_volume_end"):
@@ -534,46 +532,46 @@ async def handle_volume_awaiting(text, context, update):
         start = context.user_data["volume_start"]
 
         if not datetime.full_datetime_to_unix(end_date) or datetime.full_datetime_to_unix(end_date) <= datetime.full_datetime_to_unix(start):
-            await update.message.reply_text(messages.INVALID_END_DATE,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_END_DATE,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["volume_end"] = end_date
         context.user_data["awaiting_volume_end"] = False
         context.user_data["awaiting_volume_interval"] = True
 
-        await update.message.reply_text(messages.ENTER_INTERVAL, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_INTERVAL, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_volume_interval"):
         interval = text.strip().lower()
 
         if interval not in ["hour", "day"]:
-            await update.message.reply_text(messages.INVALID_INTERVAL,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_INTERVAL,
+                                    disable_web_page_preview=True)
             return True
 
         mint = context.user_data.get("volume_mint")
         start = context.user_data.get("volume_start")
         end = context.user_data.get("volume_end")
 
-        summary, filename = charts.retrieve_transfer_volume_chart(mint, start, end, interval)
+        summary, chart = await charts.retrieve_transfer_volume_chart(mint, start, end, interval,
+                                                                      update.effective_user.id)
 
         for key in list(context.user_data.keys()):
             if key.startswith("volume_") or key.startswith("awaiting_volume_"):
                 del context.user_data[key]
 
-        await update.message.reply_text(summary, parse_mode="Markdown")
+        await sender.reply_text(update.message, summary, parse_mode="Markdown")
 
-        if filename and os.path.exists(filename):
-            with open(filename, "rb") as photo:
-                await update.message.reply_photo(
-                    photo=InputFile(photo),
-                    caption="📈 Transfer Volume Chart",
-                    parse_mode="Markdown"
-                )
-            os.remove(filename)
+        if chart:
+            await sender.reply_photo(
+                update.message,
+                photo=chart,
+                caption="📈 Transfer Volume Chart",
+                parse_mode="Markdown"
+            )
 
         return True
 
@@ -584,24 +582,25 @@ async def handle_tvl_awaiting(text, context, update):
         address = text.strip()
 
         if not evaluates.is_valid_address(address):
-            await update.message.reply_text(messages.INVALID_ADDRESS,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_ADDRESS,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["tvl_address"] = address
         context.user_data["awaiting_tvl_address"] = False
+        prefetch.prefetcher.program(address)
         context.user_data["awaiting_tvl_resolution"] = True
 
-        await update.message.reply_text(messages.ENTER_TVL_RESOLUTION, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_TVL_RESOLUTION, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_tvl_resolution"):
         resolution = text.strip()
 
         if not re.fullmatch(r"\d+(s|h|d|w)", resolution):
-            await update.message.reply_text(messages.INVALID_TVL_RESOLUTION,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_TVL_RESOLUTION,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_tvl_resolution"] = False
@@ -616,17 +615,17 @@ async def handle_token_balances_awaiting(text, context, update):
     if context.user_data.get("awaiting_balances_wallet"):
         wallet = text.strip()
 
-        if not evaluates.is_valid_address(wallet) or not (42 <= len(wallet) <= 46):
-            await update.message.reply_text(messages.INVALID_WALLET_ADDRESS,
-                                            disable_web_page_preview=True)
+        if not evaluates.is_valid_address(wallet):
+            await sender.reply_text(update.message, messages.INVALID_WALLET_ADDRESS,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["balances_wallet"] = wallet
         context.user_data["awaiting_balances_wallet"] = False
         context.user_data["awaiting_balances_days"] = True
 
-        await update.message.reply_text(messages.ENTER_BALANCE_DAYS, parse_mode="Markdown",
-                                        disable_web_page_preview=True)
+        await sender.reply_text(update.message, messages.ENTER_BALANCE_DAYS, parse_mode="Markdown",
+                                disable_web_page_preview=True)
         return True
 
     elif context.user_data.get("awaiting_balances_days"):
@@ -635,8 +634,8 @@ async def handle_token_balances_awaiting(text, context, update):
             if not (1 <= days <= 30):
                 raise ValueError()
         except ValueError:
-            await update.message.reply_text(messages.INVALID_TIMESPAN_1D_30D,
-                                            disable_web_page_preview=True)
+            await sender.reply_text(update.message, messages.INVALID_TIMESPAN_1D_30D,
+                                    disable_web_page_preview=True)
             return True
 
         context.user_data["awaiting_balances_days"] = False
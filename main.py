@@ -27,6 +27,16 @@ from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
 from constants.messages import *
 from telegram.ext import ContextTypes
 from constants.menu import *
+import asyncio
+import secrets
+import functions.client as client
+import functions.deadline as deadline
+import functions.dispatch as dispatch
+import functions.prefetch as prefetch
+import functions.sender as sender
+import functions.registry as registry
+import functions.scheduler as scheduler
+import globals.preferences as preferences
 from handlers import (
     handle_back_button, handle_collection_owners_awaiting, handle_program_details_awaiting,
     handle_top_wallets_awaiting, handle_wallet_pnl_awaiting, handle_wallet_portfolio_awaiting,
@@ -39,47 +49,61 @@ from handlers import (
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.message.from_user
+    context.user_data.pop("ohlcv_cursor", None)
     context.user_data["last_menu"] = "main"
-    await update.message.reply_text(
+    await sender.reply_text(
+        update.message,
         str.format(WELCOME_TEXT,user.first_name),
         parse_mode="Markdown",
         reply_markup=ReplyKeyboardMarkup(main_menu_buttons, resize_keyboard=True)
     )
 
+async def stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if update.message.from_user.id not in preferences.ADMIN_IDS:
+        await sender.reply_text(update.message, UNRECOGNIZED_INPUT, parse_mode="Markdown")
+        return
+    metrics = {**client.vybe.stats(), **registry.programs.stats(), **dispatch.dispatcher.stats(),
+               **prefetch.prefetcher.stats(), **scheduler.processor.stats(), **sender.queue.stats()}
+    lines = [STATS_HEADER] + [f"`{key}`: `{value}`" for key, value in metrics.items()]
+    await sender.reply_text(update.message, "\n".join(lines), parse_mode="Markdown")
+
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = update.message.text
+    if text != "⏭ Next 10":
+        # Any other input leaves the OHLCV result, so its page cursor is dropped.
+        context.user_data.pop("ohlcv_cursor", None)
     match text :
         case "🎨 NFT":
-            await update.message.reply_text("🎨 *NFT Menu*", parse_mode="Markdown",
-                                            reply_markup=ReplyKeyboardMarkup(nft_menu, resize_keyboard=True)); return
+            await sender.reply_text(update.message, "🎨 *NFT Menu*", parse_mode="Markdown",
+                                    reply_markup=ReplyKeyboardMarkup(nft_menu, resize_keyboard=True)); return
         case "📦 Programs":
             context.user_data["last_menu"] = "main"
-            await update.message.reply_text("📦 *Programs Menu*", parse_mode="Markdown",
-                                            reply_markup=ReplyKeyboardMarkup(programs_menu, resize_keyboard=True));return
+            await sender.reply_text(update.message, "📦 *Programs Menu*", parse_mode="Markdown",
+                                    reply_markup=ReplyKeyboardMarkup(programs_menu, resize_keyboard=True));return
         case "📊 Token Analysis":
             context.user_data["last_menu"] = "token"
-            await update.message.reply_text("📊 *Token Analysis Menu*", parse_mode="Markdown",
-                                            reply_markup=ReplyKeyboardMarkup(token_menu, resize_keyboard=True));return
+            await sender.reply_text(update.message, "📊 *Token Analysis Menu*", parse_mode="Markdown",
+                                    reply_markup=ReplyKeyboardMarkup(token_menu, resize_keyboard=True));return
         case "👤 Holders":
             context.user_data["last_menu"] = "holders"
-            await update.message.reply_text("👤 *Holders Submenu*", parse_mode="Markdown",
-                                            reply_markup=ReplyKeyboardMarkup(holders_submenu, resize_keyboard=True));return
+            await sender.reply_text(update.message, "👤 *Holders Submenu*", parse_mode="Markdown",
+                                    reply_markup=ReplyKeyboardMarkup(holders_submenu, resize_keyboard=True));return
         case "🧾 Wallet Tracking":
             context.user_data["last_menu"] = "main"
-            await update.message.reply_text("🧾 *Wallet Tracking Menu*", parse_mode="Markdown",
-                                            reply_markup=ReplyKeyboardMarkup(wallet_menu, resize_keyboard=True)); return
+            await sender.reply_text(update.message, "🧾 *Wallet Tracking Menu*", parse_mode="Markdown",
+                                    reply_markup=ReplyKeyboardMarkup(wallet_menu, resize_keyboard=True)); return
         case "🅰️ Alpha Vybe":
             keyboard = InlineKeyboardMarkup([[InlineKeyboardButton("🔗 Open AlphaVybe", url="https://vybe.fyi/")]])
-            await update.message.reply_text(ALPHA, parse_mode="Markdown", disable_web_page_preview=True,
-                                            reply_markup=keyboard); return
+            await sender.reply_text(update.message, ALPHA, parse_mode="Markdown", disable_web_page_preview=True,
+                                    reply_markup=keyboard); return
         case "❓ Help":
-            await update.message.reply_text(HELP, parse_mode="Markdown", disable_web_page_preview=True,
-                                            reply_markup=ReplyKeyboardMarkup(main_menu_buttons, resize_keyboard=True)); return
+            await sender.reply_text(update.message, HELP, parse_mode="Markdown", disable_web_page_preview=True,
+                                    reply_markup=ReplyKeyboardMarkup(main_menu_buttons, resize_keyboard=True)); return
         case "🏠 Main menu":
             context.user_data.clear()
             context.user_data["last_menu"] = "main"
-            await update.message.reply_text("🏠 *Main Menu*", parse_mode="Markdown",
-                                            reply_markup=ReplyKeyboardMarkup(main_menu_buttons, resize_keyboard=True)); return
+            await sender.reply_text(update.message, "🏠 *Main Menu*", parse_mode="Markdown",
+                                    reply_markup=ReplyKeyboardMarkup(main_menu_buttons, resize_keyboard=True)); return
         case "🔙 Back":
             await handle_back_button(context, update); return
 
@@ -116,7 +140,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         context.user_data[key] = True
 
-        await update.message.reply_text(prompt, parse_mode="Markdown", disable_web_page_preview=True)
+        await sender.reply_text(update.message, prompt, parse_mode="Markdown", disable_web_page_preview=True)
         return
 
     handlers = [
@@ -128,18 +152,51 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         handle_token_balances_awaiting
     ]
 
-    for handler in handlers:
-        if await handler(text, context, update):
+    async def run_handlers() -> bool:
+        with deadline.budget(preferences.UPDATE_DEADLINE):
+            for handler in handlers:
+                if await handler(text, context, update):
+                    return True
+        return False
+
+    try:
+        if await asyncio.wait_for(run_handlers(), preferences.UPDATE_DEADLINE + preferences.DEADLINE_GRACE):
             return
+    except (asyncio.TimeoutError, deadline.DeadlineExceeded):
+        await sender.reply_text(update.message, TIMEOUT_ERROR)
+        return
+
+    await sender.reply_text(update.message, UNRECOGNIZED_INPUT, parse_mode="Markdown",
+                            disable_web_page_preview=True)
+async def startup(app):
+    await client.vybe.open_store()
+
+async def shutdown(app):
+    await client.vybe.close()
+    dispatch.dispatcher.shutdown()
 
-    await update.message.reply_text(UNRECOGNIZED_INPUT, parse_mode="Markdown",
-                                    disable_web_page_preview=True)
 def main():
-    app = ApplicationBuilder().token("YOUR_BOT_TOKEN_HERE").build()
+    builder = ApplicationBuilder().token("YOUR_BOT_TOKEN_HERE").post_init(startup).post_shutdown(shutdown)
+    builder = builder.concurrent_updates(scheduler.processor)
+    if preferences.TELEGRAM_BASE_URL:
+        builder = builder.base_url(preferences.TELEGRAM_BASE_URL)
+    app = builder.build()
     app.add_handler(CommandHandler("start", start))
+    app.add_handler(CommandHandler("stats", stats))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
-    print("🤖 Bot is running... Press Ctrl+C to stop.")
-    app.run_polling()
+    if preferences.WEBHOOK_URL:
+        print(f"🤖 Bot is listening for webhooks on {preferences.WEBHOOK_LISTEN}:{preferences.WEBHOOK_PORT}... "
+              "Press Ctrl+C to stop.")
+        app.run_webhook(
+            listen=preferences.WEBHOOK_LISTEN,
+            port=preferences.WEBHOOK_PORT,
+            url_path=preferences.WEBHOOK_PATH,
+            secret_token=preferences.WEBHOOK_SECRET or secrets.token_urlsafe(32),
+            webhook_url=f"{preferences.WEBHOOK_URL.rstrip('/')}/{preferences.WEBHOOK_PATH}",
+        )
+    else:
+        print("🤖 Bot is running... Press Ctrl+C to stop.")
+        app.run_polling()
 
 
 if __name__ == "__main__":
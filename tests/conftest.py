@@ -0,0 +1,15 @@
+import httpx
+import pytest
+import functions.client as client
+
+
+@pytest.fixture
+def mock_client():
+    """
+    Build a `VybeClient` whose requests are answered by `handler` instead of the network.
+    """
+    def build(handler, headers=None):
+        vybe = client.VybeClient(headers=headers or {"X-API-KEY": "test-key"})
+        vybe._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return vybe
+    return build
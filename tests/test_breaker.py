@@ -0,0 +1,108 @@
+import pytest
+import functions.breaker as breaker
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(breaker.time, "monotonic", clock)
+    return clock
+
+
+def make_breaker():
+    return breaker.CircuitBreaker("test", window=10, min_calls=4, failure_ratio=0.5,
+                                  slow_call_seconds=2, reset_timeout=30)
+
+
+def trip(circuit):
+    for _ in range(4):
+        circuit.record(circuit.allow(), False)
+    assert circuit.state == breaker.OPEN
+
+
+def test_stays_closed_below_the_failure_ratio(clock):
+    circuit = make_breaker()
+    for ok in (True, True, True, False, True, False):
+        circuit.record(circuit.allow(), ok)
+    assert circuit.state == breaker.CLOSED
+
+
+def test_does_not_open_before_min_calls(clock):
+    circuit = make_breaker()
+    for _ in range(3):
+        circuit.record(circuit.allow(), False)
+    assert circuit.state == breaker.CLOSED
+
+
+def test_slow_calls_count_as_failures(clock):
+    circuit = make_breaker()
+    for _ in range(4):
+        circuit.record(circuit.allow(), True, seconds=5)
+    assert circuit.state == breaker.OPEN
+
+
+def test_open_breaker_rejects_until_reset_timeout(clock):
+    circuit = make_breaker()
+    trip(circuit)
+    assert circuit.allow() == 0
+    assert circuit.rejected == 1
+    clock.now += 29
+    assert circuit.allow() == 0
+
+
+def test_half_open_admits_one_probe_and_closes_on_success(clock):
+    circuit = make_breaker()
+    trip(circuit)
+    clock.now += 30
+    probe = circuit.allow()
+    assert probe and circuit.state == breaker.HALF_OPEN
+    assert circuit.allow() == 0
+    circuit.record(probe, True)
+    assert circuit.state == breaker.CLOSED
+    assert circuit.allow()
+
+
+def test_failed_probe_reopens(clock):
+    circuit = make_breaker()
+    trip(circuit)
+    clock.now += 30
+    circuit.record(circuit.allow(), False)
+    assert circuit.state == breaker.OPEN
+    assert circuit.trips == 2
+
+
+def test_lost_probe_is_replaced_after_reset_timeout(clock):
+    circuit = make_breaker()
+    trip(circuit)
+    clock.now += 30
+    first = circuit.allow()
+    clock.now += 30
+    second = circuit.allow()
+    assert second and second != first
+    circuit.record(first, False)
+    assert circuit.state == breaker.HALF_OPEN
+    circuit.record(second, True)
+    assert circuit.state == breaker.CLOSED
+
+
+def test_outcomes_from_an_earlier_state_are_ignored(clock):
+    circuit = make_breaker()
+    late = circuit.allow()
+    trip(circuit)
+    clock.now += 30
+    probe = circuit.allow()
+    circuit.record(late, True)
+    assert circuit.state == breaker.HALF_OPEN
+    circuit.record(probe, True)
+    closed = circuit.allow()
+    circuit.record(probe, False)
+    circuit.record(closed, False)
+    assert circuit.state == breaker.CLOSED
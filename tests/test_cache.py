@@ -0,0 +1,163 @@
+import asyncio
+import functions.cache as cache
+import functions.deadline as deadline
+
+
+def test_normalize_url():
+    assert cache.normalize_url("HTTPS://Api.Vybe.XYZ/Token/AbC/?b=2&a=1") == "https://api.vybe.xyz/Token/AbC?a=1&b=2"
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    async def main():
+        flight = cache.SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+        again = await flight.do("key", load)
+        return results, again, flight.stats()
+
+    results, again, stats = asyncio.run(main())
+    assert results == [1] * 5
+    assert again == 2
+    assert stats == {"coalesce.in_flight": 0, "coalesce.shared": 4, "coalesce.abandoned": 0}
+
+
+def test_single_flight_shares_exceptions():
+    async def main():
+        flight = cache.SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        return await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+
+    assert [type(result) for result in asyncio.run(main())] == [ValueError, ValueError]
+
+
+def test_single_flight_survives_one_cancelled_caller():
+    async def main():
+        flight = cache.SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.ensure_future(flight.do("key", load))
+        second = asyncio.ensure_future(flight.do("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, flight.abandoned
+
+    assert asyncio.run(main()) == ("ok", 0)
+
+
+def test_single_flight_cancels_the_call_when_every_caller_left():
+    async def main():
+        flight = cache.SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def load():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(flight.do("key", load))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        return flight.abandoned
+
+    assert asyncio.run(main()) == 1
+
+
+def test_single_flight_runs_under_the_latest_waiters_deadline():
+    async def main():
+        flight = cache.SingleFlight()
+        seen = []
+
+        async def load():
+            await asyncio.sleep(0.02)
+            seen.append(deadline.remaining())
+            return "ok"
+
+        async def caller(seconds):
+            with deadline.budget(seconds):
+                return await deadline.wait(flight.do("key", load))
+
+        results = await asyncio.gather(caller(0.005), caller(30), return_exceptions=True)
+        return results, seen
+
+    (short, long), seen = asyncio.run(main())
+    assert isinstance(short, deadline.DeadlineExceeded)
+    assert long == "ok"
+    assert seen[0] > 25
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_response_cache_expires_entries(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "time", clock)
+    responses = cache.ResponseCache(10, 1000)
+    responses.set("a", "A", ttl=60)
+    assert responses.get("a") == "A"
+    clock.now += 60
+    assert responses.get("a") is None
+    assert responses.stats()["cache.entries"] == 0
+
+
+def test_response_cache_serves_stale_entries_inside_the_window(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "time", clock)
+    responses = cache.ResponseCache(10, 1000)
+    responses.set("a", "A", ttl=60, stale_ttl=30)
+    clock.now += 70
+    assert responses.get("a") is None
+    assert responses.get_stale("a") == "A"
+    clock.now += 30
+    assert responses.get_stale("a") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    responses = cache.ResponseCache(2, 1000)
+    responses.set("a", "A", 60)
+    responses.set("b", "B", 60)
+    responses.get("a")
+    responses.set("c", "C", 60)
+    assert responses.get("b") is None
+    assert responses.get("a") == "A" and responses.get("c") == "C"
+    assert responses.evictions == 1
+
+
+def test_response_cache_is_bounded_by_size():
+    responses = cache.ResponseCache(10, 100, name="bytes")
+    responses.set("a", "A", 60, size=60)
+    responses.set("b", "B", 60, size=60)
+    responses.set("huge", "H", 60, size=101)
+    assert responses.get("a") is None and responses.get("huge") is None
+    assert responses.get("b") == "B"
+    stats = responses.stats()
+    assert stats["bytes.bytes"] == 60 and stats["bytes.entries"] == 1
+
+
+def test_response_cache_replaces_existing_keys():
+    responses = cache.ResponseCache(10, 100)
+    responses.set("a", "old", 60, size=50)
+    responses.set("a", "new", 60, size=30)
+    assert responses.get("a") == "new"
+    assert responses.stats()["cache.bytes"] == 30
@@ -0,0 +1,67 @@
+import functions.chunker as chunker
+
+
+def assert_well_formed(chunks, limit):
+    for chunk in chunks:
+        assert len(chunk) <= limit
+        assert chunker._scan(chunk, None) is None
+
+
+def test_short_text_is_one_chunk():
+    assert chunker.split("hello *world*", 100) == ["hello *world*"]
+
+
+def test_lines_are_packed_and_kept_whole():
+    text = "\n".join(f"line {i}" for i in range(200))
+    chunks = chunker.split(text, 100)
+    assert "\n".join(chunks) == text
+    assert_well_formed(chunks, 100)
+    assert all(not chunk.startswith("\n") for chunk in chunks)
+
+
+def test_bold_span_across_lines_is_closed_and_reopened():
+    text = "*" + "\n".join(["bold line"] * 50) + "*"
+    chunks = chunker.split(text, 100)
+    assert len(chunks) > 1
+    assert_well_formed(chunks, 100)
+    assert all(chunk.startswith("*") and chunk.endswith("*") for chunk in chunks)
+
+
+def test_long_line_is_cut_at_spaces():
+    text = "word " * 100
+    chunks = chunker.split(text, 50)
+    assert_well_formed(chunks, 50)
+    assert all(chunk.endswith(" ") for chunk in chunks[:-1])
+    assert "".join(chunks) == text
+
+
+def test_long_code_span_is_split_into_closed_pieces():
+    text = "`" + "x" * 250 + "`"
+    chunks = chunker.split(text, 100)
+    assert_well_formed(chunks, 100)
+    assert "".join(chunk.strip("`") for chunk in chunks) == "x" * 250
+
+
+def test_link_is_never_cut():
+    text = "intro " * 20 + "[" + "a" * 60 + "](http://example.com/x) tail"
+    chunks = chunker.split(text, 100)
+    assert_well_formed(chunks, 100)
+    assert any("[" + "a" * 60 + "](http://example.com/x)" in chunk for chunk in chunks)
+
+
+def test_link_longer_than_a_chunk_becomes_plain_text():
+    chunks = chunker.split("[" + "a" * 5000 + "](http://x_y)", 4000, markdown=True)
+    assert_well_formed(chunks, 4000)
+    assert "[" not in "".join(chunks)
+    assert "".join(chunks).endswith(" (http://x\\_y)")
+
+
+def test_plain_text_is_not_touched():
+    text = "*" + "a" * 150
+    chunks = chunker.split(text, 100, markdown=False)
+    assert "".join(chunks) == text
+
+
+def test_plain_strips_markup():
+    text = "*Bold* _it_ `co_de` [link](http://x) a\\_b"
+    assert chunker.plain(text) == "Bold it co_de link (http://x) a_b"
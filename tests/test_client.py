@@ -0,0 +1,215 @@
+import asyncio
+import httpx
+import globals.preferences as preferences
+import globals.urls as urls
+
+PROGRAM = "11111111111111111111111111111111"
+
+
+def test_concurrent_identical_requests_share_one_upstream_call(mock_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"name": "System"})
+
+    async def main():
+        vybe = mock_client(handler)
+        responses = await asyncio.gather(*(vybe.program_details(PROGRAM) for _ in range(5)))
+        # Served from the cache afterwards.
+        again = await vybe.program_details(PROGRAM)
+        return responses, again, vybe.stats()
+
+    responses, again, stats = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(response.json() == {"name": "System"} for response in responses + [again])
+    assert stats["coalesce.shared"] == 4
+    assert stats["cache.hits"] == 1
+
+
+def test_requests_for_different_urls_are_not_merged(mock_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={})
+
+    async def main():
+        vybe = mock_client(handler)
+        await asyncio.gather(vybe.program_details(PROGRAM), vybe.token_info(PROGRAM))
+
+    asyncio.run(main())
+    assert sorted(calls) == [f"/program/{PROGRAM}", f"/token/{PROGRAM}"]
+
+
+def test_uncached_endpoints_go_upstream_every_time(mock_client, monkeypatch):
+    monkeypatch.delitem(preferences.CACHE_TTLS, urls.WALLET_PNL_URL)
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(200, json={})
+
+    async def main():
+        vybe = mock_client(handler)
+        await vybe.wallet_pnl(PROGRAM, 7)
+        await vybe.wallet_pnl(PROGRAM, 7)
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_expired_entry_is_served_stale_while_it_refreshes(mock_client, monkeypatch):
+    monkeypatch.setitem(preferences.CACHE_TTLS, urls.TOKEN_INFO_URL, 0.05)
+    versions = iter(range(1, 10))
+
+    def handler(request):
+        return httpx.Response(200, json={"version": next(versions)})
+
+    async def main():
+        vybe = mock_client(handler)
+        first = await vybe.token_info(PROGRAM)
+        await asyncio.sleep(0.06)
+        stale = await vybe.token_info(PROGRAM)
+        refreshing = vybe.stats()["cache.refreshing"]
+        await asyncio.gather(*vybe._refreshing.values())
+        fresh = await vybe.token_info(PROGRAM)
+        return first.json(), stale.json(), refreshing, fresh.json()
+
+    first, stale, refreshing, fresh = asyncio.run(main())
+    assert first == stale == {"version": 1}
+    assert refreshing == 1
+    assert fresh == {"version": 2}
+
+
+
+def test_not_found_answers_are_replayed_per_address(mock_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(404, json={"message": "not found"})
+
+    async def main():
+        vybe = mock_client(handler)
+        first = await vybe.program_details(PROGRAM)
+        second = await vybe.program_details(PROGRAM)
+        other = await vybe.program_details("So11111111111111111111111111111111111111112")
+        return first.status_code, second.status_code, other.status_code
+
+    assert asyncio.run(main()) == (404, 404, 404)
+    assert len(calls) == 2
+
+
+def test_not_found_on_a_parameterized_endpoint_is_keyed_on_the_full_url(mock_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(400 if request.url.params["resolution"] == "1d" else 200, json={})
+
+    async def main():
+        vybe = mock_client(handler)
+        bad = await vybe.program_tvl(PROGRAM, "1d")
+        await vybe.program_tvl(PROGRAM, "1d")
+        good = await vybe.program_tvl(PROGRAM, "1h")
+        return bad.status_code, good.status_code
+
+    assert asyncio.run(main()) == (400, 200)
+    assert len(calls) == 2
+
+
+def test_server_errors_are_not_remembered(mock_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(500)
+
+    async def main():
+        vybe = mock_client(handler)
+        await vybe.program_details(PROGRAM)
+        await vybe.program_details(PROGRAM)
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_transient_failures_are_retried(mock_client, monkeypatch):
+    monkeypatch.setattr(preferences, "RETRY_BASE_DELAY", 0.001)
+    answers = iter(["connect", 503, 200])
+
+    def handler(request):
+        answer = next(answers)
+        if answer == "connect":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(answer, json={})
+
+    async def main():
+        vybe = mock_client(handler)
+        response = await vybe.program_details(PROGRAM)
+        return response.status_code, vybe.stats()["pool.retries"]
+
+    assert asyncio.run(main()) == (200, 2)
+
+
+def test_slow_request_is_hedged_on_another_key(mock_client, monkeypatch):
+    monkeypatch.setattr(preferences, "API_KEYS", ["slow-key-aaaa", "fast-key-bbbb"])
+    monkeypatch.setattr(preferences, "HEDGE_MIN_SAMPLES", 1)
+    monkeypatch.setattr(preferences, "HEDGE_BUDGET", 1)
+    used = []
+
+    async def handler(request):
+        key = request.headers["X-API-KEY"]
+        used.append(key)
+        if key == "slow-key-aaaa":
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"key": key})
+
+    async def main():
+        vybe = mock_client(handler)
+        vybe._latency.observe(urls.PROGRAM_DETAILS_URL, 0.01)
+        response = await vybe.program_details(PROGRAM)
+        stats = vybe.stats()
+        return response.json(), stats["pool.hedges"], stats["pool.hedge_wins"]
+
+    assert asyncio.run(main()) == ({"key": "fast-key-bbbb"}, 1, 1)
+    assert used == ["slow-key-aaaa", "fast-key-bbbb"]
+
+
+def test_no_hedge_without_a_second_key(mock_client, monkeypatch):
+    monkeypatch.setattr(preferences, "HEDGE_MIN_SAMPLES", 1)
+    monkeypatch.setattr(preferences, "HEDGE_BUDGET", 1)
+
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    async def main():
+        vybe = mock_client(handler)
+        vybe._latency.observe(urls.PROGRAM_DETAILS_URL, 0.001)
+        await vybe.program_details(PROGRAM)
+        return vybe.stats()["pool.hedges"]
+
+    assert asyncio.run(main()) == 0
+
+
+def test_rate_limit_headers_are_credited_to_the_key_that_answered(mock_client, monkeypatch):
+    monkeypatch.setattr(preferences, "API_KEYS", ["limited-aaaa", "healthy-bbbb"])
+
+    def handler(request):
+        if request.headers["X-API-KEY"] == "limited-aaaa":
+            return httpx.Response(429, headers={"retry-after": "30", "x-ratelimit-remaining": "0"})
+        return httpx.Response(200, headers={"x-ratelimit-remaining": "99"}, json={})
+
+    async def main():
+        vybe = mock_client(handler)
+        response = await vybe.program_details(PROGRAM)
+        return response.status_code, vybe.stats()
+
+    status, stats = asyncio.run(main())
+    assert status == 200
+    assert stats["keys.…aaaa.throttled"] == 1 and stats["keys.…aaaa.remaining"] == 0
+    assert stats["keys.…bbbb.throttled"] == 0 and stats["keys.…bbbb.remaining"] == 99
+    assert stats["ratelimit.throttled"] == 0
@@ -0,0 +1,62 @@
+from collections import Counter
+import pytest
+import functions.keys as keys
+
+
+def picks(pool, count):
+    return Counter(pool.acquire().value for _ in range(count))
+
+
+def test_requires_a_key():
+    with pytest.raises(ValueError):
+        keys.KeyPool([])
+
+
+def test_weighted_round_robin():
+    pool = keys.KeyPool([("a" * 8, 2), "b" * 8])
+    assert picks(pool, 30) == {"a" * 8: 20, "b" * 8: 10}
+    # Smooth: the heavier key is never picked three times in a row.
+    sequence = "".join(pool.acquire().value[0] for _ in range(9))
+    assert "aaa" not in sequence
+
+
+def test_limited_key_sits_out_its_cooldown():
+    pool = keys.KeyPool(["a" * 8, "b" * 8])
+    limited = pool.keys[0]
+    pool.limited(limited, 60)
+    assert limited.throttled == 1
+    assert picks(pool, 5) == {"b" * 8: 5}
+    assert pool.next_available_in() == 0
+
+
+def test_all_cooling_falls_back_to_least_recently_limited():
+    pool = keys.KeyPool(["a" * 8, "b" * 8])
+    first, second = pool.keys
+    pool.limited(first, 60)
+    pool.limited(second, 30)
+    assert pool.acquire() is first
+    assert 29 < pool.next_available_in() <= 30
+
+
+def test_acquire_can_exclude_a_key():
+    pool = keys.KeyPool(["a" * 8, "b" * 8])
+    first, second = pool.keys
+    assert all(pool.acquire(exclude=first) is second for _ in range(3))
+    pool.limited(second, 60)
+    assert pool.acquire(exclude=first) is None
+    single = keys.KeyPool(["a" * 8])
+    assert single.acquire(exclude=single.keys[0]) is None
+
+
+def test_observe_and_stats():
+    pool = keys.KeyPool(["secret-abcd"])
+    key = pool.acquire()
+    pool.observe(key, "42")
+    pool.observe(key, "n/a")
+    pool.observe(key, None)
+    assert pool.stats() == {
+        "keys.…abcd.uses": 1,
+        "keys.…abcd.throttled": 0,
+        "keys.…abcd.cooling": 0.0,
+        "keys.…abcd.remaining": 42,
+    }
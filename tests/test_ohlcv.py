@@ -0,0 +1,73 @@
+import asyncio
+import httpx
+import pytest
+import constants.messages as messages
+import functions.client as client
+import functions.datetime as datetime
+import functions.functions as functions
+import globals.preferences as preferences
+
+MINT = "So11111111111111111111111111111111111111112"
+START = datetime.full_datetime_to_unix("2025-01-01")
+HOUR = 3600
+
+
+def candle(time):
+    return {"time": time, "open": 1, "high": 2, "low": 0.5, "close": 1.5,
+            "volume": 10, "volumeUsd": 15, "count": 3}
+
+
+@pytest.fixture
+def upstream(mock_client, monkeypatch):
+    """
+    Serve the candles at the given times and record the requested windows.
+    """
+    def install(times):
+        windows = []
+
+        def handler(request):
+            time_start, time_end = int(request.url.params["timeStart"]), int(request.url.params["timeEnd"])
+            windows.append((time_start, time_end))
+            return httpx.Response(200, json={"data": [candle(time) for time in times if time_start <= time <= time_end]})
+
+        monkeypatch.setattr(client, "vybe", mock_client(handler))
+        return windows
+    return install
+
+
+def page(cursor=None):
+    return asyncio.run(functions.retrieve_token_ohlcv_data(MINT, "1h", "2025-01-01", "2025-01-31", cursor))
+
+
+def test_pages_through_the_range_one_window_at_a_time(upstream):
+    windows = upstream([START + i * HOUR for i in range(25)])
+    text, cursor = page()
+    assert "2025-01-01 09:00:00" in text and "2025-01-01 10:00:00" not in text
+    assert cursor == START + 9 * HOUR + 1
+    assert windows == [(START, START + 10 * HOUR)]
+
+    _, cursor = page(cursor)
+    assert cursor == START + 19 * HOUR + 1
+    text, cursor = page(cursor)
+    assert "2025-01-01 20:00:00" in text and "2025-01-02 00:00:00" in text
+    assert cursor is None
+
+
+def test_gap_before_the_first_candle_is_crossed(upstream):
+    windows = upstream([START + 20 * 24 * HOUR])
+    text, cursor = page()
+    assert "2025-01-21" in text
+    assert cursor is None
+    assert len(windows) == preferences.OHLCV_MAX_WINDOWS
+    assert windows[-1][1] == datetime.full_datetime_to_unix("2025-01-31")
+
+
+def test_no_candles_at_all(upstream):
+    windows = upstream([])
+    assert page() == (messages.NO_OHLCV_FOUND, None)
+    assert windows[-1][1] == datetime.full_datetime_to_unix("2025-01-31")
+
+
+def test_no_more_candles_after_the_cursor(upstream):
+    upstream([START])
+    assert page(START + 1) == (messages.NO_MORE_OHLCV, None)
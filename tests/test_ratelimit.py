@@ -0,0 +1,92 @@
+import asyncio
+import time
+from email.utils import formatdate
+import httpx
+import pytest
+import functions.ratelimit as ratelimit
+
+MAX_WAIT = {ratelimit.INTERACTIVE: 5, ratelimit.BACKGROUND: 5}
+
+
+def test_burst_then_empty():
+    bucket = ratelimit.TokenBucket(1, 3, MAX_WAIT)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_queued_interactive_requests_go_before_background_ones():
+    async def main():
+        bucket = ratelimit.TokenBucket(50, 1, MAX_WAIT)
+        await bucket.acquire()
+        order = []
+
+        async def take(priority, name):
+            await bucket.acquire(priority)
+            order.append(name)
+
+        await asyncio.gather(take(ratelimit.BACKGROUND, "background"), take(ratelimit.INTERACTIVE, "interactive"))
+        return order
+
+    assert asyncio.run(main()) == ["interactive", "background"]
+
+
+def test_waiting_longer_than_max_wait_is_rejected():
+    async def main():
+        bucket = ratelimit.TokenBucket(0.5, 1, {ratelimit.INTERACTIVE: 0.05})
+        await bucket.acquire()
+        with pytest.raises(ratelimit.RateLimited):
+            await bucket.acquire()
+        return bucket.rejected
+
+    assert asyncio.run(main()) == 1
+
+
+def test_background_context_sets_the_priority():
+    assert ratelimit.current_priority() == ratelimit.INTERACTIVE
+    with ratelimit.background():
+        assert ratelimit.current_priority() == ratelimit.BACKGROUND
+    assert ratelimit.current_priority() == ratelimit.INTERACTIVE
+
+
+def test_opportunistic_calls_never_queue():
+    async def main():
+        bucket = ratelimit.TokenBucket(100, 1, MAX_WAIT)
+        with ratelimit.opportunistic():
+            await bucket.acquire()
+            started = time.monotonic()
+            with pytest.raises(ratelimit.RateLimited):
+                await bucket.acquire()
+            return time.monotonic() - started, bucket.waited
+
+    elapsed, waited = asyncio.run(main())
+    assert elapsed < 1 and waited == 0
+
+
+def test_penalize_pauses_and_halves_the_rate_then_recovers():
+    bucket = ratelimit.TokenBucket(10, 10, MAX_WAIT, min_rate=1, recovery=2)
+    bucket.penalize(60)
+    assert bucket.rate == 5
+    assert not bucket.try_acquire()
+    bucket.succeeded()
+    bucket.succeeded()
+    bucket.succeeded()
+    assert bucket.rate == 10
+    for _ in range(5):
+        bucket.penalize(0)
+    assert bucket.rate == 1
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("3", 3.0),
+    ("0.5", 0.5),
+    ("-1", 0.0),
+    ("soon", None),
+    ("", None),
+])
+def test_retry_after_seconds(header, expected):
+    response = httpx.Response(429, headers={"retry-after": header} if header else {})
+    assert ratelimit.retry_after(response) == expected
+
+
+def test_retry_after_http_date():
+    response = httpx.Response(429, headers={"retry-after": formatdate(time.time() + 30, usegmt=True)})
+    assert 25 <= ratelimit.retry_after(response) <= 30
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import pytest
+import functions.stream as stream
+
+
+def chunks_of(data: bytes, size: int):
+    async def chunks():
+        for start in range(0, len(data), size):
+            yield data[start:start + size]
+    return chunks()
+
+
+def feed(parser: stream.ArrayItems, text: str, size: int) -> list:
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    parser.close()
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 64, 10000])
+def test_array_items_in_any_chunking(size):
+    text = json.dumps({"total": 3, "data": [{"a": 1}, 2.5, "x]", None, [1, [2]]], "after": [0]})
+    assert feed(stream.ArrayItems("data"), text, size) == [{"a": 1}, 2.5, "x]", None, [1, [2]]]
+
+
+@pytest.mark.parametrize("size", [1, 3, 10000])
+def test_array_items_only_match_the_top_level_key(size):
+    text = json.dumps({
+        "meta": {"data": [{"nested": True}]},
+        "note": 'a "data": [1] lookalike',
+        "data": [{"top": 1}],
+        "list": [{"data": [2]}],
+    })
+    assert feed(stream.ArrayItems("data"), text, size) == [{"top": 1}]
+
+
+def test_array_items_without_the_key_yield_nothing():
+    assert feed(stream.ArrayItems("data"), json.dumps({"other": [1, 2]}), 4) == []
+
+
+def test_truncated_array_raises():
+    parser = stream.ArrayItems("data")
+    list(parser.feed('{"data": [{"a": 1}, {"a": '))
+    with pytest.raises(json.JSONDecodeError):
+        parser.close()
+
+
+def test_top_k_keeps_highest_values_in_order():
+    items = [{"owner": str(i), "amount": amount} for i, amount in enumerate([5, 1, 9, "7", 3, 9, "bad"])]
+    payload = json.dumps({"data": items}).encode()
+    reduced = json.loads(asyncio.run(stream.TopK("data", "amount", 3).reduce(chunks_of(payload, 7))))
+    # Ties keep the API's order; non-numeric values count as 0.
+    assert [item["owner"] for item in reduced["data"]] == ["2", "5", "3"]
+
+
+def test_top_k_handles_multibyte_text_split_across_chunks():
+    items = [{"name": "ñandú 🐦", "amount": 2}, {"name": "emoji 🎨", "amount": 1}]
+    payload = json.dumps({"data": items}, ensure_ascii=False).encode()
+    reduced = json.loads(asyncio.run(stream.TopK("data", "amount", 5).reduce(chunks_of(payload, 1))))
+    assert reduced == {"data": items}
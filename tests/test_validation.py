@@ -0,0 +1,35 @@
+import functions.converts as converts
+import functions.evaluates as evaluates
+
+WRAPPED_SOL = "So11111111111111111111111111111111111111112"
+SYSTEM_PROGRAM = "11111111111111111111111111111111"
+
+
+def test_base58_decode_known_values():
+    assert converts.base58_decode("2g") == b"a"
+    assert converts.base58_decode("1112") == b"\x00\x00\x00\x01"
+    assert len(converts.base58_decode(WRAPPED_SOL)) == 32
+
+
+def test_base58_decode_keeps_leading_zero_bytes():
+    assert converts.base58_decode(SYSTEM_PROGRAM) == b"\x00" * 32
+
+
+def test_base58_decode_rejects_characters_outside_the_alphabet():
+    assert converts.base58_decode("") is None
+    for bad in ("0", "O", "I", "l", "+", "é"):
+        assert converts.base58_decode("abc" + bad) is None
+
+
+def test_valid_addresses():
+    assert evaluates.is_valid_address(WRAPPED_SOL)
+    assert evaluates.is_valid_address(SYSTEM_PROGRAM)
+
+
+def test_invalid_addresses():
+    assert not evaluates.is_valid_address("")
+    assert not evaluates.is_valid_address(WRAPPED_SOL[:31])
+    assert not evaluates.is_valid_address(WRAPPED_SOL + "1")
+    assert not evaluates.is_valid_address(WRAPPED_SOL[:-1] + "0")
+    # Right length, but decodes to more than 32 bytes.
+    assert not evaluates.is_valid_address("z" * 44)
@@ -0,0 +1,160 @@
+"""
+Local stand-in for Telegram to drive VybeBot in webhook mode.
+
+Runs a minimal fake Bot API server that answers the bot's API calls and prints its
+replies, and posts text messages to the bot's webhook as Telegram would, including the
+`X-Telegram-Bot-Api-Secret-Token` header. Only the standard library is used.
+
+Point the bot at it in `globals/preferences.py`:
+    TELEGRAM_BASE_URL = "http://127.0.0.1:8081/bot"
+    WEBHOOK_URL = "http://127.0.0.1:8443"
+    WEBHOOK_SECRET = "local-test-secret"
+
+then start this script first and the bot second. The script waits for the bot to
+register its webhook through `setWebhook`, and sends the messages to the registered URL
+with the registered secret:
+    python tools/fake_telegram.py /start "📊 Token Analysis" "📋 Info" <mint>
+    python main.py
+"""
+import argparse
+import email.parser
+import itertools
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_message_ids = itertools.count(1)
+_replies = threading.Condition()
+_reply_count = 0
+_webhook = {}
+_registered = threading.Event()
+
+
+def _parse_params(content_type: str, body: bytes) -> dict:
+    if content_type.startswith("application/json"):
+        return json.loads(body or b"{}")
+    if content_type.startswith("multipart/form-data"):
+        message = email.parser.BytesParser().parsebytes(
+            b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+        params = {}
+        for part in message.get_payload():
+            name = part.get_param("name", header="content-disposition")
+            params[name] = part.get_filename() or part.get_payload(decode=True).decode(errors="replace")
+        return params
+    return {key: values[0] for key, values in urllib.parse.parse_qs(body.decode()).items()}
+
+
+class FakeBotApi(BaseHTTPRequestHandler):
+    """
+    Answers `/bot<token>/<method>` calls with canned successful results.
+    """
+
+    def do_POST(self):
+        global _reply_count
+        method = self.path.rsplit("/", 1)[-1]
+        body = self.rfile.read(int(self.headers.get("content-length", 0)))
+        params = _parse_params(self.headers.get("content-type", ""), body)
+
+        if method == "getMe":
+            result = {"id": 1, "is_bot": True, "first_name": "VybeBot", "username": "fake_vybe_bot"}
+        elif method.startswith("send"):
+            chat_id = int(params.get("chat_id", 0))
+            result = {"message_id": next(_message_ids), "date": int(time.time()),
+                      "chat": {"id": chat_id, "type": "private"}, "text": params.get("text", "")}
+            content = params.get("text") or params.get("caption") or params.get("photo") or params.get("document")
+            print(f"\n<<< {method} to {chat_id}:\n{content}")
+            with _replies:
+                _reply_count += 1
+                _replies.notify_all()
+        else:
+            if method == "setWebhook":
+                _webhook.update(url=params.get("url"), secret=params.get("secret_token", ""))
+                _registered.set()
+            result = True
+
+        payload = json.dumps({"ok": True, "result": result}).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_update(update_id: int, chat_id: int, text: str) -> dict:
+    message = {
+        "message_id": update_id,
+        "date": int(time.time()),
+        "chat": {"id": chat_id, "type": "private"},
+        "from": {"id": chat_id, "is_bot": False, "first_name": "Tester"},
+        "text": text,
+    }
+    if text.startswith("/"):
+        message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}]
+    return {"update_id": update_id, "message": message}
+
+
+def post_update(webhook: str, secret: str, update: dict) -> int:
+    request = urllib.request.Request(webhook, data=json.dumps(update).encode(), method="POST",
+                                     headers={"content-type": "application/json",
+                                              "X-Telegram-Bot-Api-Secret-Token": secret})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("texts", nargs="*", help="messages to send, in order")
+    parser.add_argument("--webhook", help="the bot's webhook URL, default: the one it registers")
+    parser.add_argument("--secret", help="secret token to send, default: the one the bot registers")
+    parser.add_argument("--api-port", type=int, default=8081, help="port for the fake Bot API server")
+    parser.add_argument("--chat", type=int, default=1000, help="chat and user ID to send as")
+    parser.add_argument("--wait", type=float, default=30, help="seconds to wait for each reply")
+    parser.add_argument("--serve", action="store_true", help="keep the fake Bot API running afterwards")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.api_port), FakeBotApi)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Fake Bot API on http://127.0.0.1:{args.api_port}/bot")
+    if args.webhook is None or args.secret is None:
+        print("Waiting for the bot to register its webhook...")
+        _registered.wait()
+        print(f"Webhook registered at {_webhook['url']}")
+    webhook = args.webhook or _webhook["url"]
+    secret = _webhook["secret"] if args.secret is None else args.secret
+
+    for update_id, text in enumerate(args.texts, start=1):
+        with _replies:
+            seen = _reply_count
+        print(f"\n>>> {text}")
+        status = post_update(webhook, secret, make_update(update_id, args.chat, text))
+        if status != 200:
+            print(f"Webhook answered HTTP {status}")
+            continue
+        with _replies:
+            if not _replies.wait_for(lambda: _reply_count > seen, timeout=args.wait):
+                print(f"(no reply within {args.wait:.0f}s)")
+        time.sleep(0.5)
+
+    if args.serve:
+        print("\nServing the fake Bot API, Ctrl+C to stop.")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()